@@ -0,0 +1,60 @@
+"""
+Benchmark the time of ``import jheaps``.
+
+The backend is initialized lazily, thus importing the library should cost
+little more than loading the extension module. The benchmark runs the import
+in fresh interpreters and reports the median wall time, both for the import
+alone and for an import followed by an explicit ``jheaps.init()``.
+
+Use ``--max-ms`` in order to guard against regressions, e.g. in CI. The script
+exits with a non-zero status when the median import time, minus the startup
+time of the interpreter, exceeds the given limit.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+def _median_ms(code, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--runs", type=int, default=20, help="number of runs")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="fail if the import takes longer than this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    baseline = _median_ms("pass", args.runs)
+    import_only = _median_ms("import jheaps", args.runs) - baseline
+    with_init = _median_ms("import jheaps; jheaps.init()", args.runs) - baseline
+
+    print("interpreter startup:  %8.1f ms" % baseline)
+    print("import jheaps:        %8.1f ms" % import_only)
+    print("import and init:      %8.1f ms" % with_init)
+
+    if args.max_ms is not None and import_only > args.max_ms:
+        print(
+            "import time %.1f ms exceeds the limit of %.1f ms"
+            % (import_only, args.max_ms),
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
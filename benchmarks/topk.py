@@ -0,0 +1,51 @@
+"""
+Benchmark :py:class:`jheaps.TopK` against :py:func:`heapq.nlargest`.
+
+Both select the k largest keys of an array of random doubles. The array is
+pushed into the top-k heap using a single backend call, where keys which do
+not qualify are rejected natively.
+"""
+
+import argparse
+import heapq
+import random
+import time
+from array import array
+
+import jheaps
+
+
+def _best_ms(f, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        f()
+        elapsed = (time.perf_counter() - start) * 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--n", type=int, default=1000000, help="number of keys")
+    parser.add_argument("--k", type=int, default=100, help="number of kept keys")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    keys = array("d", (rng.random() for _ in range(args.n)))
+    jheaps.init()
+
+    def topk():
+        t = jheaps.TopK(args.k)
+        t.push_many(keys)
+        return t.result()
+
+    assert list(topk()[0]) == heapq.nlargest(args.k, keys)
+
+    print("heapq.nlargest: %8.1f ms" % _best_ms(lambda: heapq.nlargest(args.k, keys), args.runs))
+    print("jheaps.TopK:    %8.1f ms" % _best_ms(topk, args.runs))
+
+
+if __name__ == "__main__":
+    main()
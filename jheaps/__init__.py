@@ -12,13 +12,9 @@ from .__version__ import __version__, __backend_version__
 from .__version__ import __author__, __author_email__, __license__
 from .__version__ import __copyright__
 
-# Initialize with backend and setup module cleanup
-from . import backend
+# Setup module cleanup, the backend itself is initialized lazily on first use
 import atexit
 
-backend.jheaps_init()
-del backend
-
 
 def _module_cleanup_function():
     from . import backend
@@ -42,9 +38,23 @@ from ._internals._factories import (
     _HeapType,
     _create_and_wrap_heap,
     _create_and_wrap_dary_heap,
-    _create_and_wrap_radix_heap,
+    _create_and_wrap_soft_heap,
+    _heapify_and_wrap_heap,
+    _create_and_wrap_indexed_heap,
+    _wrap_key_function_heap,
 )
 
+from ._internals._selection import _soft_select, _percentile_rank
+from ._internals._topk import TopK, _select
+from ._internals._merge import _merge
+from ._internals._radix_heaps import _create_and_wrap_radix_heap_with_range
+from ._internals._isolates import _isolate, _configure, _configure_from_environment
+
+from ._internals._leaks import _tracker, _leak_report, _debug_leaks_from_environment
+
+_configure_from_environment()
+_debug_leaks_from_environment()
+
 
 def create_addressable_dary_heap(key_type=float, value_type=int, d=4, explicit=False):
     """Create an addressable d-ary heap.
@@ -76,19 +86,23 @@ def create_addressable_dary_heap(key_type=float, value_type=int, d=4, explicit=F
     )
 
 
-def create_implicit_dary_heap(key_type=float, d=4):
+def create_implicit_dary_heap(key_type=float, d=4, key=None):
     """Create an implicit (array-based) d-ary heap.
 
     :param key_type: the key type
     :type key_type: float, int or object
     :param d: the degree of the d-ary heap
     :type d: int
+    :param key: a function extracting a float or int priority from each inserted
+      object. If given, the heap accepts any objects, `key_type` is the type of
+      the priorities and all comparisons are performed natively.
+    :type key: callable or None
     :returns: the heap
     :rtype: :py:class:`.Heap`
     """
     heap_type = _HeapType.HEAP_TYPE_DARY_IMPLICIT
 
-    return _create_and_wrap_dary_heap(
+    heap = _create_and_wrap_dary_heap(
         heap_type,
         d,
         key_type,
@@ -98,13 +112,21 @@ def create_implicit_dary_heap(key_type=float, d=4):
         double_ended=False,
     )
 
-def create_implicit_weak_binary_heap(key_type=float, bulk_insert=False):
+    if key is not None:
+        return _wrap_key_function_heap(heap, key, key_type, double_ended=False)
+    return heap
+
+def create_implicit_weak_binary_heap(key_type=float, bulk_insert=False, key=None):
     """Create an implicit (array-based) weak binary heap.
 
     :param key_type: the key type
     :type key_type: float, int or object
     :param bulk_insert: whether to use the variant which supports bulk insertion
     :type bulk_insert: boolean
+    :param key: a function extracting a float or int priority from each inserted
+      object. If given, the heap accepts any objects, `key_type` is the type of
+      the priorities and all comparisons are performed natively.
+    :type key: callable or None
     :returns: the heap
     :rtype: :py:class:`.Heap`
     """
@@ -113,7 +135,7 @@ def create_implicit_weak_binary_heap(key_type=float, bulk_insert=False):
     else:
         heap_type = _HeapType.HEAP_TYPE_BINARY_IMPLICIT_WEAK
 
-    return _create_and_wrap_heap(
+    heap = _create_and_wrap_heap(
         heap_type,
         key_type,
         value_type=None,
@@ -122,18 +144,26 @@ def create_implicit_weak_binary_heap(key_type=float, bulk_insert=False):
         double_ended=False,
     )
 
+    if key is not None:
+        return _wrap_key_function_heap(heap, key, key_type, double_ended=False)
+    return heap
+
 
-def create_implicit_binary_heap(key_type=float):
+def create_implicit_binary_heap(key_type=float, key=None):
     """Create an implicit (array-based) binary heap.
 
     :param key_type: the key type
     :type key_type: float, int or object
+    :param key: a function extracting a float or int priority from each inserted
+      object. If given, the heap accepts any objects, `key_type` is the type of
+      the priorities and all comparisons are performed natively.
+    :type key: callable or None
     :returns: the heap
     :rtype: :py:class:`.Heap`
     """
     heap_type = _HeapType.HEAP_TYPE_BINARY_IMPLICIT
 
-    return _create_and_wrap_heap(
+    heap = _create_and_wrap_heap(
         heap_type,
         key_type,
         value_type=None,
@@ -142,18 +172,26 @@ def create_implicit_binary_heap(key_type=float):
         double_ended=False,
     )
 
+    if key is not None:
+        return _wrap_key_function_heap(heap, key, key_type, double_ended=False)
+    return heap
+
 
-def create_doublended_implicit_binary_heap(key_type=float): 
+def create_doublended_implicit_binary_heap(key_type=float, key=None):
     """Create an implicit (array-based) binary MinMax heap.
 
     :param key_type: the key type
     :type key_type: float, int or object
+    :param key: a function extracting a float or int priority from each inserted
+      object. If given, the heap accepts any objects, `key_type` is the type of
+      the priorities and all comparisons are performed natively.
+    :type key: callable or None
     :returns: the heap
     :rtype: :py:class:`.DoubleEndedHeap`
     """
     heap_type = _HeapType.HEAP_TYPE_DOUBLEENDED_BINARY_IMPLICIT_MINMAX
 
-    return _create_and_wrap_heap(
+    heap = _create_and_wrap_heap(
         heap_type,
         key_type,
         value_type=None,
@@ -162,6 +200,10 @@ def create_doublended_implicit_binary_heap(key_type=float):
         double_ended=True,
     )
 
+    if key is not None:
+        return _wrap_key_function_heap(heap, key, key_type, double_ended=True)
+    return heap
+
 
 def create_addressable_binary_heap(key_type=float, value_type=int, explicit=False):
     """Create an addressable binary heap.
@@ -369,11 +411,163 @@ def create_addressable_skew_heap(key_type=float, value_type=int):
     )
 
 
-def create_addressable_radix_heap(key_type=float, value_type=int, min=None, max=None):
+def create_soft_heap(key_type=float, value_type=int, error_rate=0.1):
+    """Create a soft heap. Soft heaps trade accuracy for speed. Inserting takes
+    amortized O(log 1/error_rate) time and deleting the minimum amortized constant
+    time. In exchange the heap may internally increase, or corrupt, the keys of at
+    most `error_rate` times the number of insertions. Thus deleting the minimum
+    may return an element whose key is not the minimum one. The keys reported by
+    handles are always the original keys.
+
+    Soft heaps support melding with other soft heaps of the same error rate but do
+    not support decreasing keys.
+
+    :param key_type: the key type
+    :type key_type: float, int or object
+    :param value_type: the value type
+    :type value_type: float, int or object
+    :param error_rate: the error rate, in (0, 1)
+    :type error_rate: float
+    :returns: the heap
+    :rtype: :py:class:`.AddressableHeap` and :py:class:`.MergeableHeap`
+    """
+    heap_type = _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_BINARY_EXPLICIT_SOFT
+
+    return _create_and_wrap_soft_heap(heap_type, error_rate, key_type, value_type)
+
+
+def approximate_kth_smallest(keys, k, error_rate=0.1, key_type=float):
+    """Approximately select the k-th smallest of a stream of keys using a soft
+    heap. The returned key is one of the given keys and its rank lies between
+    k and k plus `error_rate` times the number of keys. The keys are consumed in
+    chunks, or with a single backend call when given as a buffer such as an
+    `array.array` or a NumPy array.
+
+    :param keys: the keys
+    :param k: the rank, starting from one
+    :type k: int
+    :param error_rate: the error rate of the soft heap, in (0, 1)
+    :type error_rate: float
+    :param key_type: the key type
+    :type key_type: float or int
+    :returns: a key whose rank is approximately k
+    :raises IndexError: if k is not between one and the number of keys
+    """
+    return _soft_select(keys, k, error_rate, key_type)
+
+
+def approximate_percentile(keys, percentile, error_rate=0.1, key_type=float):
+    """Approximately compute a percentile of a stream of keys using a soft heap.
+    The returned key is one of the given keys and its rank lies between the rank
+    of the percentile and that rank plus `error_rate` times the number of keys.
+
+    .. code-block:: python
+
+        latencies = array.array("d", samples)
+        p99 = jheaps.approximate_percentile(latencies, 99, error_rate=0.001)
+
+    :param keys: the keys
+    :param percentile: the percentile, between 0 and 100
+    :type percentile: float
+    :param error_rate: the error rate of the soft heap, in (0, 1)
+    :type error_rate: float
+    :param key_type: the key type
+    :type key_type: float or int
+    :returns: a key close to the percentile
+    """
+    return _soft_select(keys, _percentile_rank(percentile), error_rate, key_type)
+
+
+def nsmallest(k, keys):
+    """Return the k smallest keys in ascending order. The selection runs
+    inside the backend using a bounded d-ary heap, see :py:class:`.TopK`.
+
+    :param k: the number of keys
+    :type k: int
+    :param keys: the keys. Contiguous buffers of 64-bit elements (numpy arrays,
+      array.array) are used without copying. Other iterables are copied, as
+      int keys if all of them are int and as float keys otherwise.
+    :returns: the keys
+    :rtype: array.array of doubles or long integers
+    """
+    return _select(k, keys, largest=False)[0]
+
+
+def nlargest(k, keys):
+    """Return the k largest keys in descending order. The selection runs
+    inside the backend using a bounded d-ary heap, see :py:class:`.TopK`.
+
+    :param k: the number of keys
+    :type k: int
+    :param keys: the keys. Contiguous buffers of 64-bit elements (numpy arrays,
+      array.array) are used without copying. Other iterables are copied, as
+      int keys if all of them are int and as float keys otherwise.
+    :returns: the keys
+    :rtype: array.array of doubles or long integers
+    """
+    return _select(k, keys, largest=True)[0]
+
+
+def argsmallest(k, keys):
+    """Return the positions of the k smallest keys, in ascending order of
+    their keys. Equal keys are ordered by their positions, as in a stable
+    sort. The selection runs inside the backend using a bounded d-ary heap,
+    see :py:class:`.TopK`.
+
+    :param k: the number of keys
+    :type k: int
+    :param keys: the keys. Contiguous buffers of 64-bit elements (numpy arrays,
+      array.array) are used without copying. Other iterables are copied, as
+      int keys if all of them are int and as float keys otherwise.
+    :returns: the positions
+    :rtype: array.array of long integers
+    """
+    return _select(k, keys, largest=False)[1]
+
+
+def merge(*iterables, key=None, chunk=4096, key_type=None):
+    """Merge sorted iterables into a single sorted stream, like
+    :py:func:`heapq.merge`. The merge uses a d-ary heap of the backend whose
+    keys are pairs of a priority and the index of an input, thus equal
+    priorities are output in the order of the inputs, and inputs are pulled
+    lazily in chunks. At most `chunk` elements of each input are kept in
+    memory.
+
+    The merged elements are yielded in batches. If `key` is None and all
+    inputs are contiguous buffers of 64-bit floats or integers (numpy arrays,
+    array.array), the inputs are read in zero-copy slices and each batch is an
+    array of the same kind, a numpy array if all inputs are numpy arrays and an
+    array.array otherwise. Otherwise each batch is a list of elements.
+
+    :param iterables: the sorted inputs
+    :param key: a function extracting a float or int priority from each
+      element. If None the elements are the priorities.
+    :type key: callable or None
+    :param chunk: the number of elements pulled from an input at a time, and
+      the maximum size of a batch
+    :type chunk: int
+    :param key_type: the type of the priorities. If None it is inferred from
+      the first chunk of each input, as int if all priorities are int and as
+      float otherwise.
+    :type key_type: float, int or None
+    :returns: a generator of batches
+    """
+    return _merge(iterables, key, key_type, chunk)
+
+
+def create_addressable_radix_heap(
+    key_type=float, value_type=int, min=None, max=None, infer_min=False
+):
     """Create an addressable radix heap. Radix heaps are monotone heaps
     stored using buckets. The key type can only be float or int. The number of
     buckets depends on the difference between the min and max values provided.
 
+    Int keys may use the whole range of 64-bit integers, as long as the
+    difference between the min and max values fits in 63 bits. If the min value
+    is negative and no max value is given, the max value is the largest key
+    within that difference. The max value is never inferred from the first
+    insertion, since later keys of a monotone sequence may exceed it.
+
     :param key_type: the key type
     :type key_type: float or int
     :param value_type: the value type
@@ -382,82 +576,249 @@ def create_addressable_radix_heap(key_type=float, value_type=int, min=None, max=
     :type min: float or int depending on key_type
     :param max: maximum key value
     :type max: float or int depending on key_type
+    :param infer_min: if True the minimum key value is the key of the first
+      insertion, and the min value must not be given
+    :type infer_min: boolean
     :returns: the heap
     :rtype: :py:class:`.AddressableHeap`
     """
-    if key_type == float:
-        heap_type = _HeapType.HEAP_TYPE_MONOTONE_ADDRESSABLE_DOUBLE_RADIX
-    elif key_type == int:
-        heap_type = _HeapType.HEAP_TYPE_MONOTONE_ADDRESSABLE_LONG_RADIX
-    else:
-        raise ValueError("Radix heaps support float or int keys")
-
-    if min is None:
-        min = key_type()
-    if not isinstance(min, key_type):
-        raise TypeError("Min value not valid")
-
-    if max is None:
-        if key_type == float:
-            max = float("0x1.fffffffffffffP+1023")
-        elif key_type == int:
-            max = int("0x7fffffff")
-    if not isinstance(max, key_type):
-        raise TypeError("Max value not valid")
-
-    return _create_and_wrap_radix_heap(
-        heap_type,
-        min,
-        max,
-        key_type,
-        value_type,
-        addressable=True,
-        mergeable=False,
-        double_ended=False,
+    return _create_and_wrap_radix_heap_with_range(
+        key_type, value_type, min, max, infer_min, addressable=True
     )
 
 
-def create_radix_heap(key_type=float, min=None, max=None):
+def create_radix_heap(key_type=float, min=None, max=None, key=None, infer_min=False):
     """Create a radix heap. Radix heaps are monotone heaps
     stored using buckets. The key type can only be float or int. The number of
     buckets depends on the difference between the min and max values provided.
 
+    Int keys may use the whole range of 64-bit integers, as long as the
+    difference between the min and max values fits in 63 bits. If the min value
+    is negative and no max value is given, the max value is the largest key
+    within that difference. The max value is never inferred from the first
+    insertion, since later keys of a monotone sequence may exceed it.
+
     :param key_type: the key type
     :type key_type: float or int
-    :param value_type: the value type
-    :type value_type: float, int or object
     :param min: minimum key value
     :type min: float or int depending on key_type
     :param max: maximum key value
     :type max: float or int depending on key_type
+    :param key: a function extracting a float or int priority from each inserted
+      object. If given, the heap accepts any objects, `key_type` is the type of
+      the priorities and all comparisons are performed natively.
+    :type key: callable or None
+    :param infer_min: if True the minimum key value is the key of the first
+      insertion, or the smallest key of the first bulk insertion, and the min
+      value must not be given
+    :type infer_min: boolean
     :returns: the heap
     :rtype: :py:class:`.Heap`
     """
-    if key_type == float:
-        heap_type = _HeapType.HEAP_TYPE_MONOTONE_DOUBLE_RADIX
-    elif key_type == int:
-        heap_type = _HeapType.HEAP_TYPE_MONOTONE_LONG_RADIX
-
-    if min is None:
-        min = key_type()
-    if not isinstance(min, key_type):
-        raise TypeError("Min value not valid")
-
-    if max is None:
-        if key_type == float:
-            max = float("0x1.fffffffffffffP+1023")
-        elif key_type == int:
-            max = int("0x7fffffff")
-    if not isinstance(max, key_type):
-        raise TypeError("Max value not valid")
-
-    return _create_and_wrap_radix_heap(
-        heap_type,
-        min,
-        max,
-        key_type,
-        value_type=None,
-        addressable=False,
-        mergeable=False,
-        double_ended=False,
+    heap = _create_and_wrap_radix_heap_with_range(
+        key_type, None, min, max, infer_min, addressable=False
     )
+
+    if key is not None:
+        return _wrap_key_function_heap(heap, key, key_type, double_ended=False)
+    return heap
+
+
+def heapify(
+    keys, values=None, heap_type=_HeapType.HEAP_TYPE_BINARY_IMPLICIT, key_type=float, d=4
+):
+    """Create a heap from a collection of keys in linear time. The whole
+    collection is handed to the backend in a single call, which is much faster
+    than inserting the keys one by one.
+
+    Only array-based heaps support heapify. These are the heap types
+    `HEAP_TYPE_BINARY_IMPLICIT`, `HEAP_TYPE_BINARY_IMPLICIT_WEAK`,
+    `HEAP_TYPE_BINARY_IMPLICIT_WEAK_BULKINSERT`, `HEAP_TYPE_DARY_IMPLICIT`,
+    `HEAP_TYPE_DOUBLEENDED_BINARY_IMPLICIT_MINMAX` and the addressable
+    `HEAP_TYPE_ADDRESSABLE_BINARY_IMPLICIT` and `HEAP_TYPE_ADDRESSABLE_DARY_IMPLICIT`.
+
+    :param keys: the keys. For `float` and `int` keys any contiguous buffer of
+      64-bit elements (numpy arrays, array.array) is used without copying.
+    :param values: the values, only for addressable heaps. If None all values are zero.
+    :type values: iterable of int or None
+    :param heap_type: the type of heap to create
+    :type heap_type: :py:class:`jheaps.types.HeapType`
+    :param key_type: the key type
+    :type key_type: float, int or object
+    :param d: the degree, only for d-ary heaps
+    :type d: int
+    :returns: the heap
+    :rtype: :py:class:`.Heap`, :py:class:`.DoubleEndedHeap` or :py:class:`.AddressableHeap`
+    """
+    return _heapify_and_wrap_heap(heap_type, keys, values, key_type, d)
+
+
+def create_indexed_heap(
+    n, key_type=float, heap_type=_HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_PAIRING, d=4
+):
+    """Create an indexed heap. Elements are identified by integer ids in the
+    range [0, n), such as the vertices of a graph. The table from ids to heap
+    nodes is kept by the backend and therefore no handle objects are created.
+
+    Any addressable heap type except for soft and radix heaps can be used
+    as the underlying heap.
+
+    :param n: the number of ids
+    :type n: int
+    :param key_type: the key type
+    :type key_type: float or int
+    :param heap_type: the type of the underlying addressable heap
+    :type heap_type: :py:class:`jheaps.types.HeapType`
+    :param d: the degree, only for d-ary heaps
+    :type d: int
+    :returns: the heap
+    :rtype: :py:class:`.IndexedHeap`
+    """
+    return _create_and_wrap_indexed_heap(heap_type, n, key_type, d)
+
+
+def configure(
+    max_heap_size=None,
+    min_heap_size=None,
+    young_gen_size=None,
+    reserved_address_space_size=None,
+    options=None,
+):
+    """Configure the isolates of the backend. The parameters are read when an
+    isolate is created, thus they must be set before the first heap is created
+    or :py:func:`jheaps.init` is called. Each isolate of the pool gets the same
+    parameters. Sizing the isolates for the expected number of elements avoids
+    frequent garbage collections with very large heaps.
+
+    Sizes are given in bytes, either as integers or as strings with a `k`, `m`,
+    `g` or `t` suffix such as `"8g"`. Parameters which are None are left
+    unchanged. The initial values are read from the environment variables
+    `JHEAPS_MAX_HEAP_SIZE`, `JHEAPS_MIN_HEAP_SIZE`, `JHEAPS_YOUNG_GEN_SIZE`,
+    `JHEAPS_RESERVED_ADDRESS_SPACE_SIZE` and `JHEAPS_ISOLATE_OPTIONS`, the
+    latter holding whitespace separated options. Invalid values of these
+    variables are logged as warnings to the `jheaps` logger and ignored.
+
+    If the backend rejects the parameters when the default isolate is created,
+    e.g. an unknown option or a maximum heap size larger than the reserved
+    address space, the operation which initializes the backend raises a
+    `RuntimeError`. The parameters are then reset, thus the next operation
+    creates the isolate using the defaults unless the backend is configured again.
+
+    .. code-block:: python
+
+        import jheaps
+
+        jheaps.configure(max_heap_size="16g", young_gen_size="1g")
+
+    :param max_heap_size: the maximum heap size of an isolate
+    :param min_heap_size: the minimum heap size of an isolate
+    :param young_gen_size: the size of the young generation of an isolate
+    :param reserved_address_space_size: the address space reserved by an
+      isolate, which must be large enough for the maximum heap size
+    :param options: additional runtime options of the backend, e.g.
+      `["-XX:+PrintGC"]`
+    :type options: list of str
+    :raises ValueError: if the backend is already initialized, a parameter
+      is invalid, the min heap size is larger than the max heap size or the backend was built against a GraalVM whose isolates
+      do not accept runtime options, which are needed by all parameters but
+      the reserved address space size
+    """
+    _configure(
+        max_heap_size=max_heap_size,
+        min_heap_size=min_heap_size,
+        young_gen_size=young_gen_size,
+        reserved_address_space_size=reserved_address_space_size,
+        options=options,
+    )
+
+
+def init():
+    """Initialize the backend. This happens automatically when the first heap
+    is created, thus importing the library does not pay for starting the
+    backend. Calling this function explicitly moves the startup cost to a
+    convenient point, e.g. in order to warm up a service before it accepts
+    requests. Calling it more than once has no effect.
+
+    :raises RuntimeError: if the backend rejects the parameters of the isolates
+    """
+    from . import backend
+
+    backend.jheaps_init()
+
+
+def isolate(index):
+    """Select an isolate of the backend in the current thread. Returns a context
+    manager and all heaps created inside the context live in the selected isolate.
+    Each isolate has its own memory and garbage collector, thus independent
+    workloads running on separate threads do not contend on allocation or on
+    garbage collection pauses.
+
+    The isolates form a pool which grows on demand. Index zero is the default
+    isolate which is used outside of any context.
+
+    Heaps must only be used while their isolate is selected. Melding heaps of
+    different isolates raises a `ValueError`. Handles may be garbage collected
+    anywhere, as their cleanup always runs in their own isolate.
+
+    .. code-block:: python
+
+        with jheaps.isolate(1):
+            heap = jheaps.create_implicit_binary_heap()
+            heap.insert(1.0)
+
+    :param index: the index of the isolate
+    :type index: int
+    :returns: a context manager
+    """
+    return _isolate(index)
+
+
+def detach_thread():
+    """Detach the current thread from all isolates of the backend. Threads are
+    attached lazily on their first use of a heap and automatically detached
+    when they exit. Detaching explicitly is only useful for long-lived threads
+    which stop using heaps. Using a heap afterwards attaches the thread again.
+    """
+    from . import backend
+
+    backend.jheaps_thread_detach()
+
+
+def thread_metrics():
+    """Get metrics about the threads attached to the isolates of the backend.
+
+    :returns: a dictionary with the number of currently attached isolate threads
+      under `attached` and the total number of detached ones under `detached`
+    :rtype: dict
+    """
+    from . import backend
+
+    attached, detached = backend.jheaps_thread_metrics()
+    return {"attached": attached, "detached": detached}
+
+
+def debug_leaks(enabled=True):
+    """Enable or disable leak debugging. Heaps with object keys or values own
+    a reference to each of their keys and values, which they release when they
+    are cleared or garbage collected. While leak debugging is enabled, every
+    such heap which gets created is tracked together with the stack where it
+    was created. Heaps which still own references at exit are logged as
+    warnings to the `jheaps` logger. Leak debugging is also enabled by setting
+    the environment variable `JHEAPS_DEBUG_LEAKS` to `1`.
+
+    :param enabled: whether to track heaps created from now on
+    :type enabled: bool
+    """
+    _tracker.enable(enabled)
+
+
+def leak_report():
+    """Report the tracked heaps which still own references. Garbage is collected
+    first, thus only heaps which are still alive are reported.
+
+    :returns: a list with one dictionary per heap, holding the representation of
+      the heap under `heap`, the number of owned references under `references`
+      and the stack where the heap was created under `traceback`
+    :rtype: list
+    """
+    return _leak_report()
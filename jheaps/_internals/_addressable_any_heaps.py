@@ -6,60 +6,91 @@ from ..types import (
     DoubleEndedAddressableHeapHandle,
     DoubleEndedAddressableHeap,
 )
-from ._wrappers import _HandleWrapper
+from ._wrappers import (
+    _HandleWrapper,
+    _handle_ids,
+)
+from ._leaks import _track_references
 
 from ._utils import (
     _inc_ref,
-    _inc_ref_by_id,
-    _dec_ref,
     _dec_ref_by_id,
-    _id_to_obj,
-    _id_comparator,
+    _as_double_array,
+    _as_long_array,
+    _zeros_long_array,
+)
+
+from ._addressable_heaps import (
+    _BaseLongValueAddressableHeapHandle,
+    _update_keys_many,
 )
 
-from ._addressable_heaps import _BaseLongValueAddressableHeapHandle
+from array import array
+
+
+def _update_object_keys_many(heap, backend_update_many, handles, keys):
+    """Change the keys of many elements of a heap with object keys using a
+    single backend call. The heap releases the old keys and owns the new ones.
+    """
+    ids = _handle_ids(handles, heap)
+    keys = list(keys)
+    if len(keys) != len(ids):
+        raise ValueError("Handles and keys must have the same length")
+
+    old_key_ids = _zeros_long_array(len(ids))
+    backend.jheaps_AHeapHandle_L_get_key_many(ids, old_key_ids, len(ids))
+    new_key_ids = array("q", [id(k) for k in keys])
+
+    for k in keys:
+        _inc_ref(k)
+    try:
+        backend_update_many(ids, new_key_ids, len(ids))
+    finally:
+        # the backend stops at the first failure, so check which
+        # elements actually got their new key
+        cur_key_ids = _zeros_long_array(len(ids))
+        backend.jheaps_AHeapHandle_L_get_key_many(ids, cur_key_ids, len(ids))
+        for old_key_id, new_key_id, cur_key_id in zip(
+            old_key_ids, new_key_ids, cur_key_ids
+        ):
+            if cur_key_id == new_key_id:
+                _dec_ref_by_id(old_key_id)
+            else:
+                _dec_ref_by_id(new_key_id)
 
 
 class _BaseAnyValueAddressableHeapHandle(_HandleWrapper, AddressableHeapHandle):
     """A handle on an element in a heap. This handle supports any object as value."""
 
-    def __init__(self, handle, key_owner=False, value_owner=False, **kwargs):
+    def __init__(self, handle, key_owner=False, value_owner=False, heap=None, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._key_owner = key_owner
         self._value_owner = value_owner
+        # Keep the heap alive while its element is referenced, since the
+        # heap releases the references it owns when garbage collected
+        self._heap = heap
 
     @property
     def value(self):
-        value_id = backend.jheaps_AHeapHandle_get_value(self._handle)
-        return _id_to_obj(value_id)
+        return backend.jheaps_AHeapHandle_O_get_value(self._handle)
 
     @value.setter
     def value(self, v):
         if v is None:
             raise ValueError("Value cannot be None")
 
-        # Decrement value ref-count independently on whether the
-        # handle or the heap is the owner
-        self._dec_value_ref()
-
-        backend.jheaps_AHeapHandle_set_value(self._handle, id(v))
-
-        # Increment value ref-count independently on whether the
-        # handle or the heap is the owner
-        _inc_ref(v)
-
-    def __del__(self):
-        if self._value_owner:
-            self._dec_value_ref()
-        super().__del__()
+        # The reference moves from the old to the new value independently
+        # on whether the handle or the heap is the owner
+        backend.jheaps_AHeapHandle_O_set_value(self._handle, v)
 
-    def _dec_value_ref(self):
-        """Decrement reference count on value."""
-        value_id = backend.jheaps_AHeapHandle_get_value(self._handle)
-        _dec_ref(_id_to_obj(value_id))
+    def _destroy(self):
+        # Release owned references together with the handle
+        backend.jheaps_AHeapHandle_O_destroy(
+            self._handle, self._key_owner, self._value_owner
+        )
 
     def __repr__(self):
-        return "_BaseAnyValueAddressableHeapHandle(%r)" % self._handle
+        return "_BaseAnyValueAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleAnyAddressableHeapHandle(_BaseAnyValueAddressableHeapHandle):
@@ -78,12 +109,13 @@ class _DoubleAnyAddressableHeapHandle(_BaseAnyValueAddressableHeapHandle):
         backend.jheaps_AHeapHandle_delete(self._handle)
         # Take ownership due to deletion from the heap
         self._value_owner = True
+        self._heap = None
 
     def decrease_key(self, key):
         backend.jheaps_AHeapHandle_D_decrease_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleAnyAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleAnyAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleEndedDoubleAnyAddressableHeapHandle(
@@ -100,7 +132,7 @@ class _DoubleEndedDoubleAnyAddressableHeapHandle(
         backend.jheaps_DEAHeapHandle_D_increase_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleEndedDoubleAnyAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleEndedDoubleAnyAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _LongAnyAddressableHeapHandle(_BaseAnyValueAddressableHeapHandle):
@@ -119,12 +151,13 @@ class _LongAnyAddressableHeapHandle(_BaseAnyValueAddressableHeapHandle):
         backend.jheaps_AHeapHandle_delete(self._handle)
         # Take ownership due to deletion from the heap
         self._value_owner = True
+        self._heap = None
 
     def decrease_key(self, key):
         backend.jheaps_AHeapHandle_L_decrease_key(self._handle, key)
 
     def __repr__(self):
-        return "_LongAnyAddressableHeapHandle(%r)" % self._handle
+        return "_LongAnyAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleEndedLongAnyAddressableHeapHandle(
@@ -141,7 +174,7 @@ class _DoubleEndedLongAnyAddressableHeapHandle(
         backend.jheaps_DEAHeapHandle_L_increase_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleEndedLongAnyAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleEndedLongAnyAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _AnyLongAddressableHeapHandle(_BaseLongValueAddressableHeapHandle):
@@ -149,42 +182,34 @@ class _AnyLongAddressableHeapHandle(_BaseLongValueAddressableHeapHandle):
     and long value.
     """
 
-    def __init__(self, handle, key_owner=False, **kwargs):
+    def __init__(self, handle, key_owner=False, heap=None, **kwargs):
         super().__init__(handle, **kwargs)
         self._key_owner = key_owner
+        # Keep the heap alive while its element is referenced, since the
+        # heap releases the references it owns when garbage collected
+        self._heap = heap
 
     @property
     def key(self):
-        key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        return _id_to_obj(key_id)
+        return backend.jheaps_AHeapHandle_O_get_key(self._handle)
 
     def delete(self):
         backend.jheaps_AHeapHandle_delete(self._handle)
         # Take ownership due to deletion from the heap
         self._key_owner = True
+        self._heap = None
 
     def decrease_key(self, key):
-        old_key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        backend.jheaps_AHeapHandle_L_decrease_key(self._handle, id(key))
-
         if self._key_owner:
             raise ValueError("Cannot be key owner to a valid handle")
+        backend.jheaps_AHeapHandle_O_decrease_key(self._handle, key)
 
-        _dec_ref_by_id(old_key_id)
-        _inc_ref(key)
-
-    def __del__(self):
-        if self._key_owner:
-            self._dec_key_ref()
-        super().__del__()
-
-    def _dec_key_ref(self):
-        """Decrement reference count on key."""
-        key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        _dec_ref(_id_to_obj(key_id))
+    def _destroy(self):
+        # Release an owned key together with the handle
+        backend.jheaps_AHeapHandle_O_destroy(self._handle, self._key_owner, False)
 
     def __repr__(self):
-        return "_AnyLongAddressableHeapHandle(%r)" % self._handle
+        return "_AnyLongAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleEndedAnyLongAddressableHeapHandle(
@@ -198,17 +223,12 @@ class _DoubleEndedAnyLongAddressableHeapHandle(
         super().__init__(handle, key_owner, **kwargs)
 
     def increase_key(self, key):
-        old_key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        backend.jheaps_DEAHeapHandle_L_increase_key(self._handle, id(key))
-
         if self._key_owner:
             raise ValueError("Cannot be key owner to a valid handle")
-
-        _dec_ref_by_id(old_key_id)
-        _inc_ref(key)
+        backend.jheaps_DEAHeapHandle_O_increase_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleEndedAnyLongAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleEndedAnyLongAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _AnyAnyAddressableHeapHandle(_BaseAnyValueAddressableHeapHandle):
@@ -221,37 +241,22 @@ class _AnyAnyAddressableHeapHandle(_BaseAnyValueAddressableHeapHandle):
 
     @property
     def key(self):
-        key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        return _id_to_obj(key_id)
+        return backend.jheaps_AHeapHandle_O_get_key(self._handle)
 
     def delete(self):
         backend.jheaps_AHeapHandle_delete(self._handle)
         # Take ownership due to deletion from the heap
         self._key_owner = True
         self._value_owner = True
+        self._heap = None
 
     def decrease_key(self, key):
-        old_key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        backend.jheaps_AHeapHandle_L_decrease_key(self._handle, id(key))
-
         if self._key_owner:
             raise ValueError("Cannot be key owner to a valid handle")
-
-        _dec_ref_by_id(old_key_id)
-        _inc_ref(key)
-
-    def __del__(self):
-        if self._key_owner:
-            self._dec_key_ref()
-        super().__del__()
-
-    def _dec_key_ref(self):
-        """Decrement reference count on key."""
-        key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        _dec_ref(_id_to_obj(key_id))
+        backend.jheaps_AHeapHandle_O_decrease_key(self._handle, key)
 
     def __repr__(self):
-        return "_AnyAnyAddressableHeapHandle(%r)" % self._handle
+        return "_AnyAnyAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleEndedAnyAnyAddressableHeapHandle(_AnyAnyAddressableHeapHandle):
@@ -263,17 +268,12 @@ class _DoubleEndedAnyAnyAddressableHeapHandle(_AnyAnyAddressableHeapHandle):
         super().__init__(handle, key_owner, value_owner, **kwargs)
 
     def increase_key(self, key):
-        old_key_id = backend.jheaps_AHeapHandle_L_get_key(self._handle)
-        backend.jheaps_DEAHeapHandle_L_increase_key(self._handle, id(key))
-
         if self._key_owner:
             raise ValueError("Cannot be key owner to a valid handle")
-
-        _dec_ref_by_id(old_key_id)
-        _inc_ref(key)
+        backend.jheaps_DEAHeapHandle_O_increase_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleEndedAnyAnyAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleEndedAnyAnyAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _BaseAnyAddressableHeap(_HandleWrapper, AddressableHeap):
@@ -281,8 +281,12 @@ class _BaseAnyAddressableHeap(_HandleWrapper, AddressableHeap):
     to the backend.
     """
 
+    # Number of references owned for each element in the heap
+    _references_per_element = 1
+
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
+        _track_references(self)
 
     def __len__(self):
         return backend.jheaps_AHeap_size(self._handle)
@@ -290,8 +294,16 @@ class _BaseAnyAddressableHeap(_HandleWrapper, AddressableHeap):
     def is_empty(self):
         return backend.jheaps_AHeap_isempty(self._handle)
 
+    def _destroy(self):
+        # Release the references owned by the heap
+        self.clear()
+        super()._destroy()
+
+    def _owned_references(self):
+        return len(self) * self._references_per_element
+
     def __repr__(self):
-        return "_BaseAnyAddressableHeap(%r)" % self._handle
+        return "_BaseAnyAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleAnyAddressableHeap(_BaseAnyAddressableHeap):
@@ -305,13 +317,23 @@ class _DoubleAnyAddressableHeap(_BaseAnyAddressableHeap):
     def insert(self, key, value):
         if value is None:
             raise ValueError("Value cannot be None")
-        _inc_ref(value)
-        res = backend.jheaps_AHeap_D_insert_key_value(self._handle, key, id(value))
-        return _DoubleAnyAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_DO_insert_key_value(self._handle, key, value)
+        return _DoubleAnyAddressableHeapHandle(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_D_decrease_key_many, handles, keys, _as_double_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleAnyAddressableHeapHandle(res)
+        return _DoubleAnyAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -319,15 +341,11 @@ class _DoubleAnyAddressableHeap(_BaseAnyAddressableHeap):
         return _DoubleAnyAddressableHeapHandle(res, value_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            value_id = backend.jheaps_AHeapHandle_get_value(res)
-            _dec_ref_by_id(value_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, False, True)
 
     def __repr__(self):
-        return "_DoubleAnyAddressableHeap(%r)" % self._handle
+        return "_DoubleAnyAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedDoubleAnyAddressableHeap(
@@ -341,13 +359,34 @@ class _DoubleEndedDoubleAnyAddressableHeap(
     def insert(self, key, value):
         if value is None:
             raise ValueError("Value cannot be None")
-        _inc_ref(value)
-        res = backend.jheaps_AHeap_D_insert_key_value(self._handle, key, id(value))
-        return _DoubleEndedDoubleAnyAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_DO_insert_key_value(self._handle, key, value)
+        return _DoubleEndedDoubleAnyAddressableHeapHandle(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_D_decrease_key_many, handles, keys, _as_double_array
+        )
+
+    def increase_key_many(self, handles, keys):
+        """Increase the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_DEAHeapHandle_D_increase_key_many, handles, keys, _as_double_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleEndedDoubleAnyAddressableHeapHandle(res)
+        return _DoubleEndedDoubleAnyAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -356,7 +395,7 @@ class _DoubleEndedDoubleAnyAddressableHeap(
 
     def find_max(self):
         res = backend.jheaps_DEAHeap_find_max(self._handle)
-        return _DoubleEndedDoubleAnyAddressableHeapHandle(res)
+        return _DoubleEndedDoubleAnyAddressableHeapHandle(res, heap=self)
 
     def delete_max(self):
         res = backend.jheaps_DEAHeap_delete_max(self._handle)
@@ -364,15 +403,11 @@ class _DoubleEndedDoubleAnyAddressableHeap(
         return _DoubleEndedDoubleAnyAddressableHeapHandle(res, value_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            value_id = backend.jheaps_AHeapHandle_get_value(res)
-            _dec_ref_by_id(value_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, False, True)
 
     def __repr__(self):
-        return "_DoubleEndedDoubleAnyAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedDoubleAnyAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleAnyMergeableAddressableHeap(_DoubleAnyAddressableHeap, MergeableHeap):
@@ -382,10 +417,14 @@ class _DoubleAnyMergeableAddressableHeap(_DoubleAnyAddressableHeap, MergeableHea
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MAHeap_D_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleAnyMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleAnyMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedDoubleAnyMergeableAddressableHeap(_DoubleEndedDoubleAnyAddressableHeap, MergeableHeap):
@@ -395,10 +434,14 @@ class _DoubleEndedDoubleAnyMergeableAddressableHeap(_DoubleEndedDoubleAnyAddress
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MDEAHeap_D_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleEndedDoubleAnyMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedDoubleAnyMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _LongAnyAddressableHeap(_BaseAnyAddressableHeap):
@@ -406,35 +449,43 @@ class _LongAnyAddressableHeap(_BaseAnyAddressableHeap):
     to the backend.
     """
 
+    _handle_class = _LongAnyAddressableHeapHandle
+
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
 
     def insert(self, key, value):
         if value is None:
             raise ValueError("Value cannot be None")
-        _inc_ref(value)
-        res = backend.jheaps_AHeap_L_insert_key_value(self._handle, key, id(value))
-        return _LongAnyAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_LO_insert_key_value(self._handle, key, value)
+        return self._handle_class(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys, _as_long_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _LongAnyAddressableHeapHandle(res)
+        return self._handle_class(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
         # pass value ownership to handle
-        return _LongAnyAddressableHeapHandle(res, value_owner=True)
+        return self._handle_class(res, value_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            value_id = backend.jheaps_AHeapHandle_get_value(res)
-            _dec_ref_by_id(value_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, False, True)
 
     def __repr__(self):
-        return "_LongAnyAddressableHeap(%r)" % self._handle
+        return "_LongAnyAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedLongAnyAddressableHeap(
@@ -448,13 +499,34 @@ class _DoubleEndedLongAnyAddressableHeap(
     def insert(self, key, value):
         if value is None:
             raise ValueError("Value cannot be None")
-        _inc_ref(value)
-        res = backend.jheaps_AHeap_L_insert_key_value(self._handle, key, id(value))
-        return _DoubleEndedLongAnyAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_LO_insert_key_value(self._handle, key, value)
+        return _DoubleEndedLongAnyAddressableHeapHandle(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys, _as_long_array
+        )
+
+    def increase_key_many(self, handles, keys):
+        """Increase the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_DEAHeapHandle_L_increase_key_many, handles, keys, _as_long_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleEndedLongAnyAddressableHeapHandle(res)
+        return _DoubleEndedLongAnyAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -463,7 +535,7 @@ class _DoubleEndedLongAnyAddressableHeap(
 
     def find_max(self):
         res = backend.jheaps_DEAHeap_find_max(self._handle)
-        return _DoubleEndedLongAnyAddressableHeapHandle(res)
+        return _DoubleEndedLongAnyAddressableHeapHandle(res, heap=self)
 
     def delete_max(self):
         res = backend.jheaps_DEAHeap_delete_max(self._handle)
@@ -471,15 +543,11 @@ class _DoubleEndedLongAnyAddressableHeap(
         return _DoubleEndedLongAnyAddressableHeapHandle(res, value_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            value_id = backend.jheaps_AHeapHandle_get_value(res)
-            _dec_ref_by_id(value_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, False, True)
 
     def __repr__(self):
-        return "_DoubleEndedLongAnyAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedLongAnyAddressableHeap(%r)" % self._backend_handle
 
 
 class _LongAnyMergeableAddressableHeap(_LongAnyAddressableHeap, MergeableHeap):
@@ -489,10 +557,14 @@ class _LongAnyMergeableAddressableHeap(_LongAnyAddressableHeap, MergeableHeap):
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_LongAnyMergeableAddressableHeap(%r)" % self._handle
+        return "_LongAnyMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedLongAnyMergeableAddressableHeap(_DoubleEndedLongAnyAddressableHeap, MergeableHeap):
@@ -502,10 +574,14 @@ class _DoubleEndedLongAnyMergeableAddressableHeap(_DoubleEndedLongAnyAddressable
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MDEAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleEndedLongAnyMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedLongAnyMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _AnyLongAddressableHeap(_BaseAnyAddressableHeap):
@@ -520,13 +596,23 @@ class _AnyLongAddressableHeap(_BaseAnyAddressableHeap):
     def insert(self, key, value=None):
         if value is None:
             value = int()
-        _inc_ref(key)
-        res = backend.jheaps_AHeap_L_insert_key_value(self._handle, id(key), value)
-        return _AnyLongAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_OL_insert_key_value(self._handle, key, value)
+        return _AnyLongAddressableHeapHandle(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_object_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _AnyLongAddressableHeapHandle(res)
+        return _AnyLongAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -534,15 +620,11 @@ class _AnyLongAddressableHeap(_BaseAnyAddressableHeap):
         return _AnyLongAddressableHeapHandle(res, key_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            key_id = backend.jheaps_AHeapHandle_L_get_key(res)
-            _dec_ref_by_id(key_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, True, False)
 
     def __repr__(self):
-        return "_AnyLongAddressableHeap(%r)" % self._handle
+        return "_AnyLongAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedAnyLongAddressableHeap(
@@ -558,13 +640,34 @@ class _DoubleEndedAnyLongAddressableHeap(
     def insert(self, key, value=None):
         if value is None:
             value = int()
-        _inc_ref(key)
-        res = backend.jheaps_AHeap_L_insert_key_value(self._handle, id(key), value)
-        return _DoubleEndedAnyLongAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_OL_insert_key_value(self._handle, key, value)
+        return _DoubleEndedAnyLongAddressableHeapHandle(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_object_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys
+        )
+
+    def increase_key_many(self, handles, keys):
+        """Increase the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_object_keys_many(
+            self, backend.jheaps_DEAHeapHandle_L_increase_key_many, handles, keys
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleEndedAnyLongAddressableHeapHandle(res)
+        return _DoubleEndedAnyLongAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -573,7 +676,7 @@ class _DoubleEndedAnyLongAddressableHeap(
 
     def find_max(self):
         res = backend.jheaps_DEAHeap_find_max(self._handle)
-        return _DoubleEndedAnyLongAddressableHeapHandle(res)
+        return _DoubleEndedAnyLongAddressableHeapHandle(res, heap=self)
 
     def delete_max(self):
         res = backend.jheaps_DEAHeap_delete_max(self._handle)
@@ -581,15 +684,11 @@ class _DoubleEndedAnyLongAddressableHeap(
         return _DoubleEndedAnyLongAddressableHeapHandle(res, key_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            key_id = backend.jheaps_AHeapHandle_L_get_key(res)
-            _dec_ref_by_id(key_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, True, False)
 
     def __repr__(self):
-        return "_DoubleEndedAnyLongAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedAnyLongAddressableHeap(%r)" % self._backend_handle
 
 
 class _AnyLongMergeableAddressableHeap(_AnyLongAddressableHeap, MergeableHeap):
@@ -599,10 +698,14 @@ class _AnyLongMergeableAddressableHeap(_AnyLongAddressableHeap, MergeableHeap):
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_AnyLongMergeableAddressableHeap(%r)" % self._handle
+        return "_AnyLongMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedAnyLongMergeableAddressableHeap(_DoubleEndedAnyLongAddressableHeap, MergeableHeap):
@@ -612,10 +715,14 @@ class _DoubleEndedAnyLongMergeableAddressableHeap(_DoubleEndedAnyLongAddressable
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MDEAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleEndedAnyLongMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedAnyLongMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _AnyAnyAddressableHeap(_BaseAnyAddressableHeap):
@@ -623,6 +730,8 @@ class _AnyAnyAddressableHeap(_BaseAnyAddressableHeap):
     to the backend.
     """
 
+    _references_per_element = 2
+
     def __init__(self, handle, comparator, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._comparator = comparator
@@ -630,14 +739,23 @@ class _AnyAnyAddressableHeap(_BaseAnyAddressableHeap):
     def insert(self, key, value):
         if value is None:
             raise ValueError("Value cannot be None")
-        _inc_ref(key)
-        _inc_ref(value)
-        res = backend.jheaps_AHeap_L_insert_key_value(self._handle, id(key), id(value))
-        return _AnyAnyAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_OO_insert_key_value(self._handle, key, value)
+        return _AnyAnyAddressableHeapHandle(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_object_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _AnyAnyAddressableHeapHandle(res)
+        return _AnyAnyAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -645,23 +763,19 @@ class _AnyAnyAddressableHeap(_BaseAnyAddressableHeap):
         return _AnyAnyAddressableHeapHandle(res, key_owner=True, value_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            key_id = backend.jheaps_AHeapHandle_L_get_key(res)
-            value_id = backend.jheaps_AHeapHandle_get_value(res)
-            _dec_ref_by_id(key_id)
-            _dec_ref_by_id(value_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, True, True)
 
     def __repr__(self):
-        return "_AnyAnyAddressableHeap(%r)" % self._handle
+        return "_AnyAnyAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedAnyAnyAddressableHeap(_BaseAnyAddressableHeap, DoubleEndedAddressableHeap):
     """A double ended heap with any hashable key and any hashable value.
     """
 
+    _references_per_element = 2
+
     def __init__(self, handle, comparator, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._comparator = comparator
@@ -669,14 +783,34 @@ class _DoubleEndedAnyAnyAddressableHeap(_BaseAnyAddressableHeap, DoubleEndedAddr
     def insert(self, key, value):
         if value is None:
             raise ValueError("Value cannot be None")
-        _inc_ref(key)
-        _inc_ref(value)
-        res = backend.jheaps_AHeap_L_insert_key_value(self._handle, id(key), id(value))
-        return _DoubleEndedAnyAnyAddressableHeapHandle(res)
+        res = backend.jheaps_AHeap_OO_insert_key_value(self._handle, key, value)
+        return _DoubleEndedAnyAnyAddressableHeapHandle(res, heap=self)
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_object_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys
+        )
+
+    def increase_key_many(self, handles, keys):
+        """Increase the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_object_keys_many(
+            self, backend.jheaps_DEAHeapHandle_L_increase_key_many, handles, keys
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleEndedAnyAnyAddressableHeapHandle(res)
+        return _DoubleEndedAnyAnyAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -685,7 +819,7 @@ class _DoubleEndedAnyAnyAddressableHeap(_BaseAnyAddressableHeap, DoubleEndedAddr
 
     def find_max(self):
         res = backend.jheaps_DEAHeap_find_max(self._handle)
-        return _DoubleEndedAnyAnyAddressableHeapHandle(res)
+        return _DoubleEndedAnyAnyAddressableHeapHandle(res, heap=self)
 
     def delete_max(self):
         res = backend.jheaps_DEAHeap_delete_max(self._handle)
@@ -693,17 +827,11 @@ class _DoubleEndedAnyAnyAddressableHeap(_BaseAnyAddressableHeap, DoubleEndedAddr
         return _DoubleEndedAnyAnyAddressableHeapHandle(res, key_owner=True, value_owner=True)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            res = backend.jheaps_AHeap_delete_min(self._handle)
-            key_id = backend.jheaps_AHeapHandle_L_get_key(res)
-            value_id = backend.jheaps_AHeapHandle_get_value(res)
-            _dec_ref_by_id(key_id)
-            _dec_ref_by_id(value_id)
-            backend.jheaps_handles_destroy(res)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_AHeap_O_clear(self._handle, True, True)
 
     def __repr__(self):
-        return "_DoubleEndedAnyAnyAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedAnyAnyAddressableHeap(%r)" % self._backend_handle
 
 
 class _AnyAnyMergeableAddressableHeap(_AnyAnyAddressableHeap, MergeableHeap):
@@ -713,10 +841,14 @@ class _AnyAnyMergeableAddressableHeap(_AnyAnyAddressableHeap, MergeableHeap):
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_AnyAnyMergeableAddressableHeap(%r)" % self._handle
+        return "_AnyAnyMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedAnyAnyMergeableAddressableHeap(_DoubleEndedAnyAnyAddressableHeap, MergeableHeap):
@@ -726,7 +858,11 @@ class _DoubleEndedAnyAnyMergeableAddressableHeap(_DoubleEndedAnyAnyAddressableHe
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MDEAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleEndedAnyAnyMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedAnyAnyMergeableAddressableHeap(%r)" % self._backend_handle
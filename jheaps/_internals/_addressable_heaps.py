@@ -6,14 +6,35 @@ from ..types import (
     DoubleEndedAddressableHeap,
     MergeableHeap,
 )
-from ._wrappers import _HandleWrapper
+from ._wrappers import (
+    _HandleWrapper,
+    _HandleArray,
+    _handle_ids,
+)
+from ._utils import (
+    _as_double_array,
+    _as_long_array,
+    _zeros_double_array,
+    _zeros_long_array,
+)
+
+
+def _update_keys_many(heap, backend_update_many, handles, keys, as_array):
+    """Change the keys of many elements of a heap using a single backend call."""
+    ids = _handle_ids(handles, heap)
+    keys = as_array(keys)
+    if len(keys) != len(ids):
+        raise ValueError("Handles and keys must have the same length")
+    backend_update_many(ids, keys, len(ids))
 
 
 class _BaseLongValueAddressableHeapHandle(_HandleWrapper, AddressableHeapHandle):
     """A handle on an element in a heap. This handle supports long integer values."""
 
-    def __init__(self, handle, **kwargs):
+    def __init__(self, handle, heap=None, **kwargs):
         super().__init__(handle=handle, **kwargs)
+        # The heap which contains the element, if any
+        self._heap = heap
 
     @property
     def value(self):
@@ -25,9 +46,10 @@ class _BaseLongValueAddressableHeapHandle(_HandleWrapper, AddressableHeapHandle)
 
     def delete(self):
         backend.jheaps_AHeapHandle_delete(self._handle)
+        self._heap = None
 
     def __repr__(self):
-        return "_BaseLongValueAddressableHeapHandle(%r)" % self._handle
+        return "_BaseLongValueAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleLongAddressableHeapHandle(_BaseLongValueAddressableHeapHandle):
@@ -46,7 +68,7 @@ class _DoubleLongAddressableHeapHandle(_BaseLongValueAddressableHeapHandle):
         backend.jheaps_AHeapHandle_D_decrease_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleLongAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleLongAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleEndedDoubleLongAddressableHeapHandle(
@@ -63,7 +85,7 @@ class _DoubleEndedDoubleLongAddressableHeapHandle(
         backend.jheaps_DEAHeapHandle_D_increase_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleEndedDoubleLongAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleEndedDoubleLongAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _LongLongAddressableHeapHandle(_BaseLongValueAddressableHeapHandle):
@@ -82,7 +104,7 @@ class _LongLongAddressableHeapHandle(_BaseLongValueAddressableHeapHandle):
         backend.jheaps_AHeapHandle_L_decrease_key(self._handle, key)
 
     def __repr__(self):
-        return "_LongLongAddressableHeapHandle(%r)" % self._handle
+        return "_LongLongAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _DoubleEndedLongLongAddressableHeapHandle(
@@ -99,7 +121,7 @@ class _DoubleEndedLongLongAddressableHeapHandle(
         backend.jheaps_DEAHeapHandle_L_increase_key(self._handle, key)
 
     def __repr__(self):
-        return "_DoubleEndedLongLongAddressableHeapHandle(%r)" % self._handle
+        return "_DoubleEndedLongLongAddressableHeapHandle(%r)" % self._backend_handle
 
 
 class _BaseAddressableHeap(_HandleWrapper, AddressableHeap):
@@ -119,8 +141,27 @@ class _BaseAddressableHeap(_HandleWrapper, AddressableHeap):
     def is_empty(self):
         return backend.jheaps_AHeap_isempty(self._handle)
 
+    def get_values(self, handles):
+        """Get the values of many elements using a single backend call.
+
+        :param handles: the handles, as returned by `insert_many`
+        :returns: the values
+        :rtype: array.array of long integers
+        """
+        ids = _handle_ids(handles, self)
+        values = _zeros_long_array(len(ids))
+        backend.jheaps_AHeapHandle_get_value_many(ids, values, len(ids))
+        return values
+
+    def delete_many(self, handles):
+        """Delete many elements using a single backend call.
+
+        :param handles: the handles, as returned by `insert_many`
+        """
+        backend.jheaps_AHeapHandle_delete_many(_handle_ids(handles, self))
+
     def __repr__(self):
-        return "_BaseAddressableHeap(%r)" % self._handle
+        return "_BaseAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleLongAddressableHeap(_BaseAddressableHeap):
@@ -135,18 +176,61 @@ class _DoubleLongAddressableHeap(_BaseAddressableHeap):
         if value is None:
             value = int()
         res = backend.jheaps_AHeap_D_insert_key_value(self._handle, key, value)
-        return _DoubleLongAddressableHeapHandle(res)
+        return _DoubleLongAddressableHeapHandle(res, heap=self)
+
+    def insert_many(self, keys, values=None):
+        """Insert many elements using a single backend call. Instead of one
+        handle object per element, a compact array of handle ids is returned.
+
+        :param keys: the keys
+        :param values: the values or None for zero values
+        :returns: the handles of the new elements
+        :rtype: an array of handle ids
+        """
+        keys = _as_double_array(keys)
+        if values is not None:
+            values = _as_long_array(values)
+            if len(values) != len(keys):
+                raise ValueError("Keys and values must have the same length")
+        handles = _HandleArray(_zeros_long_array(len(keys)), self)
+        backend.jheaps_AHeap_D_insert_key_value_many(
+            self._handle, keys, values, handles.ids, len(keys)
+        )
+        return handles
+
+    def get_keys(self, handles):
+        """Get the keys of many elements using a single backend call.
+
+        :param handles: the handles, as returned by `insert_many`
+        :returns: the keys
+        :rtype: array.array of doubles
+        """
+        ids = _handle_ids(handles, self)
+        keys = _zeros_double_array(len(ids))
+        backend.jheaps_AHeapHandle_D_get_key_many(ids, keys, len(ids))
+        return keys
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_D_decrease_key_many, handles, keys, _as_double_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleLongAddressableHeapHandle(res)
+        return _DoubleLongAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
         return _DoubleLongAddressableHeapHandle(res)
 
     def __repr__(self):
-        return "_DoubleLongAddressableHeap(%r)" % self._handle
+        return "_DoubleLongAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedDoubleLongAddressableHeap(
@@ -163,11 +247,65 @@ class _DoubleEndedDoubleLongAddressableHeap(
         if value is None:
             value = int()
         res = backend.jheaps_AHeap_D_insert_key_value(self._handle, key, value)
-        return _DoubleEndedDoubleLongAddressableHeapHandle(res)
+        return _DoubleEndedDoubleLongAddressableHeapHandle(res, heap=self)
+
+    def insert_many(self, keys, values=None):
+        """Insert many elements using a single backend call. Instead of one
+        handle object per element, a compact array of handle ids is returned.
+
+        :param keys: the keys
+        :param values: the values or None for zero values
+        :returns: the handles of the new elements
+        :rtype: an array of handle ids
+        """
+        keys = _as_double_array(keys)
+        if values is not None:
+            values = _as_long_array(values)
+            if len(values) != len(keys):
+                raise ValueError("Keys and values must have the same length")
+        handles = _HandleArray(_zeros_long_array(len(keys)), self)
+        backend.jheaps_AHeap_D_insert_key_value_many(
+            self._handle, keys, values, handles.ids, len(keys)
+        )
+        return handles
+
+    def get_keys(self, handles):
+        """Get the keys of many elements using a single backend call.
+
+        :param handles: the handles, as returned by `insert_many`
+        :returns: the keys
+        :rtype: array.array of doubles
+        """
+        ids = _handle_ids(handles, self)
+        keys = _zeros_double_array(len(ids))
+        backend.jheaps_AHeapHandle_D_get_key_many(ids, keys, len(ids))
+        return keys
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_D_decrease_key_many, handles, keys, _as_double_array
+        )
+
+    def increase_key_many(self, handles, keys):
+        """Increase the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_DEAHeapHandle_D_increase_key_many, handles, keys, _as_double_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleEndedDoubleLongAddressableHeapHandle(res)
+        return _DoubleEndedDoubleLongAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -175,14 +313,14 @@ class _DoubleEndedDoubleLongAddressableHeap(
 
     def find_max(self):
         res = backend.jheaps_DEAHeap_find_max(self._handle)
-        return _DoubleEndedDoubleLongAddressableHeapHandle(res)
+        return _DoubleEndedDoubleLongAddressableHeapHandle(res, heap=self)
 
     def delete_max(self):
         res = backend.jheaps_DEAHeap_delete_max(self._handle)
         return _DoubleEndedDoubleLongAddressableHeapHandle(res)
 
     def __repr__(self):
-        return "_DoubleEndedDoubleLongAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedDoubleLongAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleLongMergeableAddressableHeap(_DoubleLongAddressableHeap, MergeableHeap):
@@ -192,10 +330,13 @@ class _DoubleLongMergeableAddressableHeap(_DoubleLongAddressableHeap, MergeableH
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MAHeap_D_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleLongMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleLongMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedDoubleLongMergeableAddressableHeap(_DoubleEndedDoubleLongAddressableHeap, MergeableHeap):
@@ -205,10 +346,13 @@ class _DoubleEndedDoubleLongMergeableAddressableHeap(_DoubleEndedDoubleLongAddre
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MDEAHeap_D_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleEndedDoubleLongMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedDoubleLongMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _LongLongAddressableHeap(_BaseAddressableHeap):
@@ -216,6 +360,8 @@ class _LongLongAddressableHeap(_BaseAddressableHeap):
     to the backend.
     """
 
+    _handle_class = _LongLongAddressableHeapHandle
+
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
 
@@ -223,18 +369,61 @@ class _LongLongAddressableHeap(_BaseAddressableHeap):
         if value is None:
             value = int()
         res = backend.jheaps_AHeap_L_insert_key_value(self._handle, key, value)
-        return _LongLongAddressableHeapHandle(res)
+        return self._handle_class(res, heap=self)
+
+    def insert_many(self, keys, values=None):
+        """Insert many elements using a single backend call. Instead of one
+        handle object per element, a compact array of handle ids is returned.
+
+        :param keys: the keys
+        :param values: the values or None for zero values
+        :returns: the handles of the new elements
+        :rtype: an array of handle ids
+        """
+        keys = _as_long_array(keys)
+        if values is not None:
+            values = _as_long_array(values)
+            if len(values) != len(keys):
+                raise ValueError("Keys and values must have the same length")
+        handles = _HandleArray(_zeros_long_array(len(keys)), self)
+        backend.jheaps_AHeap_L_insert_key_value_many(
+            self._handle, keys, values, handles.ids, len(keys)
+        )
+        return handles
+
+    def get_keys(self, handles):
+        """Get the keys of many elements using a single backend call.
+
+        :param handles: the handles, as returned by `insert_many`
+        :returns: the keys
+        :rtype: array.array of long integers
+        """
+        ids = _handle_ids(handles, self)
+        keys = _zeros_long_array(len(ids))
+        backend.jheaps_AHeapHandle_L_get_key_many(ids, keys, len(ids))
+        return keys
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys, _as_long_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _LongLongAddressableHeapHandle(res)
+        return self._handle_class(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
-        return _LongLongAddressableHeapHandle(res)
+        return self._handle_class(res)
 
     def __repr__(self):
-        return "_LongLongAddressableHeap(%r)" % self._handle
+        return "_LongLongAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedLongLongAddressableHeap(
@@ -251,11 +440,65 @@ class _DoubleEndedLongLongAddressableHeap(
         if value is None:
             value = int()
         res = backend.jheaps_AHeap_L_insert_key_value(self._handle, key, value)
-        return _DoubleEndedLongLongAddressableHeapHandle(res)
+        return _DoubleEndedLongLongAddressableHeapHandle(res, heap=self)
+
+    def insert_many(self, keys, values=None):
+        """Insert many elements using a single backend call. Instead of one
+        handle object per element, a compact array of handle ids is returned.
+
+        :param keys: the keys
+        :param values: the values or None for zero values
+        :returns: the handles of the new elements
+        :rtype: an array of handle ids
+        """
+        keys = _as_long_array(keys)
+        if values is not None:
+            values = _as_long_array(values)
+            if len(values) != len(keys):
+                raise ValueError("Keys and values must have the same length")
+        handles = _HandleArray(_zeros_long_array(len(keys)), self)
+        backend.jheaps_AHeap_L_insert_key_value_many(
+            self._handle, keys, values, handles.ids, len(keys)
+        )
+        return handles
+
+    def get_keys(self, handles):
+        """Get the keys of many elements using a single backend call.
+
+        :param handles: the handles, as returned by `insert_many`
+        :returns: the keys
+        :rtype: array.array of long integers
+        """
+        ids = _handle_ids(handles, self)
+        keys = _zeros_long_array(len(ids))
+        backend.jheaps_AHeapHandle_L_get_key_many(ids, keys, len(ids))
+        return keys
+
+    def decrease_key_many(self, handles, keys):
+        """Decrease the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_AHeapHandle_L_decrease_key_many, handles, keys, _as_long_array
+        )
+
+    def increase_key_many(self, handles, keys):
+        """Increase the keys of many elements using a single backend call.
+
+        :param handles: the handles, either handle objects or a handle array as
+          returned by `insert_many`
+        :param keys: the new keys
+        """
+        _update_keys_many(
+            self, backend.jheaps_DEAHeapHandle_L_increase_key_many, handles, keys, _as_long_array
+        )
 
     def find_min(self):
         res = backend.jheaps_AHeap_find_min(self._handle)
-        return _DoubleEndedLongLongAddressableHeapHandle(res)
+        return _DoubleEndedLongLongAddressableHeapHandle(res, heap=self)
 
     def delete_min(self):
         res = backend.jheaps_AHeap_delete_min(self._handle)
@@ -263,14 +506,14 @@ class _DoubleEndedLongLongAddressableHeap(
 
     def find_max(self):
         res = backend.jheaps_DEAHeap_find_max(self._handle)
-        return _DoubleEndedLongLongAddressableHeapHandle(res)
+        return _DoubleEndedLongLongAddressableHeapHandle(res, heap=self)
 
     def delete_max(self):
         res = backend.jheaps_DEAHeap_delete_max(self._handle)
         return _DoubleEndedLongLongAddressableHeapHandle(res)
 
     def __repr__(self):
-        return "_DoubleEndedLongLongAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedLongLongAddressableHeap(%r)" % self._backend_handle
 
 
 class _LongLongMergeableAddressableHeap(_LongLongAddressableHeap, MergeableHeap):
@@ -280,10 +523,13 @@ class _LongLongMergeableAddressableHeap(_LongLongAddressableHeap, MergeableHeap)
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_LongLongMergeableAddressableHeap(%r)" % self._handle
+        return "_LongLongMergeableAddressableHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedLongLongMergeableAddressableHeap(_DoubleEndedLongLongAddressableHeap, MergeableHeap):
@@ -293,7 +539,10 @@ class _DoubleEndedLongLongMergeableAddressableHeap(_DoubleEndedLongLongAddressab
         super().__init__(handle=handle, **kwargs)
 
     def meld(self, other):
+        self._check_same_isolate(other)
         backend.jheaps_MDEAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap
+        other._melded_into = self
 
     def __repr__(self):
-        return "_DoubleEndedLongLongMergeableAddressableHeap(%r)" % self._handle
+        return "_DoubleEndedLongLongMergeableAddressableHeap(%r)" % self._backend_handle
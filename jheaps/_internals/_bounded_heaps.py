@@ -0,0 +1,76 @@
+from .. import backend
+
+from ._wrappers import _HandleWrapper
+from ._utils import _zeros_double_array, _zeros_long_array
+
+
+class _BaseBoundedHeap(_HandleWrapper):
+    """A heap which keeps at most a fixed number of elements. The backend
+    rejects keys which do not qualify, using the key of the worst kept
+    element as a threshold, without touching the heap.
+    """
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def clear(self):
+        backend.jheaps_BHeap_clear(self._handle)
+
+    def __len__(self):
+        return backend.jheaps_BHeap_size(self._handle)
+
+    def _destroy(self):
+        backend.jheaps_BHeap_destroy(self._handle)
+
+    def __repr__(self):
+        return "_BaseBoundedHeap(%r)" % self._backend_handle
+
+
+class _DoubleBoundedHeap(_BaseBoundedHeap):
+    """A bounded heap with floating point keys and long integer values."""
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def push(self, key, value):
+        return bool(backend.jheaps_BHeap_D_push(self._handle, key, value))
+
+    def push_many(self, keys, values, first_value):
+        return backend.jheaps_BHeap_D_push_many(
+            self._handle, keys, values, first_value, len(keys)
+        )
+
+    def result(self):
+        n = len(self)
+        keys = _zeros_double_array(n)
+        values = _zeros_long_array(n)
+        backend.jheaps_BHeap_D_result(self._handle, keys, values, n)
+        return keys, values
+
+    def __repr__(self):
+        return "_DoubleBoundedHeap(%r)" % self._backend_handle
+
+
+class _LongBoundedHeap(_BaseBoundedHeap):
+    """A bounded heap with long integer keys and long integer values."""
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def push(self, key, value):
+        return bool(backend.jheaps_BHeap_L_push(self._handle, key, value))
+
+    def push_many(self, keys, values, first_value):
+        return backend.jheaps_BHeap_L_push_many(
+            self._handle, keys, values, first_value, len(keys)
+        )
+
+    def result(self):
+        n = len(self)
+        keys = _zeros_long_array(n)
+        values = _zeros_long_array(n)
+        backend.jheaps_BHeap_L_result(self._handle, keys, values, n)
+        return keys, values
+
+    def __repr__(self):
+        return "_LongBoundedHeap(%r)" % self._backend_handle
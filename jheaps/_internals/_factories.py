@@ -11,6 +11,8 @@ from ._heaps import (
     _DoubleEndedDoubleHeap,
     _DoubleEndedLongHeap,
     _DoubleEndedAnyHeap,
+    _KeyFunctionHeap,
+    _DoubleEndedKeyFunctionHeap,
 )
 
 from ._addressable_heaps import (
@@ -43,12 +45,65 @@ from ._addressable_any_heaps import (
     _DoubleEndedAnyAnyMergeableAddressableHeap,
 )
 
+from ._indexed_heaps import (
+    _DoubleIndexedHeap,
+    _LongIndexedHeap,
+)
+
+from ._bounded_heaps import (
+    _DoubleBoundedHeap,
+    _LongBoundedHeap,
+)
+
+from ._tuple_heaps import (
+    _is_tuple_key_type,
+    _tuple_key_comparator,
+    _wrap_tuple_heap,
+)
+
 from ._utils import (
-    _id_comparator,
-    _create_wrapped_id_comparator_callback,
+    _inc_ref,
+    _dec_ref,
+    _as_double_array,
+    _as_long_array,
+    _zeros_long_array,
 )
 
+from array import array
 import ctypes
+import operator
+
+
+# heap types which can be built using heapify, mapped to whether they
+# are (addressable, double ended, d-ary)
+_HEAPIFY_HEAP_TYPES = {
+    _HeapType.HEAP_TYPE_BINARY_IMPLICIT: (False, False, False),
+    _HeapType.HEAP_TYPE_BINARY_IMPLICIT_WEAK: (False, False, False),
+    _HeapType.HEAP_TYPE_BINARY_IMPLICIT_WEAK_BULKINSERT: (False, False, False),
+    _HeapType.HEAP_TYPE_ADDRESSABLE_BINARY_IMPLICIT: (True, False, False),
+    _HeapType.HEAP_TYPE_DARY_IMPLICIT: (False, False, True),
+    _HeapType.HEAP_TYPE_ADDRESSABLE_DARY_IMPLICIT: (True, False, True),
+    _HeapType.HEAP_TYPE_DOUBLEENDED_BINARY_IMPLICIT_MINMAX: (False, True, False),
+}
+
+# addressable heap types which can back an indexed heap, mapped to whether
+# they are d-ary
+_INDEXED_HEAP_TYPES = {
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_FIBONACCI: False,
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_FIBONACCI_SIMPLE: False,
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_PAIRING: False,
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_PAIRING_RANK: False,
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_PAIRING_COSTLESSMELD: False,
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_HOLLOW: False,
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_LEFTIST: False,
+    _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_SKEW: False,
+    _HeapType.HEAP_TYPE_ADDRESSABLE_BINARY_IMPLICIT: False,
+    _HeapType.HEAP_TYPE_ADDRESSABLE_BINARY_EXPLICIT: False,
+    _HeapType.HEAP_TYPE_ADDRESSABLE_DARY_IMPLICIT: True,
+    _HeapType.HEAP_TYPE_ADDRESSABLE_DARY_EXPLICIT: True,
+    _HeapType.HEAP_TYPE_DOUBLEENDED_MERGEABLE_ADDRESSABLE_FIBONACCI_REFLECTED: False,
+    _HeapType.HEAP_TYPE_DOUBLEENDED_MERGEABLE_ADDRESSABLE_PAIRING_REFLECTED: False,
+}
 
 
 def _wrap_heap(
@@ -60,6 +115,10 @@ def _wrap_heap(
     mergeable=False,
     double_ended=False,
 ):
+    if _is_tuple_key_type(key_type):
+        return _wrap_tuple_heap(
+            handle, key_type, value_type, addressable, mergeable, double_ended
+        )
     if addressable:
         if double_ended:
             if mergeable:
@@ -156,17 +215,39 @@ def _wrap_heap(
                 return _AnyHeap(handle, comparator=comparator)
 
 
+def _wrap_key_function_heap(heap, key, key_type, double_ended):
+    if key_type == float:
+        to_priority = float
+    elif key_type == int:
+        to_priority = operator.index
+    else:
+        raise ValueError("Key functions require float or int key_type")
+    if double_ended:
+        return _DoubleEndedKeyFunctionHeap(heap, key, to_priority)
+    return _KeyFunctionHeap(heap, key, to_priority)
+
+
 def _create_and_wrap_heap(
     heap_type, key_type, value_type, addressable, mergeable, double_ended
 ):
-    if key_type != int and key_type != float:
-        f_ptr, f = _create_wrapped_id_comparator_callback(_id_comparator)
+    if _is_tuple_key_type(key_type):
+        f_ptr = _tuple_key_comparator(key_type)
+        handle = backend.jheaps_Heap_comparator_create(heap_type.value, f_ptr)
+        return _wrap_heap(
+            handle,
+            key_type,
+            value_type,
+            addressable=addressable,
+            mergeable=mergeable,
+            double_ended=double_ended,
+        )
+    elif key_type != int and key_type != float:
+        f_ptr = backend.jheaps_get_id_comparator()
         handle = backend.jheaps_Heap_comparator_create(heap_type.value, f_ptr)
         return _wrap_heap(
             handle,
             key_type,
             value_type,
-            comparator=f,
             addressable=addressable,
             mergeable=mergeable,
             double_ended=double_ended,
@@ -186,14 +267,24 @@ def _create_and_wrap_heap(
 def _create_and_wrap_dary_heap(
     heap_type, d, key_type, value_type, addressable, mergeable, double_ended
 ):
-    if key_type != int and key_type != float:
-        f_ptr, f = _create_wrapped_id_comparator_callback(_id_comparator)
+    if _is_tuple_key_type(key_type):
+        f_ptr = _tuple_key_comparator(key_type)
+        handle = backend.jheaps_dary_Heap_comparator_create(heap_type.value, f_ptr, d)
+        return _wrap_heap(
+            handle,
+            key_type,
+            value_type,
+            addressable=addressable,
+            mergeable=mergeable,
+            double_ended=double_ended,
+        )
+    elif key_type != int and key_type != float:
+        f_ptr = backend.jheaps_get_id_comparator()
         handle = backend.jheaps_dary_Heap_comparator_create(heap_type.value, f_ptr, d)
         return _wrap_heap(
             handle,
             key_type,
             value_type,
-            comparator=f,
             addressable=addressable,
             mergeable=mergeable,
             double_ended=double_ended,
@@ -210,11 +301,34 @@ def _create_and_wrap_dary_heap(
         )
 
 
+def _create_and_wrap_soft_heap(heap_type, error_rate, key_type, value_type):
+    if _is_tuple_key_type(key_type):
+        f_ptr = _tuple_key_comparator(key_type)
+        handle = backend.jheaps_soft_Heap_comparator_create(
+            heap_type.value, f_ptr, error_rate
+        )
+    elif key_type != int and key_type != float:
+        f_ptr = backend.jheaps_get_id_comparator()
+        handle = backend.jheaps_soft_Heap_comparator_create(
+            heap_type.value, f_ptr, error_rate
+        )
+    else:
+        handle = backend.jheaps_soft_Heap_create(heap_type.value, error_rate)
+    return _wrap_heap(
+        handle,
+        key_type,
+        value_type,
+        addressable=True,
+        mergeable=True,
+        double_ended=False,
+    )
+
+
 def _create_and_wrap_radix_heap(
     heap_type, min, max, key_type, value_type, addressable, mergeable, double_ended
 ):
     if key_type == float:
-        handle = backend.jheaps_double_radix_Heap_create(heap_type, min, max)
+        handle = backend.jheaps_double_radix_Heap_create(heap_type.value, min, max)
         return _wrap_heap(
             handle,
             key_type,
@@ -224,7 +338,7 @@ def _create_and_wrap_radix_heap(
             double_ended=double_ended,
         )
     elif key_type == int:
-        handle = backend.jheaps_long_radix_Heap_create(heap_type, min, max)
+        handle = backend.jheaps_long_radix_Heap_create(heap_type.value, min, max)
         return _wrap_heap(
             handle,
             key_type,
@@ -235,3 +349,122 @@ def _create_and_wrap_radix_heap(
         )
     else:
         raise ValueError("Key type can only be float or int")
+
+
+def _heapify_and_wrap_heap(heap_type, keys, values, key_type, d):
+    if heap_type not in _HEAPIFY_HEAP_TYPES:
+        raise ValueError("Heap type {} does not support heapify".format(heap_type))
+    addressable, double_ended, dary = _HEAPIFY_HEAP_TYPES[heap_type]
+
+    if values is not None and not addressable:
+        raise ValueError("Values are only supported by addressable heaps")
+    if isinstance(key_type, tuple):
+        raise ValueError("Heapify does not support tuple keys")
+
+    if key_type == float:
+        keys = _as_double_array(keys)
+    elif key_type == int:
+        keys = _as_long_array(keys)
+    else:
+        objects = list(keys)
+        keys = array("q", [id(k) for k in objects])
+    count = len(keys)
+
+    if values is not None:
+        values = _as_long_array(values)
+        if len(values) != count:
+            raise ValueError("Keys and values must have the same length")
+    elif addressable:
+        values = _zeros_long_array(count)
+
+    if key_type == float:
+        if dary:
+            handle = backend.jheaps_dary_Heap_D_heapify(
+                heap_type.value, d, keys, values, count
+            )
+        else:
+            handle = backend.jheaps_Heap_D_heapify(heap_type.value, keys, values, count)
+    elif key_type == int:
+        if dary:
+            handle = backend.jheaps_dary_Heap_L_heapify(
+                heap_type.value, d, keys, values, count
+            )
+        else:
+            handle = backend.jheaps_Heap_L_heapify(heap_type.value, keys, values, count)
+    else:
+        f_ptr = backend.jheaps_get_id_comparator()
+        # the heap owns a reference to each key
+        for o in objects:
+            _inc_ref(o)
+        try:
+            if dary:
+                handle = backend.jheaps_dary_Heap_L_comparator_heapify(
+                    heap_type.value, f_ptr, d, keys, values, count
+                )
+            else:
+                handle = backend.jheaps_Heap_L_comparator_heapify(
+                    heap_type.value, f_ptr, keys, values, count
+                )
+        except Exception:
+            for o in objects:
+                _dec_ref(o)
+            raise
+
+    return _wrap_heap(
+        handle,
+        key_type,
+        int,
+        addressable=addressable,
+        mergeable=False,
+        double_ended=double_ended,
+    )
+
+
+def _create_and_wrap_indexed_heap(heap_type, n, key_type, d):
+    if heap_type not in _INDEXED_HEAP_TYPES:
+        raise ValueError("Heap type {} cannot be used as an indexed heap".format(heap_type))
+    if key_type == float:
+        heap_class = _DoubleIndexedHeap
+    elif key_type == int:
+        heap_class = _LongIndexedHeap
+    else:
+        raise ValueError("Indexed heaps support float or int keys")
+
+    if _INDEXED_HEAP_TYPES[heap_type]:
+        heap_handle = backend.jheaps_dary_Heap_create(heap_type.value, d)
+    else:
+        heap_handle = backend.jheaps_Heap_create(heap_type.value)
+
+    # the indexed heap takes ownership of the heap
+    try:
+        handle = backend.jheaps_IHeap_create(heap_handle, n)
+    except Exception:
+        backend.jheaps_handles_destroy(heap_handle)
+        raise
+    return heap_class(handle)
+
+
+def _create_and_wrap_bounded_heap(capacity, key_type, largest, d):
+    if key_type == float:
+        heap_class = _DoubleBoundedHeap
+        f_ptr = backend.jheaps_get_DL_comparator()
+    elif key_type == int:
+        heap_class = _LongBoundedHeap
+        f_ptr = backend.jheaps_get_LL_comparator()
+    else:
+        raise ValueError("Key type can only be float or int")
+    if capacity < 0:
+        raise ValueError("Capacity must be non-negative")
+
+    # elements are stored as composite keys of their key and value, thus
+    # elements with equal keys are ordered by their values
+    heap_type = _HeapType.HEAP_TYPE_ADDRESSABLE_DARY_IMPLICIT
+    heap_handle = backend.jheaps_dary_Heap_comparator_create(heap_type.value, f_ptr, d)
+
+    # the bounded heap takes ownership of the heap
+    try:
+        handle = backend.jheaps_BHeap_create(heap_handle, capacity, int(largest))
+    except Exception:
+        backend.jheaps_handles_destroy(heap_handle)
+        raise
+    return heap_class(handle)
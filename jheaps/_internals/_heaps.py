@@ -1,15 +1,19 @@
 from .. import backend
 
+from collections import deque
+
 from ..types import (
     Heap, 
     DoubleEndedHeap,
 )
 from ._wrappers import _HandleWrapper
+from ._leaks import _track_references
 
 from ._utils import (
-    _inc_ref,
-    _dec_ref_by_id,
-    _id_to_obj,
+    _as_double_array,
+    _as_long_array,
+    _zeros_double_array,
+    _zeros_long_array,
 )
 
 class _BaseHeap(_HandleWrapper, Heap): 
@@ -28,7 +32,7 @@ class _BaseHeap(_HandleWrapper, Heap):
         return backend.jheaps_Heap_isempty(self._handle)
 
     def __repr__(self):
-        return "_BaseHeap(%r)" % self._handle
+        return "_BaseHeap(%r)" % self._backend_handle
 
 
 class _DoubleHeap(_BaseHeap): 
@@ -40,14 +44,37 @@ class _DoubleHeap(_BaseHeap):
     def insert(self, key):
         backend.jheaps_Heap_D_insert_key(self._handle, key)
 
+    def insert_many(self, keys):
+        """Insert many keys using a single backend call.
+
+        :param keys: the keys, preferably as a contiguous buffer of doubles
+          such as a numpy float64 array or an array.array('d'). Any other
+          iterable is first copied into such a buffer.
+        """
+        backend.jheaps_Heap_D_insert_many(self._handle, _as_double_array(keys))
+
     def find_min(self):
         return backend.jheaps_Heap_D_find_min(self._handle)
 
     def delete_min(self):
         return backend.jheaps_Heap_D_delete_min(self._handle)
 
+    def delete_min_many(self, k):
+        """Delete the k minimum elements using a single backend call. If the
+        heap contains less than k elements, all of them are deleted.
+
+        :param k: the number of elements to delete
+        :type k: int
+        :returns: the deleted keys in ascending order
+        :rtype: array.array of doubles
+        """
+        keys = _zeros_double_array(min(k, len(self)))
+        count = backend.jheaps_Heap_D_delete_min_many(self._handle, keys)
+        del keys[count:]
+        return keys
+
     def __repr__(self):
-        return "_DoubleHeap(%r)" % self._handle
+        return "_DoubleHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedDoubleHeap(_DoubleHeap, DoubleEndedHeap): 
@@ -62,8 +89,22 @@ class _DoubleEndedDoubleHeap(_DoubleHeap, DoubleEndedHeap):
     def delete_max(self):
         return backend.jheaps_DEHeap_D_delete_max(self._handle)
 
+    def delete_max_many(self, k):
+        """Delete the k maximum elements using a single backend call. If the
+        heap contains less than k elements, all of them are deleted.
+
+        :param k: the number of elements to delete
+        :type k: int
+        :returns: the deleted keys in descending order
+        :rtype: array.array of doubles
+        """
+        keys = _zeros_double_array(min(k, len(self)))
+        count = backend.jheaps_DEHeap_D_delete_max_many(self._handle, keys)
+        del keys[count:]
+        return keys
+
     def __repr__(self):
-        return "_DoubleEndedDoubleHeap(%r)" % self._handle
+        return "_DoubleEndedDoubleHeap(%r)" % self._backend_handle
 
 
 class _LongHeap(_BaseHeap): 
@@ -75,14 +116,37 @@ class _LongHeap(_BaseHeap):
     def insert(self, key):
         backend.jheaps_Heap_L_insert_key(self._handle, key)
 
+    def insert_many(self, keys):
+        """Insert many keys using a single backend call.
+
+        :param keys: the keys, preferably as a contiguous buffer of 64-bit
+          integers such as a numpy int64 array or an array.array('q'). Any
+          other iterable is first copied into such a buffer.
+        """
+        backend.jheaps_Heap_L_insert_many(self._handle, _as_long_array(keys))
+
     def find_min(self):
         return backend.jheaps_Heap_L_find_min(self._handle)
 
     def delete_min(self):
         return backend.jheaps_Heap_L_delete_min(self._handle)
 
+    def delete_min_many(self, k):
+        """Delete the k minimum elements using a single backend call. If the
+        heap contains less than k elements, all of them are deleted.
+
+        :param k: the number of elements to delete
+        :type k: int
+        :returns: the deleted keys in ascending order
+        :rtype: array.array of long integers
+        """
+        keys = _zeros_long_array(min(k, len(self)))
+        count = backend.jheaps_Heap_L_delete_min_many(self._handle, keys)
+        del keys[count:]
+        return keys
+
     def __repr__(self):
-        return "_LongHeap(%r)" % self._handle
+        return "_LongHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedLongHeap(_LongHeap, DoubleEndedHeap): 
@@ -97,8 +161,22 @@ class _DoubleEndedLongHeap(_LongHeap, DoubleEndedHeap):
     def delete_max(self):
         return backend.jheaps_DEHeap_L_delete_max(self._handle)
 
+    def delete_max_many(self, k):
+        """Delete the k maximum elements using a single backend call. If the
+        heap contains less than k elements, all of them are deleted.
+
+        :param k: the number of elements to delete
+        :type k: int
+        :returns: the deleted keys in descending order
+        :rtype: array.array of long integers
+        """
+        keys = _zeros_long_array(min(k, len(self)))
+        count = backend.jheaps_DEHeap_L_delete_max_many(self._handle, keys)
+        del keys[count:]
+        return keys
+
     def __repr__(self):
-        return "_DoubleEndedLongHeap(%r)" % self._handle
+        return "_DoubleEndedLongHeap(%r)" % self._backend_handle
 
 
 class _AnyHeap(_BaseHeap): 
@@ -107,28 +185,30 @@ class _AnyHeap(_BaseHeap):
     def __init__(self, handle, comparator, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._comparator=comparator
+        _track_references(self)
 
     def insert(self, key):
-        _inc_ref(key)
-        backend.jheaps_Heap_L_insert_key(self._handle, id(key))
+        backend.jheaps_Heap_O_insert_key(self._handle, key)
 
     def find_min(self):
-        key_id = backend.jheaps_Heap_L_find_min(self._handle)
-        return _id_to_obj(key_id)
+        return backend.jheaps_Heap_O_find_min(self._handle)
 
     def delete_min(self):
-        key_id = backend.jheaps_Heap_L_delete_min(self._handle)
-        _dec_ref_by_id(key_id)
-        return _id_to_obj(key_id)
+        return backend.jheaps_Heap_O_delete_min(self._handle)
 
     def clear(self):
-        # Clean one by one in order to decrease reference counts
-        while not self.is_empty():
-            key_id = backend.jheaps_Heap_L_delete_min(self._handle)
-            _dec_ref_by_id(key_id)
+        # Empty the heap and release its references in a single call
+        backend.jheaps_Heap_O_clear(self._handle)
+
+    def _destroy(self):
+        backend.jheaps_Heap_O_clear(self._handle)
+        super()._destroy()
+
+    def _owned_references(self):
+        return len(self)
 
     def __repr__(self):
-        return "_AnyHeap(%r)" % self._handle
+        return "_AnyHeap(%r)" % self._backend_handle
 
 
 class _DoubleEndedAnyHeap(_AnyHeap, DoubleEndedHeap): 
@@ -138,13 +218,100 @@ class _DoubleEndedAnyHeap(_AnyHeap, DoubleEndedHeap):
         super().__init__(handle=handle, **kwargs)
 
     def find_max(self):
-        key_id = backend.jheaps_DEHeap_L_find_max(self._handle)
-        return _id_to_obj(key_id)
+        return backend.jheaps_DEHeap_O_find_max(self._handle)
+
+    def delete_max(self):
+        return backend.jheaps_DEHeap_O_delete_max(self._handle)
+
+    def __repr__(self):
+        return "_DoubleEndedAnyHeap(%r)" % self._backend_handle
+
+
+class _SamePriority(deque):
+    """The objects of a key function heap which share a priority, in insertion
+    order. Distinguishes them from a single object which happens to be a deque.
+    """
+
+    __slots__ = ()
+
+
+class _KeyFunctionHeap(Heap):
+    """A heap of any objects ordered by a float or integer priority. The priority
+    is extracted once at insertion using a key function and only priorities are
+    stored in the backend heap, thus all comparisons are performed natively.
+    Objects with equal priority are returned in insertion order.
+
+    Each priority maps to its object, and only priorities shared by more than
+    one object map to a deque of objects.
+    """
+    def __init__(self, heap, key, to_priority, **kwargs):
+        super().__init__(**kwargs)
+        self._heap = heap
+        self._key = key
+        self._to_priority = to_priority
+        self._items = {}
+
+    def insert(self, key):
+        priority = self._to_priority(self._key(key))
+        if priority != priority:
+            raise ValueError("Priority cannot be NaN")
+        self._heap.insert(priority)
+        items = self._items.get(priority)
+        if items is None and priority not in self._items:
+            self._items[priority] = key
+        elif type(items) is _SamePriority:
+            items.append(key)
+        else:
+            self._items[priority] = _SamePriority((items, key))
+
+    def _find(self, priority, last):
+        items = self._items[priority]
+        if type(items) is not _SamePriority:
+            return items
+        return items[-1] if last else items[0]
+
+    def _remove(self, priority, last):
+        items = self._items[priority]
+        if type(items) is not _SamePriority:
+            del self._items[priority]
+            return items
+        key = items.pop() if last else items.popleft()
+        if len(items) == 1:
+            self._items[priority] = items[0]
+        return key
+
+    def find_min(self):
+        return self._find(self._heap.find_min(), last=False)
+
+    def delete_min(self):
+        return self._remove(self._heap.delete_min(), last=False)
+
+    def clear(self):
+        self._heap.clear()
+        self._items.clear()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def is_empty(self):
+        return self._heap.is_empty()
+
+    def __repr__(self):
+        return "_KeyFunctionHeap(%r)" % self._heap
+
+
+class _DoubleEndedKeyFunctionHeap(_KeyFunctionHeap, DoubleEndedHeap):
+    """A double ended heap of any objects ordered by a float or integer priority
+    which is extracted using a key function.
+    """
+    def __init__(self, heap, key, to_priority, **kwargs):
+        super().__init__(heap, key, to_priority, **kwargs)
+
+    def find_max(self):
+        return self._find(self._heap.find_max(), last=True)
 
     def delete_max(self):
-        key_id = backend.jheaps_DEHeap_L_delete_max(self._handle)
-        _dec_ref_by_id(key_id)
-        return _id_to_obj(key_id)
+        return self._remove(self._heap.delete_max(), last=True)
 
     def __repr__(self):
-        return "_DoubleEndedAnyHeap(%r)" % self._handle
+        return "_DoubleEndedKeyFunctionHeap(%r)" % self._heap
@@ -0,0 +1,88 @@
+from .. import backend
+
+from ..types import IndexedHeap
+from ._wrappers import _HandleWrapper
+
+
+class _BaseIndexedHeap(_HandleWrapper, IndexedHeap):
+    """An indexed heap. The backend keeps the table from ids to heap nodes
+    and thus no handles are created for the elements.
+    """
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def delete(self, id):
+        backend.jheaps_IHeap_delete(self._handle, id)
+
+    def contains(self, id):
+        return bool(backend.jheaps_IHeap_contains(self._handle, id))
+
+    def clear(self):
+        backend.jheaps_IHeap_clear(self._handle)
+
+    def __len__(self):
+        return backend.jheaps_IHeap_size(self._handle)
+
+    def is_empty(self):
+        return bool(backend.jheaps_IHeap_isempty(self._handle))
+
+    def _destroy(self):
+        backend.jheaps_IHeap_destroy(self._handle)
+
+    def __repr__(self):
+        return "_BaseIndexedHeap(%r)" % self._backend_handle
+
+
+class _DoubleIndexedHeap(_BaseIndexedHeap):
+    """An indexed heap with floating point keys."""
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def push(self, id, key):
+        backend.jheaps_IHeap_D_push(self._handle, id, key)
+
+    def decrease_key(self, id, key):
+        backend.jheaps_IHeap_D_decrease_key(self._handle, id, key)
+
+    def get_key(self, id):
+        return backend.jheaps_IHeap_D_get_key(self._handle, id)
+
+    def find_min(self):
+        id, key = backend.jheaps_IHeap_D_find_min(self._handle)
+        return id, key
+
+    def pop(self):
+        id, key = backend.jheaps_IHeap_D_pop(self._handle)
+        return id, key
+
+    def __repr__(self):
+        return "_DoubleIndexedHeap(%r)" % self._backend_handle
+
+
+class _LongIndexedHeap(_BaseIndexedHeap):
+    """An indexed heap with long integer keys."""
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def push(self, id, key):
+        backend.jheaps_IHeap_L_push(self._handle, id, key)
+
+    def decrease_key(self, id, key):
+        backend.jheaps_IHeap_L_decrease_key(self._handle, id, key)
+
+    def get_key(self, id):
+        return backend.jheaps_IHeap_L_get_key(self._handle, id)
+
+    def find_min(self):
+        id, key = backend.jheaps_IHeap_L_find_min(self._handle)
+        return id, key
+
+    def pop(self):
+        id, key = backend.jheaps_IHeap_L_pop(self._handle)
+        return id, key
+
+    def __repr__(self):
+        return "_LongIndexedHeap(%r)" % self._backend_handle
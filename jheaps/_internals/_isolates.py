@@ -0,0 +1,163 @@
+from .. import backend
+
+import logging
+import operator
+import os
+import threading
+from contextlib import contextmanager
+
+
+class _IsolateState(threading.local):
+    """The isolate selected by the current thread. All threads start in the
+    default isolate with index zero.
+    """
+
+    current = 0
+
+
+_logger = logging.getLogger("jheaps")
+
+_state = _IsolateState()
+_pool_lock = threading.Lock()
+
+
+def _current_isolate():
+    return _state.current
+
+
+def _ensure_isolate(index):
+    """Grow the pool of isolates until it contains the given index."""
+    if index < 0:
+        raise IndexError("Isolate index must be non-negative")
+    with _pool_lock:
+        while backend.jheaps_isolate_count() <= index:
+            backend.jheaps_isolate_create()
+
+
+@contextmanager
+def _entered_isolate(index):
+    """Select an existing isolate in the current thread for the duration
+    of the context.
+    """
+    previous = _state.current
+    if index == previous:
+        yield index
+        return
+    backend.jheaps_isolate_enter(index)
+    _state.current = index
+    try:
+        yield index
+    finally:
+        backend.jheaps_isolate_enter(previous)
+        _state.current = previous
+
+
+@contextmanager
+def _isolate(index):
+    _ensure_isolate(index)
+    with _entered_isolate(index):
+        yield index
+
+
+_SIZE_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+# runtime options of the backend for each size parameter
+_SIZE_OPTIONS = {
+    "max_heap_size": "-Xmx",
+    "min_heap_size": "-Xms",
+    "young_gen_size": "-Xmn",
+}
+
+_ENVIRONMENT_VARIABLES = {
+    "max_heap_size": "JHEAPS_MAX_HEAP_SIZE",
+    "min_heap_size": "JHEAPS_MIN_HEAP_SIZE",
+    "young_gen_size": "JHEAPS_YOUNG_GEN_SIZE",
+    "reserved_address_space_size": "JHEAPS_RESERVED_ADDRESS_SPACE_SIZE",
+    "options": "JHEAPS_ISOLATE_OPTIONS",
+}
+
+_config = {}
+
+
+def _parse_size(size):
+    """Parse a size in bytes, given either as an integer or as a string
+    with an optional k, m, g or t suffix.
+    """
+    if isinstance(size, str):
+        s = size.strip().lower()
+        unit = s[-1:] if s[-1:] in _SIZE_UNITS else ""
+        digits = s[: len(s) - len(unit)]
+        if not digits.isdigit():
+            raise ValueError("Invalid size: {}".format(size))
+        result = int(digits) * _SIZE_UNITS[unit]
+    else:
+        try:
+            result = operator.index(size)
+        except TypeError:
+            raise ValueError("Invalid size: {}".format(size))
+    if result <= 0:
+        raise ValueError("Size must be positive")
+    return result
+
+
+def _apply_config(config):
+    backend.jheaps_isolate_configure_clear()
+    for name, option in _SIZE_OPTIONS.items():
+        if name in config:
+            backend.jheaps_isolate_configure_option(
+                "{}{}".format(option, config[name])
+            )
+    for option in config.get("options", ()):
+        backend.jheaps_isolate_configure_option(option)
+    if "reserved_address_space_size" in config:
+        backend.jheaps_isolate_configure_reserved_address_space_size(
+            config["reserved_address_space_size"]
+        )
+
+
+def _configure(**kwargs):
+    """Update the parameters of the isolates which are not created yet.
+    Parameters given as None are left unchanged.
+    """
+    if backend.jheaps_is_initialized():
+        raise ValueError("Backend already initialized")
+    config = dict(_config)
+    for name, value in kwargs.items():
+        if value is None:
+            continue
+        if name == "options":
+            if isinstance(value, str):
+                raise ValueError("Options must be a sequence of strings")
+            config[name] = [str(o) for o in value]
+        else:
+            config[name] = _parse_size(value)
+    if "min_heap_size" in config and "max_heap_size" in config:
+        if config["min_heap_size"] > config["max_heap_size"]:
+            raise ValueError("Min heap size cannot be larger than max heap size")
+    try:
+        _apply_config(config)
+    except ValueError:
+        # keep the previous parameters, e.g. if the backend does not
+        # support runtime options
+        _apply_config(_config)
+        raise
+    _config.clear()
+    _config.update(config)
+
+
+def _configure_from_environment():
+    kwargs = {}
+    for name, variable in _ENVIRONMENT_VARIABLES.items():
+        value = os.environ.get(variable)
+        if not value:
+            continue
+        try:
+            kwargs[name] = value.split() if name == "options" else _parse_size(value)
+        except ValueError:
+            # a malformed variable must not break importing the module
+            _logger.warning("Ignoring invalid value of %s: %s", variable, value)
+    if kwargs:
+        try:
+            _configure(**kwargs)
+        except ValueError as e:
+            _logger.warning("Ignoring the isolate configuration of the environment: %s", e)
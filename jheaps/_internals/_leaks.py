@@ -0,0 +1,79 @@
+import atexit
+import gc
+import logging
+import os
+import traceback
+import weakref
+
+from ._isolates import _entered_isolate
+
+_logger = logging.getLogger("jheaps")
+
+
+class _LeakTracker:
+    """Keeps track of the live heaps which own references to python objects,
+    together with the stack where each heap was created. Only heaps created
+    while tracking is enabled are tracked.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.heaps = {}
+        self._atexit_registered = False
+
+    def enable(self, enabled):
+        self.enabled = enabled
+        if enabled and not self._atexit_registered:
+            atexit.register(_log_leak_report)
+            self._atexit_registered = True
+
+    def track(self, heap):
+        key = id(heap)
+        stack = "".join(traceback.format_stack()[:-3])
+        heaps = self.heaps
+
+        def untrack(ref):
+            heaps.pop(key, None)
+
+        heaps[key] = (weakref.ref(heap, untrack), stack)
+
+
+_tracker = _LeakTracker()
+
+
+def _track_references(heap):
+    """Track a heap which owns references, if leak debugging is enabled."""
+    if _tracker.enabled:
+        _tracker.track(heap)
+
+
+def _leak_report():
+    """Collect garbage and report the tracked heaps which still own references."""
+    gc.collect()
+    report = []
+    for ref, stack in list(_tracker.heaps.values()):
+        heap = ref()
+        if heap is None:
+            continue
+        with _entered_isolate(heap._isolate):
+            references = heap._owned_references()
+        if references > 0:
+            report.append(
+                {"heap": repr(heap), "references": references, "traceback": stack}
+            )
+    return report
+
+
+def _log_leak_report():
+    for entry in _leak_report():
+        _logger.warning(
+            "%s still owns %d references, created at:\n%s",
+            entry["heap"],
+            entry["references"],
+            entry["traceback"],
+        )
+
+
+def _debug_leaks_from_environment():
+    if os.environ.get("JHEAPS_DEBUG_LEAKS", "") not in ("", "0"):
+        _tracker.enable(True)
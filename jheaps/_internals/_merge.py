@@ -0,0 +1,152 @@
+import sys
+from collections import deque
+from itertools import islice
+
+from ..types import HeapType as _HeapType
+from ._factories import _create_and_wrap_dary_heap
+from ._utils import (
+    _is_array_of,
+    _as_double_array,
+    _as_long_array,
+    _zeros_double_array,
+    _zeros_long_array,
+)
+
+_LONG_MAX = (1 << 63) - 1
+
+
+def _array_key_type(iterables):
+    """Return float or int if all iterables are buffers of doubles, or all are
+    buffers of long integers, and None otherwise.
+    """
+    if all(_is_array_of(it, ("d",)) for it in iterables):
+        return float
+    if all(_is_array_of(it, ("q", "l")) for it in iterables):
+        return int
+    return None
+
+
+def _merge_keys(read, first_chunks, key_type, chunk):
+    """Merge sorted streams of keys which are read in chunks. The heap holds
+    the keys of the current chunk of every stream, as (key, stream) pairs.
+    All keys up to the smallest last key of the current chunks can be
+    output, after which the stream owning that key is exhausted and the
+    next chunk is read.
+
+    :param read: called with the index of a stream, returns the next chunk of
+      its keys as a buffer or None if the stream is exhausted
+    :param first_chunks: the first chunk of every stream
+    :returns: a generator of (keys, streams) batches
+    """
+    heap = _create_and_wrap_dary_heap(
+        _HeapType.HEAP_TYPE_DARY_IMPLICIT,
+        4,
+        (key_type, int),
+        value_type=None,
+        addressable=False,
+        mergeable=False,
+        double_ended=False,
+    )
+    if key_type == float:
+        zeros, top = _zeros_double_array, float("inf")
+    else:
+        zeros, top = _zeros_long_array, _LONG_MAX
+
+    last = {}
+
+    def fill(i, keys):
+        if keys is None or len(keys) == 0:
+            last.pop(i, None)
+            return
+        heap._insert_many(heap.handle, keys, i)
+        last[i] = keys[-1]
+
+    for i, keys in enumerate(first_chunks):
+        fill(i, keys)
+
+    while True:
+        if last:
+            bound_key, bound = min((k, i) for i, k in last.items())
+        else:
+            bound_key, bound = top, _LONG_MAX
+
+        while True:
+            keys = zeros(chunk)
+            streams = _zeros_long_array(chunk)
+            count = heap._delete_min_many_until(
+                heap.handle, bound_key, bound, keys, streams, chunk
+            )
+            if count < chunk:
+                del keys[count:]
+                del streams[count:]
+            if count > 0:
+                yield keys, streams
+            if count < chunk:
+                break
+
+        if not last:
+            return
+        fill(bound, read(bound))
+
+
+def _merge_arrays(arrays, key_type, chunk):
+    views = [memoryview(a) for a in arrays]
+    positions = [0] * len(views)
+
+    def read(i):
+        view = views[i][positions[i] : positions[i] + chunk]
+        positions[i] += len(view)
+        return view
+
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and all(isinstance(a, numpy.ndarray) for a in arrays):
+        dtype = arrays[0].dtype
+    else:
+        numpy = None
+
+    for keys, _ in _merge_keys(read, [read(i) for i in range(len(views))], key_type, chunk):
+        yield keys if numpy is None else numpy.frombuffer(keys, dtype=dtype)
+
+
+def _merge_iterables(iterables, key, key_type, chunk):
+    iterators = [iter(it) for it in iterables]
+    buffers = [deque() for _ in iterators]
+
+    def read_keys(i):
+        items = list(islice(iterators[i], chunk))
+        buffers[i].extend(items)
+        return items if key is None else [key(item) for item in items]
+
+    first_chunks = [read_keys(i) for i in range(len(iterators))]
+    if key_type is None:
+        all_int = all(isinstance(k, int) for keys in first_chunks for k in keys)
+        key_type = int if all_int else float
+    if key_type == float:
+        as_array = _as_double_array
+    elif key_type == int:
+        as_array = _as_long_array
+    else:
+        raise ValueError("Key type can only be float or int")
+
+    def read(i):
+        keys = read_keys(i)
+        return as_array(keys) if keys else None
+
+    first_chunks = [as_array(keys) if keys else None for keys in first_chunks]
+    pops = [b.popleft for b in buffers]
+    for _, streams in _merge_keys(read, first_chunks, key_type, chunk):
+        yield [pops[i]() for i in streams]
+
+
+def _merge(iterables, key, key_type, chunk):
+    chunk = int(chunk)
+    if chunk < 1:
+        raise ValueError("Chunk size must be positive")
+    if not iterables:
+        return iter(())
+
+    if key is None:
+        array_key_type = _array_key_type(iterables)
+        if array_key_type is not None and key_type in (None, array_key_type):
+            return _merge_arrays(iterables, array_key_type, chunk)
+    return _merge_iterables(iterables, key, key_type, chunk)
@@ -0,0 +1,446 @@
+import operator
+import sys
+
+from .. import backend
+from ..types import HeapType as _HeapType
+from ._wrappers import _HandleArray
+from ._heaps import _DoubleHeap, _LongHeap
+from ._addressable_heaps import (
+    _DoubleLongAddressableHeap,
+    _LongLongAddressableHeap,
+    _LongLongAddressableHeapHandle,
+)
+from ._addressable_any_heaps import (
+    _DoubleAnyAddressableHeap,
+    _LongAnyAddressableHeap,
+    _LongAnyAddressableHeapHandle,
+)
+from ._utils import (
+    _as_double_array,
+    _as_long_array,
+    _zeros_double_array,
+    _zeros_long_array,
+)
+
+_LONG_MIN = -(1 << 63)
+_LONG_MAX = (1 << 63) - 1
+_DOUBLE_MAX = sys.float_info.max
+
+
+def _shifted_key(key, offset):
+    """Shift an int key by the negative offset of a radix heap into the
+    non-negative keys of the backend heap.
+    """
+    key = operator.index(key) - offset
+    if key > _LONG_MAX:
+        raise ValueError("Key out of range")
+    return key
+
+
+def _shifted_keys(keys, offset):
+    """Shift int keys by the negative offset of a radix heap into a new buffer
+    of long integers. The keys are shifted by the backend without converting
+    them into Python objects.
+    """
+    keys = _as_long_array(keys)
+    if offset == 0:
+        return keys
+    result = _zeros_long_array(len(keys))
+    backend.jheaps_long_radix_keys_shift(keys, result, len(keys), offset, True)
+    return result
+
+
+def _unshift_keys_in_place(keys, offset):
+    """Shift keys of the backend heap back by the offset of a radix heap."""
+    if offset != 0:
+        backend.jheaps_long_radix_keys_shift(keys, keys, len(keys), offset, False)
+
+
+class _LongRadixHeap(_LongHeap):
+    """A radix heap with long integer keys which may be negative. Radix heaps of
+    the backend only support non-negative keys, thus keys are stored shifted
+    by the minimum key.
+    """
+
+    def __init__(self, handle, offset=0, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+        self._offset = offset
+
+    def insert(self, key):
+        super().insert(_shifted_key(key, self._offset))
+
+    def insert_many(self, keys):
+        super().insert_many(_shifted_keys(keys, self._offset))
+
+    def find_min(self):
+        return super().find_min() + self._offset
+
+    def delete_min(self):
+        return super().delete_min() + self._offset
+
+    def delete_min_many(self, k):
+        keys = super().delete_min_many(k)
+        _unshift_keys_in_place(keys, self._offset)
+        return keys
+
+    def __repr__(self):
+        return "_LongRadixHeap(%r, %r)" % (self._backend_handle, self._offset)
+
+
+class _LongLongAddressableRadixHeapHandle(_LongLongAddressableHeapHandle):
+    """A handle on an element of a radix heap with shifted long keys and long
+    integer values.
+    """
+
+    def __init__(self, handle, offset=0, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+        self._offset = offset
+
+    @property
+    def key(self):
+        return super().key + self._offset
+
+    def decrease_key(self, key):
+        super().decrease_key(_shifted_key(key, self._offset))
+
+    def __repr__(self):
+        return "_LongLongAddressableRadixHeapHandle(%r, %r)" % (
+            self._backend_handle,
+            self._offset,
+        )
+
+
+class _LongLongAddressableRadixHeap(_LongLongAddressableHeap):
+    """An addressable radix heap with long integer keys, which may be negative,
+    and long integer values. Keys are stored shifted by the minimum key.
+    """
+
+    def __init__(self, handle, offset=0, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+        self._offset = offset
+
+    def _handle_class(self, handle, **kwargs):
+        return _LongLongAddressableRadixHeapHandle(handle, self._offset, **kwargs)
+
+    def insert(self, key, value=None):
+        return super().insert(_shifted_key(key, self._offset), value)
+
+    def insert_many(self, keys, values=None):
+        return super().insert_many(_shifted_keys(keys, self._offset), values)
+
+    def get_keys(self, handles):
+        keys = super().get_keys(handles)
+        _unshift_keys_in_place(keys, self._offset)
+        return keys
+
+    def decrease_key_many(self, handles, keys):
+        super().decrease_key_many(handles, _shifted_keys(keys, self._offset))
+
+    def __repr__(self):
+        return "_LongLongAddressableRadixHeap(%r, %r)" % (
+            self._backend_handle,
+            self._offset,
+        )
+
+
+class _LongAnyAddressableRadixHeapHandle(_LongAnyAddressableHeapHandle):
+    """A handle on an element of a radix heap with shifted long keys and any
+    hashable value.
+    """
+
+    def __init__(self, handle, offset=0, **kwargs):
+        super().__init__(handle, **kwargs)
+        self._offset = offset
+
+    @property
+    def key(self):
+        return super().key + self._offset
+
+    def decrease_key(self, key):
+        super().decrease_key(_shifted_key(key, self._offset))
+
+    def __repr__(self):
+        return "_LongAnyAddressableRadixHeapHandle(%r, %r)" % (
+            self._backend_handle,
+            self._offset,
+        )
+
+
+class _LongAnyAddressableRadixHeap(_LongAnyAddressableHeap):
+    """An addressable radix heap with long integer keys, which may be negative,
+    and any hashable values. Keys are stored shifted by the minimum key.
+    """
+
+    def __init__(self, handle, offset=0, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+        self._offset = offset
+
+    def _handle_class(self, handle, **kwargs):
+        return _LongAnyAddressableRadixHeapHandle(handle, self._offset, **kwargs)
+
+    def insert(self, key, value):
+        return super().insert(_shifted_key(key, self._offset), value)
+
+    def decrease_key_many(self, handles, keys):
+        super().decrease_key_many(handles, _shifted_keys(keys, self._offset))
+
+    def __repr__(self):
+        return "_LongAnyAddressableRadixHeap(%r, %r)" % (
+            self._backend_handle,
+            self._offset,
+        )
+
+
+class _InferredMinRadixHeap:
+    """Mixin of radix heaps whose minimum key is the first inserted key, or the
+    minimum key of the first bulk insertion. The backend heap is created on
+    that insertion, thus the wrapper starts without a handle.
+    """
+
+    def __init__(self, create, **kwargs):
+        super().__init__(handle=None, **kwargs)
+        self._create = create
+
+    def _infer_min(self, keys):
+        """Create the backend heap, if not created yet, using the minimum of
+        some keys. Returns whether the backend heap exists.
+        """
+        if self._handle is None and len(keys) > 0:
+            self._backend_handle, self._offset = self._create(min(keys))
+        return self._backend_handle is not None
+
+    def insert(self, key, *args):
+        self._infer_min((key,))
+        return super().insert(key, *args)
+
+    def find_min(self):
+        if self._handle is None:
+            raise KeyError("Heap is empty")
+        return super().find_min()
+
+    def delete_min(self):
+        if self._handle is None:
+            raise KeyError("Heap is empty")
+        return super().delete_min()
+
+    def clear(self):
+        if self._handle is not None:
+            super().clear()
+
+    def __len__(self):
+        return 0 if self._handle is None else super().__len__()
+
+    def is_empty(self):
+        return self._handle is None or super().is_empty()
+
+    def _destroy(self):
+        if self._backend_handle is not None:
+            super()._destroy()
+
+
+class _InferredMinDoubleRadixHeap(_InferredMinRadixHeap, _DoubleHeap):
+    """A radix heap with floating point keys and an inferred minimum key."""
+
+    def insert_many(self, keys):
+        keys = _as_double_array(keys)
+        if self._infer_min(keys):
+            super().insert_many(keys)
+
+    def delete_min_many(self, k):
+        if self._handle is None:
+            return _zeros_double_array(0)
+        return super().delete_min_many(k)
+
+    def __repr__(self):
+        return "_InferredMinDoubleRadixHeap(%r)" % self._backend_handle
+
+
+class _InferredMinLongRadixHeap(_InferredMinRadixHeap, _LongRadixHeap):
+    """A radix heap with long integer keys and an inferred minimum key."""
+
+    def insert_many(self, keys):
+        keys = _as_long_array(keys)
+        if self._infer_min(keys):
+            super().insert_many(keys)
+
+    def delete_min_many(self, k):
+        if self._handle is None:
+            return _zeros_long_array(0)
+        return super().delete_min_many(k)
+
+    def __repr__(self):
+        return "_InferredMinLongRadixHeap(%r, %r)" % (
+            self._backend_handle,
+            self._offset,
+        )
+
+
+class _InferredMinDoubleLongAddressableRadixHeap(
+    _InferredMinRadixHeap, _DoubleLongAddressableHeap
+):
+    """An addressable radix heap with floating point keys, long integer values
+    and an inferred minimum key.
+    """
+
+    def insert_many(self, keys, values=None):
+        keys = _as_double_array(keys)
+        if self._infer_min(keys):
+            return super().insert_many(keys, values)
+        return _HandleArray(_zeros_long_array(0), self)
+
+    def __repr__(self):
+        return "_InferredMinDoubleLongAddressableRadixHeap(%r)" % self._backend_handle
+
+
+class _InferredMinDoubleAnyAddressableRadixHeap(
+    _InferredMinRadixHeap, _DoubleAnyAddressableHeap
+):
+    """An addressable radix heap with floating point keys, any hashable values
+    and an inferred minimum key.
+    """
+
+    def __repr__(self):
+        return "_InferredMinDoubleAnyAddressableRadixHeap(%r)" % self._backend_handle
+
+
+class _InferredMinLongLongAddressableRadixHeap(
+    _InferredMinRadixHeap, _LongLongAddressableRadixHeap
+):
+    """An addressable radix heap with long integer keys, long integer values
+    and an inferred minimum key.
+    """
+
+    def insert_many(self, keys, values=None):
+        keys = _as_long_array(keys)
+        if self._infer_min(keys):
+            return super().insert_many(keys, values)
+        return _HandleArray(_zeros_long_array(0), self)
+
+    def __repr__(self):
+        return "_InferredMinLongLongAddressableRadixHeap(%r, %r)" % (
+            self._backend_handle,
+            self._offset,
+        )
+
+
+class _InferredMinLongAnyAddressableRadixHeap(
+    _InferredMinRadixHeap, _LongAnyAddressableRadixHeap
+):
+    """An addressable radix heap with long integer keys, any hashable values
+    and an inferred minimum key.
+    """
+
+    def __repr__(self):
+        return "_InferredMinLongAnyAddressableRadixHeap(%r, %r)" % (
+            self._backend_handle,
+            self._offset,
+        )
+
+
+def _radix_range(key_type, min, max):
+    """Validate the key range of a radix heap and fill in the defaults. The
+    default range of int keys covers all non-negative 64-bit integers, or all
+    64-bit integers above a negative minimum.
+
+    The default max is the widest span even when the min is inferred. A max
+    taken from the first insertion would make the backend reject larger keys
+    inserted later. A wide span only costs a few more buckets, one per bit of
+    the span and thus at most 64, which stay empty unless keys are that far
+    apart: an element is redistributed according to its distance from the
+    last deleted minimum, not from the max.
+    """
+    if min is None:
+        min = key_type()
+    if not isinstance(min, key_type):
+        raise TypeError("Min value not valid")
+
+    if max is None:
+        if key_type == float:
+            max = _DOUBLE_MAX
+        else:
+            max = _LONG_MAX if min >= 0 else min + _LONG_MAX
+    if not isinstance(max, key_type):
+        raise TypeError("Max value not valid")
+
+    if key_type == int:
+        if min < _LONG_MIN or max > _LONG_MAX:
+            raise ValueError("Keys must be 64-bit integers")
+        if min < 0 and max - min > _LONG_MAX:
+            raise ValueError("The key range of a radix heap cannot exceed 2^63 - 1")
+    if min > max:
+        raise ValueError("Min value cannot be larger than max value")
+    return min, max
+
+
+def _create_radix_heap_handle(key_type, min, max, addressable):
+    """Create a backend radix heap for a validated key range. Radix heaps of the
+    backend size their buckets using the span of the range, and only support
+    non-negative long integer keys, thus negative int ranges are shifted.
+
+    :returns: the handle and the offset of the keys
+    """
+    if key_type == float:
+        heap_type = (
+            _HeapType.HEAP_TYPE_MONOTONE_ADDRESSABLE_DOUBLE_RADIX
+            if addressable
+            else _HeapType.HEAP_TYPE_MONOTONE_DOUBLE_RADIX
+        )
+        handle = backend.jheaps_double_radix_Heap_create(heap_type.value, min, max)
+        return handle, 0
+
+    heap_type = (
+        _HeapType.HEAP_TYPE_MONOTONE_ADDRESSABLE_LONG_RADIX
+        if addressable
+        else _HeapType.HEAP_TYPE_MONOTONE_LONG_RADIX
+    )
+    offset = min if min < 0 else 0
+    handle = backend.jheaps_long_radix_Heap_create(
+        heap_type.value, min - offset, max - offset
+    )
+    return handle, offset
+
+
+def _radix_heap_classes(key_type, value_type, addressable):
+    """Return the wrapper classes of a radix heap with a known and with an
+    inferred minimum key.
+    """
+    if not addressable:
+        if key_type == float:
+            return _DoubleHeap, _InferredMinDoubleRadixHeap
+        return _LongRadixHeap, _InferredMinLongRadixHeap
+    if key_type == float:
+        if value_type == int:
+            return _DoubleLongAddressableHeap, _InferredMinDoubleLongAddressableRadixHeap
+        return _DoubleAnyAddressableHeap, _InferredMinDoubleAnyAddressableRadixHeap
+    if value_type == int:
+        return _LongLongAddressableRadixHeap, _InferredMinLongLongAddressableRadixHeap
+    return _LongAnyAddressableRadixHeap, _InferredMinLongAnyAddressableRadixHeap
+
+
+def _create_and_wrap_radix_heap_with_range(
+    key_type, value_type, min, max, infer_min, addressable
+):
+    if key_type != float and key_type != int:
+        raise ValueError("Radix heaps support float or int keys")
+    heap_class, inferred_min_heap_class = _radix_heap_classes(
+        key_type, value_type, addressable
+    )
+
+    if not infer_min:
+        min, max = _radix_range(key_type, min, max)
+        handle, offset = _create_radix_heap_handle(key_type, min, max, addressable)
+        if key_type == float:
+            return heap_class(handle)
+        return heap_class(handle, offset)
+
+    if min is not None:
+        raise ValueError("Min value cannot be given when it is inferred")
+
+    def create(first):
+        first = float(first) if key_type == float else operator.index(first)
+        inferred_min, inferred_max = _radix_range(key_type, first, max)
+        return _create_radix_heap_handle(
+            key_type, inferred_min, inferred_max, addressable
+        )
+
+    return inferred_min_heap_class(create)
@@ -0,0 +1,80 @@
+from .. import backend
+
+import math
+from itertools import islice
+
+from ..types import HeapType as _HeapType
+from ._factories import _create_and_wrap_soft_heap
+from ._utils import (
+    _is_array_of,
+    _as_double_array,
+    _as_long_array,
+)
+
+# number of keys which are converted and inserted with each backend call
+# when the keys are not given as a buffer
+_CHUNK_SIZE = 1 << 16
+
+
+def _insert_keys(heap, keys, key_type):
+    """Insert a stream of keys into an addressable heap of float or int keys,
+    without keeping handles.
+    """
+    if key_type == float:
+        formats, as_array = ("d",), _as_double_array
+        insert_many = backend.jheaps_AHeap_D_insert_many
+    else:
+        formats, as_array = ("q", "l"), _as_long_array
+        insert_many = backend.jheaps_AHeap_L_insert_many
+
+    if _is_array_of(keys, formats):
+        insert_many(heap.handle, keys)
+        return
+
+    it = iter(keys)
+    while True:
+        chunk = as_array(islice(it, _CHUNK_SIZE))
+        if not chunk:
+            break
+        insert_many(heap.handle, chunk)
+
+
+def _soft_select(keys, rank, error_rate, key_type):
+    """Approximate selection using a soft heap. All keys are inserted and the
+    minimum is deleted as many times as the requested rank. The largest
+    deleted key has a rank between the requested rank and the requested
+    rank plus the error rate times the number of keys.
+
+    If rank is a callable it is called with the number of keys in order
+    to compute the rank.
+    """
+    if key_type != float and key_type != int:
+        raise ValueError("Key type can only be float or int")
+    if not 0.0 < error_rate < 1.0:
+        raise ValueError("Error rate must be in (0, 1)")
+
+    heap_type = _HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_BINARY_EXPLICIT_SOFT
+    heap = _create_and_wrap_soft_heap(heap_type, error_rate, key_type, int)
+    _insert_keys(heap, keys, key_type)
+
+    n = len(heap)
+    if n == 0:
+        raise ValueError("No keys")
+    if callable(rank):
+        rank = rank(n)
+    if not 1 <= rank <= n:
+        raise IndexError("Rank must be between 1 and the number of keys")
+
+    if key_type == float:
+        return backend.jheaps_AHeap_D_delete_min_many_max_key(heap.handle, rank)
+    return backend.jheaps_AHeap_L_delete_min_many_max_key(heap.handle, rank)
+
+
+def _percentile_rank(percentile):
+    if not 0 <= percentile <= 100:
+        raise ValueError("Percentile must be between 0 and 100")
+
+    def rank(n):
+        return max(1, math.ceil(percentile * n / 100))
+
+    return rank
@@ -0,0 +1,154 @@
+import operator
+from itertools import islice
+
+from ._factories import _create_and_wrap_bounded_heap
+from ._selection import _CHUNK_SIZE
+from ._utils import (
+    _is_array_of,
+    _as_double_array,
+    _as_long_array,
+)
+
+
+class TopK:
+    """Keep the k largest, or smallest, keys of a stream together with an
+    integer value for each key. The keys are kept in a d-ary heap of fixed
+    capacity whose root is the worst kept key. Once the heap is full, keys
+    which are not better than the root are rejected by the backend without
+    entering the heap, thus pushing a large array of keys is a single backend
+    call which mostly performs comparisons.
+
+    Values are 64-bit integers, for example indices into a separate list of
+    payloads. If no value is given, the value of a key is its position in the
+    stream of pushed keys. Equal keys are ranked by their values, the smaller
+    value first, thus by default ties are resolved as in a stable sort: of
+    several equal keys the earliest ones are kept and reported first.
+
+    :param k: the number of keys to keep
+    :type k: int
+    :param key_type: the key type
+    :type key_type: float or int
+    :param largest: whether to keep the largest or the smallest keys
+    :type largest: boolean
+    :param d: the degree of the d-ary heap
+    :type d: int
+    """
+
+    def __init__(self, k, key_type=float, largest=True, d=4):
+        k = operator.index(k)
+        self._heap = _create_and_wrap_bounded_heap(k, key_type, largest, d)
+        self._k = k
+        self._key_type = key_type
+        self._largest = largest
+        self._count = 0
+
+    @property
+    def k(self):
+        """The number of keys to keep."""
+        return self._k
+
+    @property
+    def largest(self):
+        """Whether the largest or the smallest keys are kept."""
+        return self._largest
+
+    def push(self, key, value=None):
+        """Push a key.
+
+        :param key: the key
+        :param value: the value, by default the position of the key in the stream
+        :type value: int or None
+        :returns: whether the key was kept
+        :rtype: boolean
+        """
+        if value is None:
+            value = self._count
+        self._count += 1
+        return self._heap.push(key, value)
+
+    def push_many(self, keys, values=None):
+        """Push many keys. For `float` and `int` keys any contiguous buffer of
+        64-bit elements (numpy arrays, array.array) is pushed using a single
+        backend call without copying. Other iterables are consumed in chunks.
+
+        :param keys: the keys
+        :param values: the values, by default the positions of the keys in the stream
+        :type values: iterable of int or None
+        :returns: the number of keys which were kept
+        :rtype: int
+        """
+        if self._key_type == float:
+            formats, as_array = ("d",), _as_double_array
+        else:
+            formats, as_array = ("q", "l"), _as_long_array
+
+        if values is not None:
+            keys = as_array(keys)
+            values = _as_long_array(values)
+            if len(values) != len(keys):
+                raise ValueError("Keys and values must have the same length")
+            self._count += len(keys)
+            return self._heap.push_many(keys, values, 0)
+
+        if _is_array_of(keys, formats):
+            first = self._count
+            self._count += len(keys)
+            return self._heap.push_many(keys, None, first)
+
+        kept = 0
+        it = iter(keys)
+        while True:
+            chunk = as_array(islice(it, _CHUNK_SIZE))
+            if not chunk:
+                break
+            first = self._count
+            self._count += len(chunk)
+            kept += self._heap.push_many(chunk, None, first)
+        return kept
+
+    def result(self):
+        """Return the kept keys and their values, best first. That is in
+        descending order of keys if the largest keys are kept and in ascending
+        order otherwise, and equal keys in ascending order of values. The kept
+        keys are not removed.
+
+        :returns: the keys and the values
+        :rtype: tuple of two array.array
+        """
+        return self._heap.result()
+
+    def clear(self):
+        """Remove all kept keys. Values of subsequent keys again start from zero."""
+        self._heap.clear()
+        self._count = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __repr__(self):
+        return "TopK(%r, %r, largest=%r)" % (self._k, self._key_type, self._largest)
+
+
+def _as_key_array(keys):
+    """Return the keys as a buffer of doubles or long integers together with
+    the key type. Buffers are used as is, other iterables are copied into an
+    array of long integers if all keys are int and of doubles otherwise.
+    """
+    if _is_array_of(keys, ("d",)):
+        return float, keys
+    if _is_array_of(keys, ("q", "l")):
+        return int, keys
+    keys = list(keys)
+    if all(isinstance(key, int) for key in keys):
+        return int, _as_long_array(keys)
+    return float, _as_double_array(keys)
+
+
+def _select(k, keys, largest):
+    """Select the k smallest or largest keys, best first, together with their
+    positions.
+    """
+    key_type, keys = _as_key_array(keys)
+    t = TopK(max(0, min(k, len(keys))), key_type=key_type, largest=largest)
+    t.push_many(keys)
+    return t.result()
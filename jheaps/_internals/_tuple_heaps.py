@@ -0,0 +1,416 @@
+from .. import backend
+from ..types import (
+    DoubleEndedHeap,
+    DoubleEndedAddressableHeap,
+    DoubleEndedAddressableHeapHandle,
+    MergeableHeap,
+)
+from ._heaps import _BaseHeap
+from ._addressable_heaps import (
+    _BaseAddressableHeap,
+    _BaseLongValueAddressableHeapHandle,
+)
+from ._wrappers import _HandleArray, _handle_ids
+
+
+class _TupleHeap(_BaseHeap):
+    """A Heap with composite keys of two numbers. The keys are stored and
+    compared lexicographically by the backend. Subclasses select the backend
+    functions of the key type.
+    """
+
+    _insert_key = None
+    _find_min = None
+    _delete_min = None
+    # bulk operations on keys sharing their second number, used by merge
+    _insert_many = None
+    _delete_min_many_until = None
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def insert(self, key):
+        first, second = key
+        self._insert_key(self._handle, first, second)
+
+    def find_min(self):
+        return tuple(self._find_min(self._handle))
+
+    def delete_min(self):
+        return tuple(self._delete_min(self._handle))
+
+    def clear(self):
+        # The keys are allocated by the backend and freed one by one
+        backend.jheaps_Heap_composite_clear(self._handle)
+
+    def _destroy(self):
+        backend.jheaps_Heap_composite_clear(self._handle)
+        super()._destroy()
+
+    def __repr__(self):
+        return "_TupleHeap(%r)" % self._backend_handle
+
+
+class _DoubleEndedTupleHeap(_TupleHeap, DoubleEndedHeap):
+    """A double ended heap with composite keys of two numbers."""
+
+    _find_max = None
+    _delete_max = None
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def find_max(self):
+        return tuple(self._find_max(self._handle))
+
+    def delete_max(self):
+        return tuple(self._delete_max(self._handle))
+
+    def __repr__(self):
+        return "_DoubleEndedTupleHeap(%r)" % self._backend_handle
+
+
+class _DoubleLongTupleHeap(_TupleHeap):
+    """A Heap with (float, int) keys."""
+
+    _insert_key = staticmethod(backend.jheaps_Heap_DL_insert_key)
+    _find_min = staticmethod(backend.jheaps_Heap_DL_find_min)
+    _delete_min = staticmethod(backend.jheaps_Heap_DL_delete_min)
+    _insert_many = staticmethod(backend.jheaps_Heap_DL_insert_many)
+    _delete_min_many_until = staticmethod(backend.jheaps_Heap_DL_delete_min_many_until)
+
+    def __repr__(self):
+        return "_DoubleLongTupleHeap(%r)" % self._backend_handle
+
+
+class _DoubleEndedDoubleLongTupleHeap(_DoubleEndedTupleHeap):
+    """A double ended heap with (float, int) keys."""
+
+    _insert_key = staticmethod(backend.jheaps_Heap_DL_insert_key)
+    _find_min = staticmethod(backend.jheaps_Heap_DL_find_min)
+    _delete_min = staticmethod(backend.jheaps_Heap_DL_delete_min)
+    _find_max = staticmethod(backend.jheaps_DEHeap_DL_find_max)
+    _delete_max = staticmethod(backend.jheaps_DEHeap_DL_delete_max)
+
+    def __repr__(self):
+        return "_DoubleEndedDoubleLongTupleHeap(%r)" % self._backend_handle
+
+
+class _LongLongTupleHeap(_TupleHeap):
+    """A Heap with (int, int) keys."""
+
+    _insert_key = staticmethod(backend.jheaps_Heap_LL_insert_key)
+    _find_min = staticmethod(backend.jheaps_Heap_LL_find_min)
+    _delete_min = staticmethod(backend.jheaps_Heap_LL_delete_min)
+    _insert_many = staticmethod(backend.jheaps_Heap_LL_insert_many)
+    _delete_min_many_until = staticmethod(backend.jheaps_Heap_LL_delete_min_many_until)
+
+    def __repr__(self):
+        return "_LongLongTupleHeap(%r)" % self._backend_handle
+
+
+class _DoubleEndedLongLongTupleHeap(_DoubleEndedTupleHeap):
+    """A double ended heap with (int, int) keys."""
+
+    _insert_key = staticmethod(backend.jheaps_Heap_LL_insert_key)
+    _find_min = staticmethod(backend.jheaps_Heap_LL_find_min)
+    _delete_min = staticmethod(backend.jheaps_Heap_LL_delete_min)
+    _find_max = staticmethod(backend.jheaps_DEHeap_LL_find_max)
+    _delete_max = staticmethod(backend.jheaps_DEHeap_LL_delete_max)
+
+    def __repr__(self):
+        return "_DoubleEndedLongLongTupleHeap(%r)" % self._backend_handle
+
+
+class _TupleLongAddressableHeapHandle(_BaseLongValueAddressableHeapHandle):
+    """A handle on an element in a heap. This handle supports composite keys
+    of two numbers and long integer values. The key is owned by the heap while
+    the element is in the heap and by the handle after its deletion.
+    """
+
+    _get_key = None
+    _decrease_key = None
+
+    def __init__(self, handle, key_owner=False, heap=None, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+        self._key_owner = key_owner
+        # Keep the heap alive while its element is referenced, since the
+        # heap frees the keys it owns when garbage collected
+        self._heap = heap
+
+    @property
+    def key(self):
+        return tuple(self._get_key(self._handle))
+
+    def decrease_key(self, key):
+        first, second = key
+        self._decrease_key(self._handle, first, second)
+
+    def delete(self):
+        backend.jheaps_AHeapHandle_delete(self._handle)
+        # Take ownership due to deletion from the heap
+        self._key_owner = True
+        self._heap = None
+
+    def _destroy(self):
+        if self._key_owner:
+            backend.jheaps_AHeapHandle_composite_key_destroy(self._handle)
+        super()._destroy()
+
+    def __repr__(self):
+        return "_TupleLongAddressableHeapHandle(%r)" % self._backend_handle
+
+
+class _DoubleEndedTupleLongAddressableHeapHandle(
+    _TupleLongAddressableHeapHandle, DoubleEndedAddressableHeapHandle
+):
+    """A double ended handle on an element in a heap. This handle supports
+    composite keys of two numbers and long integer values.
+    """
+
+    _increase_key = None
+
+    def __init__(self, handle, key_owner=False, **kwargs):
+        super().__init__(handle, key_owner, **kwargs)
+
+    def increase_key(self, key):
+        first, second = key
+        self._increase_key(self._handle, first, second)
+
+    def __repr__(self):
+        return "_DoubleEndedTupleLongAddressableHeapHandle(%r)" % self._backend_handle
+
+
+class _DoubleLongTupleLongAddressableHeapHandle(_TupleLongAddressableHeapHandle):
+    _get_key = staticmethod(backend.jheaps_AHeapHandle_DL_get_key)
+    _decrease_key = staticmethod(backend.jheaps_AHeapHandle_DL_decrease_key)
+
+
+class _DoubleEndedDoubleLongTupleLongAddressableHeapHandle(
+    _DoubleEndedTupleLongAddressableHeapHandle
+):
+    _get_key = staticmethod(backend.jheaps_AHeapHandle_DL_get_key)
+    _decrease_key = staticmethod(backend.jheaps_AHeapHandle_DL_decrease_key)
+    _increase_key = staticmethod(backend.jheaps_DEAHeapHandle_DL_increase_key)
+
+
+class _LongLongTupleLongAddressableHeapHandle(_TupleLongAddressableHeapHandle):
+    _get_key = staticmethod(backend.jheaps_AHeapHandle_LL_get_key)
+    _decrease_key = staticmethod(backend.jheaps_AHeapHandle_LL_decrease_key)
+
+
+class _DoubleEndedLongLongTupleLongAddressableHeapHandle(
+    _DoubleEndedTupleLongAddressableHeapHandle
+):
+    _get_key = staticmethod(backend.jheaps_AHeapHandle_LL_get_key)
+    _decrease_key = staticmethod(backend.jheaps_AHeapHandle_LL_decrease_key)
+    _increase_key = staticmethod(backend.jheaps_DEAHeapHandle_LL_increase_key)
+
+
+class _TupleLongAddressableHeap(_BaseAddressableHeap):
+    """An addressable heap with composite keys of two numbers and long values.
+    Subclasses select the backend functions of the key type and the handle class.
+    """
+
+    _insert_key_value = None
+    _handle_class = None
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def insert(self, key, value=None):
+        if value is None:
+            value = int()
+        first, second = key
+        res = self._insert_key_value(self._handle, first, second, value)
+        return self._handle_class(res, heap=self)
+
+    def find_min(self):
+        res = backend.jheaps_AHeap_find_min(self._handle)
+        return self._handle_class(res, heap=self)
+
+    def delete_min(self):
+        res = backend.jheaps_AHeap_delete_min(self._handle)
+        # pass key ownership to handle
+        return self._handle_class(res, key_owner=True)
+
+    def delete_many(self, handles):
+        """Delete many elements using a single backend call. Each handle takes
+        ownership of the key of its deleted element.
+
+        :param handles: the handles
+        """
+        if not isinstance(handles, _HandleArray):
+            handles = list(handles)
+        # Handle arrays are never returned by these heaps, thus only handle
+        # objects pass the check and can take ownership of the keys
+        backend.jheaps_AHeapHandle_delete_many(_handle_ids(handles, self))
+        for h in handles:
+            h._key_owner = True
+            h._heap = None
+
+    def clear(self):
+        # The keys are allocated by the backend and freed one by one
+        backend.jheaps_AHeap_composite_clear(self._handle)
+
+    def _destroy(self):
+        backend.jheaps_AHeap_composite_clear(self._handle)
+        super()._destroy()
+
+    def __repr__(self):
+        return "_TupleLongAddressableHeap(%r)" % self._backend_handle
+
+
+class _DoubleEndedTupleLongAddressableHeap(
+    _TupleLongAddressableHeap, DoubleEndedAddressableHeap
+):
+    """A double ended addressable heap with composite keys of two numbers and
+    long values.
+    """
+
+    def __init__(self, handle, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+
+    def find_max(self):
+        res = backend.jheaps_DEAHeap_find_max(self._handle)
+        return self._handle_class(res, heap=self)
+
+    def delete_max(self):
+        res = backend.jheaps_DEAHeap_delete_max(self._handle)
+        # pass key ownership to handle
+        return self._handle_class(res, key_owner=True)
+
+    def __repr__(self):
+        return "_DoubleEndedTupleLongAddressableHeap(%r)" % self._backend_handle
+
+
+class _DoubleLongTupleLongAddressableHeap(_TupleLongAddressableHeap):
+    """An addressable heap with (float, int) keys and long values."""
+
+    _insert_key_value = staticmethod(backend.jheaps_AHeap_DL_insert_key_value)
+    _handle_class = _DoubleLongTupleLongAddressableHeapHandle
+
+
+class _DoubleEndedDoubleLongTupleLongAddressableHeap(
+    _DoubleEndedTupleLongAddressableHeap
+):
+    """A double ended addressable heap with (float, int) keys and long values."""
+
+    _insert_key_value = staticmethod(backend.jheaps_AHeap_DL_insert_key_value)
+    _handle_class = _DoubleEndedDoubleLongTupleLongAddressableHeapHandle
+
+
+class _LongLongTupleLongAddressableHeap(_TupleLongAddressableHeap):
+    """An addressable heap with (int, int) keys and long values."""
+
+    _insert_key_value = staticmethod(backend.jheaps_AHeap_LL_insert_key_value)
+    _handle_class = _LongLongTupleLongAddressableHeapHandle
+
+
+class _DoubleEndedLongLongTupleLongAddressableHeap(
+    _DoubleEndedTupleLongAddressableHeap
+):
+    """A double ended addressable heap with (int, int) keys and long values."""
+
+    _insert_key_value = staticmethod(backend.jheaps_AHeap_LL_insert_key_value)
+    _handle_class = _DoubleEndedLongLongTupleLongAddressableHeapHandle
+
+
+class _TupleLongMergeableAddressableHeap(MergeableHeap):
+    """Mixin for mergeable and addressable heaps with composite keys. The keys
+    of the other heap are moved together with its elements.
+    """
+
+    def meld(self, other):
+        self._check_same_isolate(other)
+        backend.jheaps_MAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
+
+
+class _DoubleEndedTupleLongMergeableAddressableHeap(MergeableHeap):
+    """Mixin for double ended mergeable and addressable heaps with composite keys."""
+
+    def meld(self, other):
+        self._check_same_isolate(other)
+        backend.jheaps_MDEAHeap_L_meld(self._handle, other._handle)
+        # Handles of the other heap now refer to elements of this heap,
+        # which must be kept alive as long as the other heap
+        other._melded_into = self
+
+
+class _DoubleLongTupleLongMergeableAddressableHeap(
+    _DoubleLongTupleLongAddressableHeap, _TupleLongMergeableAddressableHeap
+):
+    def __repr__(self):
+        return "_DoubleLongTupleLongMergeableAddressableHeap(%r)" % self._backend_handle
+
+
+class _DoubleEndedDoubleLongTupleLongMergeableAddressableHeap(
+    _DoubleEndedDoubleLongTupleLongAddressableHeap,
+    _DoubleEndedTupleLongMergeableAddressableHeap,
+):
+    def __repr__(self):
+        return "_DoubleEndedDoubleLongTupleLongMergeableAddressableHeap(%r)" % self._backend_handle
+
+
+class _LongLongTupleLongMergeableAddressableHeap(
+    _LongLongTupleLongAddressableHeap, _TupleLongMergeableAddressableHeap
+):
+    def __repr__(self):
+        return "_LongLongTupleLongMergeableAddressableHeap(%r)" % self._backend_handle
+
+
+class _DoubleEndedLongLongTupleLongMergeableAddressableHeap(
+    _DoubleEndedLongLongTupleLongAddressableHeap,
+    _DoubleEndedTupleLongMergeableAddressableHeap,
+):
+    def __repr__(self):
+        return "_DoubleEndedLongLongTupleLongMergeableAddressableHeap(%r)" % self._backend_handle
+
+
+# tuple key types supported by the backend, mapped to the backend comparator
+# and the wrapper classes (non-addressable, addressable, mergeable addressable),
+# each as a pair of (min heap, double ended heap)
+_TUPLE_KEY_TYPES = {
+    (float, int): (
+        backend.jheaps_get_DL_comparator,
+        (_DoubleLongTupleHeap, _DoubleEndedDoubleLongTupleHeap),
+        (_DoubleLongTupleLongAddressableHeap, _DoubleEndedDoubleLongTupleLongAddressableHeap),
+        (
+            _DoubleLongTupleLongMergeableAddressableHeap,
+            _DoubleEndedDoubleLongTupleLongMergeableAddressableHeap,
+        ),
+    ),
+    (int, int): (
+        backend.jheaps_get_LL_comparator,
+        (_LongLongTupleHeap, _DoubleEndedLongLongTupleHeap),
+        (_LongLongTupleLongAddressableHeap, _DoubleEndedLongLongTupleLongAddressableHeap),
+        (
+            _LongLongTupleLongMergeableAddressableHeap,
+            _DoubleEndedLongLongTupleLongMergeableAddressableHeap,
+        ),
+    ),
+}
+
+
+def _is_tuple_key_type(key_type):
+    return isinstance(key_type, tuple) and key_type in _TUPLE_KEY_TYPES
+
+
+def _tuple_key_comparator(key_type):
+    """Return the address of the backend comparator of a tuple key type."""
+    return _TUPLE_KEY_TYPES[key_type][0]()
+
+
+def _wrap_tuple_heap(handle, key_type, value_type, addressable, mergeable, double_ended):
+    _, heaps, addressable_heaps, mergeable_heaps = _TUPLE_KEY_TYPES[key_type]
+    if addressable:
+        if value_type != int:
+            backend.jheaps_handles_destroy(handle)
+            raise ValueError("Tuple keys only support int values")
+        classes = mergeable_heaps if mergeable else addressable_heaps
+    else:
+        classes = heaps
+    return classes[1 if double_ended else 0](handle)
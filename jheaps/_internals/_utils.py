@@ -1,5 +1,6 @@
 import sys
 import ctypes
+from array import array
 
 _c_inc_ref = ctypes.pythonapi.Py_IncRef
 _c_inc_ref.argtypes = [ctypes.py_object]
@@ -43,31 +44,47 @@ def _id_to_obj(id):
     return ctypes.cast(id, ctypes.py_object).value
 
 
-def _id_comparator(a_id, b_id): 
-    """A comparator which accepts as input the ids of two python objects
-    and compares them.
+def _is_array_of(obj, formats):
+    """Check whether an object exposes a contiguous one-dimensional buffer
+    of 64-bit elements in one of the given formats.
     """
-    a = _id_to_obj(a_id)
-    b = _id_to_obj(b_id)
-
-    if a.__lt__(b): 
-        return -1
-    if a.__eq__(b): 
-        return 0
-    return 1
-
-
-def _create_wrapped_id_comparator_callback(callback): 
-    if callback is not None:
-        # wrap the comparator with a ctypes function pointer
-        callback_type = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong)
-        f = callback_type(callback)
-
-        # get the function pointer of the ctypes wrapper by casting it to void* and taking its value
-        # we perform the reverse using typemaps on the SWIG layer
-        f_ptr = ctypes.cast(f, ctypes.c_void_p).value
-
-        # make sure to also return the callback to avoid garbage collection
-        return (f_ptr, f)
-    else: 
-        return (0, None)
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return False
+    return (
+        view.ndim == 1
+        and view.c_contiguous
+        and view.itemsize == 8
+        and view.format.lstrip("@=") in formats
+    )
+
+
+def _as_double_array(keys):
+    """Return the keys as a contiguous buffer of doubles. Objects which already
+    expose such a buffer (numpy arrays, array.array, memoryview) are returned
+    as is, anything else is copied.
+    """
+    if _is_array_of(keys, ("d",)):
+        return keys
+    return array("d", keys)
+
+
+def _as_long_array(keys):
+    """Return the keys as a contiguous buffer of long integers. Objects which
+    already expose such a buffer (numpy arrays, array.array, memoryview) are
+    returned as is, anything else is copied.
+    """
+    if _is_array_of(keys, ("q", "l")):
+        return keys
+    return array("q", keys)
+
+
+def _zeros_double_array(size):
+    """Create an array of doubles with the given size, filled with zeros."""
+    return array("d", bytes(8 * size))
+
+
+def _zeros_long_array(size):
+    """Create an array of long integers with the given size, filled with zeros."""
+    return array("q", bytes(8 * size))
@@ -1,25 +1,123 @@
 from .. import backend
-from collections import namedtuple
-from collections.abc import Iterator
+
+from array import array
+
+from ._isolates import _current_isolate, _entered_isolate
 
 
 class _HandleWrapper:
     """A handle wrapper. Keeps a handle to a backend object and cleans up
-       on deletion.
+       on deletion. The handle belongs to the isolate which was selected
+       when the wrapper was created.
     """
 
     def __init__(self, handle, **kwargs):
-        self._handle = handle
+        self._backend_handle = handle
+        self._isolate = _current_isolate()
         super().__init__()
 
+    @property
+    def _handle(self):
+        """The backend handle, which can only be used in the isolate of the
+        wrapper. Using it in another isolate would corrupt the memory of
+        the backend.
+        """
+        if self._isolate != _current_isolate():
+            raise ValueError("Handle belongs to a different isolate")
+        return self._backend_handle
+
     @property
     def handle(self):
         return self._handle
 
     def __del__(self):
         if backend.jheaps_is_initialized():
-            backend.jheaps_handles_destroy(self._handle)
+            if self._isolate == _current_isolate():
+                self._destroy()
+            else:
+                # the garbage collector may run in any isolate
+                with _entered_isolate(self._isolate):
+                    self._destroy()
+
+    def _destroy(self):
+        """Release the backend object. Called in the isolate of the handle."""
+        backend.jheaps_handles_destroy(self._handle)
+
+    def _check_same_isolate(self, other):
+        if self._isolate != other._isolate:
+            raise ValueError("Heaps belong to different isolates")
 
     def __repr__(self):
-        return "_HandleWrapper(%r)" % self._handle
+        return "_HandleWrapper(%r)" % self._backend_handle
+
+
+class _HandleArray:
+    """An array of handles to backend objects. The handles are kept as a compact
+       array of 64-bit ids, instead of one wrapper per handle, and all of them
+       are cleaned up on deletion. The array records the heap which owns the
+       elements of its handles.
+    """
+
+    def __init__(self, ids, heap, base=None, **kwargs):
+        self._ids = ids
+        self._heap = heap
+        # A slice keeps the array whose handles it refers to alive and
+        # leaves the cleanup to it
+        self._base = base
+        self._isolate = _current_isolate() if base is None else base._isolate
+        super().__init__()
+
+    @property
+    def ids(self):
+        """The handle ids as an array of 64-bit integers. The ids are only valid
+        as long as this object is alive.
+        """
+        return self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _HandleArray(self._ids[index], self._heap, base=self)
+        return self._ids[index]
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __del__(self):
+        if self._base is None and backend.jheaps_is_initialized():
+            with _entered_isolate(self._isolate):
+                backend.jheaps_handles_destroy_many(self._ids)
+
+    def __repr__(self):
+        return "_HandleArray(%r)" % self._ids
+
+
+def _heap_owner(heap):
+    """Return the heap which owns the elements of a heap, following melds."""
+    while getattr(heap, "_melded_into", None) is not None:
+        heap = heap._melded_into
+    return heap
+
+
+def _handle_ids(handles, heap):
+    """Return the ids of a collection of handles of a heap as a contiguous
+    buffer of 64-bit integers. The collection can be a handle array or a
+    sequence of handle objects, returned by the heap.
+    """
+    if isinstance(handles, _HandleArray):
+        if _heap_owner(handles._heap) is not heap:
+            raise ValueError("Handles belong to a different heap")
+        if handles._isolate != _current_isolate():
+            raise ValueError("Handles belong to a different isolate")
+        return handles.ids
 
+    ids = array("q")
+    for h in handles:
+        if not isinstance(h, _HandleWrapper):
+            raise TypeError("Expected handles returned by the heap")
+        if _heap_owner(getattr(h, "_heap", None)) is not heap:
+            raise ValueError("Handles belong to a different heap")
+        ids.append(int(h.handle))
+    return ids
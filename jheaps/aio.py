@@ -0,0 +1,129 @@
+"""
+Asyncio priority queues backed by heaps.
+
+The queues follow the interface of :py:class:`asyncio.PriorityQueue` and can be
+used as drop-in replacements.
+"""
+
+import asyncio
+
+from . import create_addressable_pairing_heap
+from .types import AddressableHeap
+
+
+class PriorityQueue(asyncio.PriorityQueue):
+    """A priority queue for use with asyncio which retrieves entries in priority
+    order (lowest first). It supports the same interface as
+    :py:class:`asyncio.PriorityQueue` but stores its entries in a heap created
+    by one of the `create_*` factory functions.
+
+    When the heap is addressable, which is the default, `put` and `put_nowait`
+    return a handle of the entry. The handle can later be used in order to
+    reprioritize or remove the entry while it is still in the queue, without
+    reinserting it.
+
+    The default key type is `object`, thus any entries compared by Python, such
+    as `(priority, data)` tuples, can be put into the queue. Unlike
+    :py:class:`jheaps.queue.PriorityQueue`, whose default key type is `float`,
+    numeric entries are stored natively only when passing `key_type=float` or
+    `key_type=int`.
+
+    :param maxsize: upper bound on the number of entries, zero or less for an
+      unbounded queue
+    :type maxsize: int
+    :param factory: the heap factory function, by default an addressable pairing heap
+    :type factory: callable
+    :param key_type: the key type of the heap, by default object
+    :type key_type: float, int, a tuple key type or object
+    :param kwargs: additional keyword arguments passed to the factory
+    """
+
+    def __init__(self, maxsize=0, factory=None, key_type=object, **kwargs):
+        self._factory = (
+            factory if factory is not None else create_addressable_pairing_heap
+        )
+        self._key_type = key_type
+        self._factory_kwargs = kwargs
+        super().__init__(maxsize)
+
+    def put_nowait(self, item):
+        """Put an entry into the queue without blocking.
+
+        :param item: the entry
+        :returns: the handle of the entry if the heap is addressable, otherwise None
+        :raises asyncio.QueueFull: if no free slot is immediately available
+        """
+        super().put_nowait(item)
+        handle, self._put_handle = self._put_handle, None
+        return handle
+
+    async def get_many(self, n):
+        """Remove and return up to n entries from the queue in priority order.
+        If the queue is empty, wait until an entry is available.
+
+        Heaps with `float` or `int` keys delete all entries after the first
+        one using a single backend call.
+
+        :param n: the maximum number of entries
+        :type n: int
+        :returns: the entries
+        :rtype: list
+        """
+        if n < 1:
+            return []
+        items = [await self.get()]
+        count = min(n - 1, self.qsize())
+        if count > 0:
+            delete_min_many = getattr(self._queue, "delete_min_many", None)
+            if delete_min_many is not None:
+                items.extend(delete_min_many(count).tolist())
+            else:
+                items.extend(self._get() for _ in range(count))
+            for _ in range(count):
+                self._wakeup_next(self._putters)
+        return items
+
+    def decrease_key(self, handle, item):
+        """Decrease the priority of an entry which is still in the queue.
+
+        :param handle: the handle returned when the entry was put into the queue
+        :param item: the new entry, which must not be larger than the old one
+        """
+        handle.decrease_key(item)
+
+    def remove(self, handle):
+        """Remove an entry which is still in the queue. The entry counts as a
+        completed task for the purpose of `join`.
+
+        :param handle: the handle returned when the entry was put into the queue
+        """
+        handle.delete()
+        self._wakeup_next(self._putters)
+        self.task_done()
+
+    def _format(self):
+        # heaps cannot be listed, unlike the list of asyncio.PriorityQueue
+        result = "maxsize=%r _queue=%r" % (self._maxsize, self._queue)
+        if self._getters:
+            result += " _getters[%d]" % len(self._getters)
+        if self._putters:
+            result += " _putters[%d]" % len(self._putters)
+        if self._unfinished_tasks:
+            result += " tasks=%d" % self._unfinished_tasks
+        return result
+
+    # The following are called by asyncio.Queue
+
+    def _init(self, maxsize):
+        self._queue = self._factory(key_type=self._key_type, **self._factory_kwargs)
+        self._addressable = isinstance(self._queue, AddressableHeap)
+        self._put_handle = None
+
+    def _put(self, item):
+        # the handle is returned by put_nowait
+        self._put_handle = self._queue.insert(item)
+
+    def _get(self):
+        if self._addressable:
+            return self._queue.delete_min().key
+        return self._queue.delete_min()
@@ -1,37 +1,204 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
 #include <stdlib.h>
 #include <stdio.h>
+#include <stdint.h>
+#include <string.h>
 
 #include <jheaps_capi_types.h>
 #include <jheaps_capi.h>
 
 #ifdef _WIN32
+#include <windows.h>
 #define THREAD_LOCAL __declspec( thread )
+#define ATOMIC_INCREMENT(x) InterlockedIncrement64(&(x))
+#define ATOMIC_DECREMENT(x) InterlockedDecrement64(&(x))
+#define ATOMIC_LOAD(x) InterlockedCompareExchange64(&(x), 0, 0)
 #else
+#include <pthread.h>
 #define THREAD_LOCAL __thread 
+#define ATOMIC_INCREMENT(x) __atomic_add_fetch(&(x), 1, __ATOMIC_SEQ_CST)
+#define ATOMIC_DECREMENT(x) __atomic_sub_fetch(&(x), 1, __ATOMIC_SEQ_CST)
+#define ATOMIC_LOAD(x) __atomic_load_n(&(x), __ATOMIC_SEQ_CST)
 #endif
 
-// single graalVM isolate
+// default graalVM isolate
 static graal_isolate_t *isolate = NULL;
 
-// thread local variable
+// thread local variable, the isolate thread of the isolate selected by
+// the current thread
 static THREAD_LOCAL graal_isolatethread_t *thread = NULL;
 
-// library init
-void jheaps_init() {
-    // do we need to synchronize here, or does the GIL protect us?
-    if (isolate == NULL) { 
-        // create isolate and attach thread
-        if (graal_create_isolate(NULL, &isolate, &thread) != 0) {
-            fprintf(stderr, "graal_create_isolate error\n");
-            exit(EXIT_FAILURE);
-        }
-    } else if (thread == NULL) {
-        // attach thread
-        if (graal_attach_thread(isolate, &thread) != 0) { 
-            fprintf(stderr, "graal_attach_thread error\n");
-            exit(EXIT_FAILURE);
+// pool of isolates, the first one is the default isolate
+#define MAX_ISOLATES 64
+static graal_isolate_t *isolates[MAX_ISOLATES];
+static int isolates_count = 0;
+
+// isolate selected by the current thread and its isolate threads
+static THREAD_LOCAL int current_isolate = 0;
+static THREAD_LOCAL graal_isolatethread_t *isolate_threads[MAX_ISOLATES];
+
+// number of attached isolate threads and total number of detached ones,
+// updated atomically since threads attach while the GIL is released
+static volatile long long int attached_threads = 0;
+static volatile long long int detached_threads = 0;
+
+// thread specific key whose destructor detaches a thread on exit
+#ifdef _WIN32
+static DWORD thread_exit_key = FLS_OUT_OF_INDEXES;
+#else
+static pthread_key_t thread_exit_key;
+#endif
+static int thread_exit_key_created = 0;
+
+// detach the current thread from all isolates
+static void detach_thread() {
+    int i;
+    for (i = 0; i < isolates_count; i++) {
+        if (isolate_threads[i] != NULL) {
+            graal_detach_thread(isolate_threads[i]);
+            isolate_threads[i] = NULL;
+            ATOMIC_DECREMENT(attached_threads);
+            ATOMIC_INCREMENT(detached_threads);
         }
     }
+    thread = NULL;
+}
+
+#ifdef _WIN32
+static void WINAPI on_thread_exit(void *value) {
+#else
+static void on_thread_exit(void *value) {
+#endif
+    if (value != NULL) {
+        detach_thread();
+    }
+}
+
+// account for a new isolate thread and make sure the current thread
+// gets detached on exit
+static void thread_attached() {
+    ATOMIC_INCREMENT(attached_threads);
+    if (thread_exit_key_created) {
+#ifdef _WIN32
+        FlsSetValue(thread_exit_key, (void *) 1);
+#else
+        pthread_setspecific(thread_exit_key, (void *) 1);
+#endif
+    }
+}
+
+// attach the current thread to an isolate of the pool
+static int attach_thread(int index) {
+    if (graal_attach_thread(isolates[index], &isolate_threads[index]) != 0) {
+        return -1;
+    }
+    thread_attached();
+    return 0;
+}
+
+// errors raised by this layer itself and not by the backend
+static THREAD_LOCAL status_t local_errno = STATUS_SUCCESS;
+static THREAD_LOCAL char *local_errno_msg = NULL;
+
+static int set_local_errno(status_t status, char *msg) {
+    local_errno = status;
+    local_errno_msg = msg;
+    return status;
+}
+
+// parameters of the isolates, which are read when an isolate is created,
+// the runtime options follow the program name as in a command line
+#define MAX_ISOLATE_OPTIONS 64
+static char *isolate_options[MAX_ISOLATE_OPTIONS + 1] = { "jheaps" };
+static int isolate_options_count = 1;
+static long long int isolate_reserved_address_space_size = 0;
+
+// create an isolate using the configured parameters, the reserved address
+// space size is the only documented parameter. The runtime options are passed
+// as the argc/argv fields of version 3 of the parameters, which are reserved
+// and only used when the GraalVM headers of the capi declare them, see
+// JHEAPS_ISOLATE_ARGUMENTS in setup.py
+static int create_isolate(graal_isolate_t **res, graal_isolatethread_t **t) {
+    graal_create_isolate_params_t params;
+    memset(&params, 0, sizeof(params));
+    params.version = 1;
+    params.reserved_address_space_size = isolate_reserved_address_space_size;
+#ifdef JHEAPS_ISOLATE_ARGUMENTS
+    params.version = 3;
+    params._reserved_1 = isolate_options_count;
+    params._reserved_2 = isolate_options;
+#endif
+    return graal_create_isolate(&params, res, t);
+}
+
+// lock serializing the creation of the default isolate. Unlike a once-only
+// initialization, a failed creation can be retried
+#ifdef _WIN32
+static SRWLOCK init_lock = SRWLOCK_INIT;
+#define INIT_LOCK() AcquireSRWLockExclusive(&init_lock)
+#define INIT_UNLOCK() ReleaseSRWLockExclusive(&init_lock)
+#else
+static pthread_mutex_t init_lock = PTHREAD_MUTEX_INITIALIZER;
+#define INIT_LOCK() pthread_mutex_lock(&init_lock)
+#define INIT_UNLOCK() pthread_mutex_unlock(&init_lock)
+#endif
+
+static void clear_isolate_options() {
+    while (isolate_options_count > 1) {
+        free(isolate_options[--isolate_options_count]);
+        isolate_options[isolate_options_count] = NULL;
+    }
+    isolate_reserved_address_space_size = 0;
+}
+
+// create the default isolate, called with the init lock held. If the
+// configured parameters are rejected, they are reset so that the next
+// attempt uses the defaults
+static int create_default_isolate() {
+    if (!thread_exit_key_created) {
+#ifdef _WIN32
+        thread_exit_key = FlsAlloc(on_thread_exit);
+        thread_exit_key_created = thread_exit_key != FLS_OUT_OF_INDEXES;
+#else
+        thread_exit_key_created = pthread_key_create(&thread_exit_key, on_thread_exit) == 0;
+#endif
+    }
+    // create isolate and attach thread
+    if (create_isolate(&isolates[0], &isolate_threads[0]) != 0) {
+        isolates[0] = NULL;
+        isolate_threads[0] = NULL;
+        clear_isolate_options();
+        return set_local_errno(STATUS_ERROR, "Cannot create isolate, the isolate options were reset");
+    }
+    isolates_count = 1;
+    thread_attached();
+    isolate = isolates[0];
+    return STATUS_SUCCESS;
+}
+
+// library init, which is performed lazily on first use and is safe to
+// call from several threads, even without holding the GIL
+int jheaps_init() {
+    int err = STATUS_SUCCESS;
+    if (thread != NULL) {
+        return STATUS_SUCCESS;
+    }
+    INIT_LOCK();
+    if (isolate == NULL) {
+        err = create_default_isolate();
+    }
+    INIT_UNLOCK();
+    if (err != STATUS_SUCCESS) {
+        return err;
+    }
+    // attach thread
+    if (isolate_threads[current_isolate] == NULL && attach_thread(current_isolate) != 0) {
+        return set_local_errno(STATUS_ERROR, "Cannot attach thread to isolate");
+    }
+    thread = isolate_threads[current_isolate];
+    return STATUS_SUCCESS;
 }
 
 // library cleanup
@@ -40,43 +207,112 @@ void jheaps_cleanup() {
 }
 
 int jheaps_is_initialized() { 
-    return thread != NULL && isolate != NULL;
+    // threads which are not attached yet are attached lazily
+    return isolate != NULL;
 }
 
+// attach the current thread on first use, functions returning a status
+// report a failed initialization as an error of this layer
 #define LAZY_THREAD_ATTACH \
-    if (thread == NULL) { \
-        if (graal_attach_thread(isolate, &thread) != 0) {    \
-            fprintf(stderr, "graal_attach_thread error\n");  \
-            exit(EXIT_FAILURE);                              \
-        }                                                    \
+    if (thread == NULL && jheaps_init() != STATUS_SUCCESS) { \
+        return local_errno; \
     }
 
+// threads
+
+int jheaps_thread_detach() {
+    detach_thread();
+    return STATUS_SUCCESS;
+}
+
+int jheaps_thread_metrics(long long int* attached, long long int* detached) {
+    *attached = ATOMIC_LOAD(attached_threads);
+    *detached = ATOMIC_LOAD(detached_threads);
+    return STATUS_SUCCESS;
+}
+
 // error
 
+// errors of this layer are checked first, since they may be raised
+// before the backend is initialized
 void jheaps_error_clear_errno() {
-    LAZY_THREAD_ATTACH
-    jheaps_capi_error_clear_errno(thread);
+    local_errno = STATUS_SUCCESS;
+    local_errno_msg = NULL;
+    if (thread != NULL) {
+        jheaps_capi_error_clear_errno(thread);
+    }
 }
 
 status_t jheaps_error_get_errno() { 
+    if (local_errno != STATUS_SUCCESS) {
+        return local_errno;
+    }
     LAZY_THREAD_ATTACH
     return jheaps_capi_error_get_errno(thread);
 }
 
 char * jheaps_error_get_errno_msg() {
-    LAZY_THREAD_ATTACH
+    if (local_errno != STATUS_SUCCESS) {
+        return local_errno_msg;
+    }
+    if (thread == NULL && jheaps_init() != STATUS_SUCCESS) {
+        return local_errno_msg;
+    }
     return jheaps_capi_error_get_errno_msg(thread);
 }
 
 void jheaps_error_print_stack_trace() { 
-    LAZY_THREAD_ATTACH
+    if (thread == NULL && jheaps_init() != STATUS_SUCCESS) {
+        return;
+    }
     jheaps_capi_error_print_stack_trace(thread);
 }
 
+// set while a heap of python objects is being emptied, since the order
+// of removal does not matter then and comparisons can be skipped
+static THREAD_LOCAL int skip_comparisons = 0;
+
+// comparator of python objects given by their ids, which is called
+// directly by the backend without going through ctypes
+static int jheaps_id_comparator(long long int a_id, long long int b_id) {
+    PyObject *a = (PyObject *) (intptr_t) a_id;
+    PyObject *b = (PyObject *) (intptr_t) b_id;
+    PyGILState_STATE gstate;
+    int res = 0;
+
+    if (skip_comparisons) {
+        return 0;
+    }
+
+    gstate = PyGILState_Ensure();
+    // once a comparison has failed, the exception is kept until
+    // the backend returns and is then raised by the wrapper
+    if (!PyErr_Occurred()) {
+        int lt = PyObject_RichCompareBool(a, b, Py_LT);
+        if (lt > 0) {
+            res = -1;
+        } else if (lt == 0) {
+            int eq = PyObject_RichCompareBool(a, b, Py_EQ);
+            if (eq == 0) {
+                res = 1;
+            }
+        }
+    }
+    PyGILState_Release(gstate);
+    return res;
+}
+
+int jheaps_get_id_comparator(long long int* res) {
+    *res = (long long int) (intptr_t) &jheaps_id_comparator;
+    return STATUS_SUCCESS;
+}
+
 // vm
 
 void jheaps_vmLocatorSymbol() {
-    LAZY_THREAD_ATTACH
+    if (thread == NULL && jheaps_init() != STATUS_SUCCESS) {
+        return;
+    }
     vmLocatorSymbol(thread);
 }
 
@@ -102,6 +338,113 @@ int jheaps_AHeap_L_insert_key_value(void *heap, long long int key, long long int
     return jheaps_capi_AHeap_L_insert_key_value(thread, heap, key, value, res);
 }
 
+int jheaps_AHeap_D_insert_key_value_many(void *heap, double *keys, long long *values, long long *handles, long long int count) {
+    long long int i;
+    void *res;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeap_D_insert_key_value(thread, heap, keys[i], values != NULL ? values[i] : 0, &res);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        handles[i] = (long long) (intptr_t) res;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeap_L_insert_key_value_many(void *heap, long long *keys, long long *values, long long *handles, long long int count) {
+    long long int i;
+    void *res;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeap_L_insert_key_value(thread, heap, keys[i], values != NULL ? values[i] : 0, &res);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        handles[i] = (long long) (intptr_t) res;
+    }
+    return STATUS_SUCCESS;
+}
+
+// insert many keys into an addressable heap without keeping handles,
+// for heaps whose elements are only ever removed by deleting the minimum
+int jheaps_AHeap_D_insert_many(void *heap, double *keys, long long int count) {
+    long long int i;
+    void *res;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeap_D_insert_key_value(thread, heap, keys[i], 0, &res);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        jheaps_capi_handles_destroy(thread, res);
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeap_L_insert_many(void *heap, long long *keys, long long int count) {
+    long long int i;
+    void *res;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeap_L_insert_key_value(thread, heap, keys[i], 0, &res);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        jheaps_capi_handles_destroy(thread, res);
+    }
+    return STATUS_SUCCESS;
+}
+
+// delete count minimum elements of an addressable heap and return the
+// maximum of their keys, which is how soft heaps perform selection
+int jheaps_AHeap_D_delete_min_many_max_key(void *heap, long long int count, double *res) {
+    long long int i;
+    void *handle;
+    double key;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        if ((err = jheaps_capi_AHeap_delete_min(thread, heap, &handle)) != STATUS_SUCCESS) {
+            return err;
+        }
+        err = jheaps_capi_AHeapHandle_D_get_key(thread, handle, &key);
+        jheaps_capi_handles_destroy(thread, handle);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        if (i == 0 || key > *res) {
+            *res = key;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeap_L_delete_min_many_max_key(void *heap, long long int count, long long *res) {
+    long long int i, key;
+    void *handle;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        if ((err = jheaps_capi_AHeap_delete_min(thread, heap, &handle)) != STATUS_SUCCESS) {
+            return err;
+        }
+        err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &key);
+        jheaps_capi_handles_destroy(thread, handle);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        if (i == 0 || key > *res) {
+            *res = key;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
 int jheaps_AHeap_find_min(void *heap, void** res) { 
     LAZY_THREAD_ATTACH
     return jheaps_capi_AHeap_find_min(thread, heap, res);
@@ -157,27 +500,135 @@ int jheaps_AHeapHandle_L_decrease_key(void *handle, long long int key) {
     return jheaps_capi_AHeapHandle_L_decrease_key(thread, handle, key);
 }
 
+int jheaps_AHeapHandle_D_decrease_key_many(long long *handles, double *keys, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeapHandle_D_decrease_key(thread, (void *) (intptr_t) handles[i], keys[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_L_decrease_key_many(long long *handles, long long *keys, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeapHandle_L_decrease_key(thread, (void *) (intptr_t) handles[i], keys[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
 int jheaps_AHeapHandle_delete(void *handle) { 
     LAZY_THREAD_ATTACH
     return jheaps_capi_AHeapHandle_delete(thread, handle);
 }
 
+int jheaps_AHeapHandle_D_get_key_many(long long *handles, double *res, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeapHandle_D_get_key(thread, (void *) (intptr_t) handles[i], res + i);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_L_get_key_many(long long *handles, long long *res, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeapHandle_L_get_key(thread, (void *) (intptr_t) handles[i], res + i);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_get_value_many(long long *handles, long long *res, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeapHandle_get_value(thread, (void *) (intptr_t) handles[i], res + i);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_delete_many(long long *handles, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_AHeapHandle_delete(thread, (void *) (intptr_t) handles[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
 int jheaps_DEAHeap_find_max(void *handle, void** res) { 
+    LAZY_THREAD_ATTACH
     return jheaps_capi_DEAHeap_find_max(thread, handle, res);
 }
 
 int jheaps_DEAHeap_delete_max(void *handle, void** res) { 
+    LAZY_THREAD_ATTACH
     return jheaps_capi_DEAHeap_delete_max(thread, handle, res);
 }
 
 int jheaps_DEAHeapHandle_D_increase_key(void *handle, double key) { 
+    LAZY_THREAD_ATTACH
     return jheaps_capi_DEAHeapHandle_D_increase_key(thread, handle, key);
 }
 
 int jheaps_DEAHeapHandle_L_increase_key(void *handle, long long int key) { 
+    LAZY_THREAD_ATTACH
     return jheaps_capi_DEAHeapHandle_L_increase_key(thread, handle, key);
 }
 
+int jheaps_DEAHeapHandle_D_increase_key_many(long long *handles, double *keys, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_DEAHeapHandle_D_increase_key(thread, (void *) (intptr_t) handles[i], keys[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEAHeapHandle_L_increase_key_many(long long *handles, long long *keys, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_DEAHeapHandle_L_increase_key(thread, (void *) (intptr_t) handles[i], keys[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
 int jheaps_DEHeap_D_find_max(void *handle, double* res) { 
     LAZY_THREAD_ATTACH
     return jheaps_capi_DEHeap_D_find_max(thread, handle, res);
@@ -198,11 +649,72 @@ int jheaps_DEHeap_L_delete_max(void *handle, long long* res) {
     return jheaps_capi_DEHeap_L_delete_max(thread, handle, res);
 }
 
+int jheaps_DEHeap_D_delete_max_many(void *heap, double *keys, long long int count, long long* res) {
+    long long int i, size;
+    int err;
+    LAZY_THREAD_ATTACH
+    err = jheaps_capi_Heap_size(thread, heap, &size);
+    if (err != STATUS_SUCCESS) {
+        return err;
+    }
+    if (count > size) {
+        count = size;
+    }
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_DEHeap_D_delete_max(thread, heap, keys + i);
+        if (err != STATUS_SUCCESS) {
+            *res = i;
+            return err;
+        }
+    }
+    *res = count;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEHeap_L_delete_max_many(void *heap, long long *keys, long long int count, long long* res) {
+    long long int i, size;
+    int err;
+    LAZY_THREAD_ATTACH
+    err = jheaps_capi_Heap_size(thread, heap, &size);
+    if (err != STATUS_SUCCESS) {
+        return err;
+    }
+    if (count > size) {
+        count = size;
+    }
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_DEHeap_L_delete_max(thread, heap, keys + i);
+        if (err != STATUS_SUCCESS) {
+            *res = i;
+            return err;
+        }
+    }
+    *res = count;
+    return STATUS_SUCCESS;
+}
+
 int jheaps_handles_destroy(void *handle) { 
     LAZY_THREAD_ATTACH
     return jheaps_capi_handles_destroy(thread, handle);
 }
 
+int jheaps_handles_destroy_many(long long *handles, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        // zero ids are slots which were never filled
+        if (handles[i] == 0) {
+            continue;
+        }
+        err = jheaps_capi_handles_destroy(thread, (void *) (intptr_t) handles[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
 int jheaps_Heap_create(heap_type_t type, void** res) { 
     LAZY_THREAD_ATTACH
     return jheaps_capi_Heap_create(thread, type, res);
@@ -228,6 +740,30 @@ int jheaps_long_radix_Heap_create(heap_type_t type, long long int min_key, long
     return jheaps_capi_long_radix_Heap_create(thread, type, min_key, max_key, res);
 }
 
+// shift the keys of a radix heap whose key range starts at a negative offset,
+// to or from the non-negative keys of the backend heap. The keys can be
+// shifted in place.
+int jheaps_long_radix_keys_shift(long long *keys, long long *res, long long int n, long long int offset, int to_heap) {
+    long long int i;
+    if (offset > 0) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Offset must be non-positive");
+    }
+    for (i = 0; i < n; i++) {
+        if (to_heap) {
+            if (keys[i] > INT64_MAX + offset) {
+                return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Key out of range");
+            }
+            res[i] = keys[i] - offset;
+        } else {
+            if (keys[i] < INT64_MIN - offset) {
+                return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Key out of range");
+            }
+            res[i] = keys[i] + offset;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
 int jheaps_Heap_comparator_create(heap_type_t type, void *comparator, void** res) { 
     LAZY_THREAD_ATTACH
     return jheaps_capi_Heap_comparator_create(thread, type, comparator, res);
@@ -253,6 +789,32 @@ int jheaps_Heap_L_insert_key(void *heap, long long int key) {
     return jheaps_capi_Heap_L_insert_key(thread, heap, key);
 }
 
+int jheaps_Heap_D_insert_many(void *heap, double *keys, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_Heap_D_insert_key(thread, heap, keys[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_Heap_L_insert_many(void *heap, long long *keys, long long int count) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_Heap_L_insert_key(thread, heap, keys[i]);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
 int jheaps_Heap_D_find_min(void *heap, double* res) {
     LAZY_THREAD_ATTACH
     return jheaps_capi_Heap_D_find_min(thread, heap, res);
@@ -273,6 +835,50 @@ int jheaps_Heap_L_delete_min(void *heap, long long* res) {
     return jheaps_capi_Heap_L_delete_min(thread, heap, res);
 }
 
+int jheaps_Heap_D_delete_min_many(void *heap, double *keys, long long int count, long long* res) {
+    long long int i, size;
+    int err;
+    LAZY_THREAD_ATTACH
+    err = jheaps_capi_Heap_size(thread, heap, &size);
+    if (err != STATUS_SUCCESS) {
+        return err;
+    }
+    if (count > size) {
+        count = size;
+    }
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_Heap_D_delete_min(thread, heap, keys + i);
+        if (err != STATUS_SUCCESS) {
+            *res = i;
+            return err;
+        }
+    }
+    *res = count;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_Heap_L_delete_min_many(void *heap, long long *keys, long long int count, long long* res) {
+    long long int i, size;
+    int err;
+    LAZY_THREAD_ATTACH
+    err = jheaps_capi_Heap_size(thread, heap, &size);
+    if (err != STATUS_SUCCESS) {
+        return err;
+    }
+    if (count > size) {
+        count = size;
+    }
+    for (i = 0; i < count; i++) {
+        err = jheaps_capi_Heap_L_delete_min(thread, heap, keys + i);
+        if (err != STATUS_SUCCESS) {
+            *res = i;
+            return err;
+        }
+    }
+    *res = count;
+    return STATUS_SUCCESS;
+}
+
 int jheaps_Heap_size(void *heap, long long* res) {
     LAZY_THREAD_ATTACH
     return jheaps_capi_Heap_size(thread, heap, res);
@@ -289,26 +895,32 @@ int jheaps_Heap_clear(void *heap) {
 }
 
 int jheaps_Heap_D_heapify(heap_type_t type, double* keys, long long* values, int count, void** res) { 
+    LAZY_THREAD_ATTACH
     return jheaps_capi_Heap_D_heapify(thread, type, keys, values, count, res);
 }
 
 int jheaps_Heap_L_heapify(heap_type_t type, long long* keys, long long* values, int count, void** res) {
+    LAZY_THREAD_ATTACH
     return jheaps_capi_Heap_L_heapify(thread, type, keys, values, count, res);
 }
 
 int jheaps_dary_Heap_D_heapify(heap_type_t type, int d, double* keys, long long* values, int count, void** res) {
+    LAZY_THREAD_ATTACH
     return jheaps_capi_dary_Heap_D_heapify(thread, type, d, keys, values, count, res);
 }
 
 int jheaps_dary_Heap_L_heapify(heap_type_t type, int d, long long* keys, long long* values, int count, void** res) {
+    LAZY_THREAD_ATTACH
     return jheaps_capi_dary_Heap_L_heapify(thread, type, d, keys, values, count, res);
 }
 
 int jheaps_Heap_L_comparator_heapify(heap_type_t type, void *comparator, long long* keys, long long* values, int count, void** res) {
+    LAZY_THREAD_ATTACH
     return jheaps_capi_Heap_L_comparator_heapify(thread, type, comparator, keys, values, count, res);
 }
 
 int jheaps_dary_Heap_L_comparator_heapify(heap_type_t type, void *comparator, int d, long long* keys, long long* values, int count, void** res) {
+    LAZY_THREAD_ATTACH
     return jheaps_capi_dary_Heap_L_comparator_heapify(thread, type, comparator, d, keys, values, count, res);
 }
 
@@ -332,4 +944,1388 @@ int jheaps_MDEAHeap_L_meld(void *heap1, void *heap2) {
     return jheaps_capi_MDEAHeap_L_meld(thread, heap1, heap2);
 }
 
+// indexed heaps
+
+// an addressable heap together with a table from dense integer ids to
+// the handles of the heap nodes
+typedef struct {
+    void *heap;
+    void **nodes;
+    long long int capacity;
+} indexed_heap_t;
+
+static int indexed_heap_check_id(indexed_heap_t *h, long long int id) {
+    if (id < 0 || id >= h->capacity) {
+        return set_local_errno(STATUS_INDEX_OUT_OF_BOUNDS, "Id out of range");
+    }
+    return STATUS_SUCCESS;
+}
+
+static int indexed_heap_get_node(indexed_heap_t *h, long long int id, void **res) {
+    int err = indexed_heap_check_id(h, id);
+    if (err != STATUS_SUCCESS) {
+        return err;
+    }
+    if (h->nodes[id] == NULL) {
+        return set_local_errno(STATUS_NO_SUCH_ELEMENT, "Id not in heap");
+    }
+    *res = h->nodes[id];
+    return STATUS_SUCCESS;
+}
+
+static void indexed_heap_destroy_nodes(indexed_heap_t *h) {
+    long long int i;
+    for (i = 0; i < h->capacity; i++) {
+        if (h->nodes[i] != NULL) {
+            jheaps_capi_handles_destroy(thread, h->nodes[i]);
+            h->nodes[i] = NULL;
+        }
+    }
+}
+
+int jheaps_IHeap_create(void *heap, long long int capacity, void** res) {
+    indexed_heap_t *h;
+    LAZY_THREAD_ATTACH
+    if (capacity < 0) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Capacity must be non-negative");
+    }
+    h = malloc(sizeof(indexed_heap_t));
+    if (h == NULL) {
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    h->nodes = calloc(capacity > 0 ? capacity : 1, sizeof(void *));
+    if (h->nodes == NULL) {
+        free(h);
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    h->heap = heap;
+    h->capacity = capacity;
+    *res = h;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_IHeap_destroy(void *iheap) {
+    indexed_heap_t *h = iheap;
+    LAZY_THREAD_ATTACH
+    indexed_heap_destroy_nodes(h);
+    jheaps_capi_handles_destroy(thread, h->heap);
+    free(h->nodes);
+    free(h);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_IHeap_D_push(void *iheap, long long int id, double key) {
+    indexed_heap_t *h = iheap;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = indexed_heap_check_id(h, id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if (h->nodes[id] != NULL) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Id already in heap");
+    }
+    return jheaps_capi_AHeap_D_insert_key_value(thread, h->heap, key, id, &h->nodes[id]);
+}
+
+int jheaps_IHeap_L_push(void *iheap, long long int id, long long int key) {
+    indexed_heap_t *h = iheap;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = indexed_heap_check_id(h, id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if (h->nodes[id] != NULL) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Id already in heap");
+    }
+    return jheaps_capi_AHeap_L_insert_key_value(thread, h->heap, key, id, &h->nodes[id]);
+}
+
+int jheaps_IHeap_D_decrease_key(void *iheap, long long int id, double key) {
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = indexed_heap_get_node(iheap, id, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    return jheaps_capi_AHeapHandle_D_decrease_key(thread, node, key);
+}
+
+int jheaps_IHeap_L_decrease_key(void *iheap, long long int id, long long int key) {
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = indexed_heap_get_node(iheap, id, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    return jheaps_capi_AHeapHandle_L_decrease_key(thread, node, key);
+}
+
+int jheaps_IHeap_D_get_key(void *iheap, long long int id, double* res) {
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = indexed_heap_get_node(iheap, id, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    return jheaps_capi_AHeapHandle_D_get_key(thread, node, res);
+}
+
+int jheaps_IHeap_L_get_key(void *iheap, long long int id, long long* res) {
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = indexed_heap_get_node(iheap, id, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    return jheaps_capi_AHeapHandle_L_get_key(thread, node, res);
+}
 
+int jheaps_IHeap_delete(void *iheap, long long int id) {
+    indexed_heap_t *h = iheap;
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = indexed_heap_get_node(h, id, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = jheaps_capi_AHeapHandle_delete(thread, node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    h->nodes[id] = NULL;
+    return jheaps_capi_handles_destroy(thread, node);
+}
+
+int jheaps_IHeap_contains(void *iheap, long long int id, int* res) {
+    indexed_heap_t *h = iheap;
+    *res = id >= 0 && id < h->capacity && h->nodes[id] != NULL;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_IHeap_D_find_min(void *iheap, long long* id, double* key) {
+    indexed_heap_t *h = iheap;
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeap_find_min(thread, h->heap, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_get_value(thread, node, id);
+    if (err == STATUS_SUCCESS) {
+        err = jheaps_capi_AHeapHandle_D_get_key(thread, node, key);
+    }
+    jheaps_capi_handles_destroy(thread, node);
+    return err;
+}
+
+int jheaps_IHeap_L_find_min(void *iheap, long long* id, long long* key) {
+    indexed_heap_t *h = iheap;
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeap_find_min(thread, h->heap, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_get_value(thread, node, id);
+    if (err == STATUS_SUCCESS) {
+        err = jheaps_capi_AHeapHandle_L_get_key(thread, node, key);
+    }
+    jheaps_capi_handles_destroy(thread, node);
+    return err;
+}
+
+int jheaps_IHeap_D_pop(void *iheap, long long* id, double* key) {
+    indexed_heap_t *h = iheap;
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeap_delete_min(thread, h->heap, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_get_value(thread, node, id);
+    if (err == STATUS_SUCCESS) {
+        err = jheaps_capi_AHeapHandle_D_get_key(thread, node, key);
+    }
+    if (err == STATUS_SUCCESS) {
+        // the table keeps its own handle on the same node
+        jheaps_capi_handles_destroy(thread, h->nodes[*id]);
+        h->nodes[*id] = NULL;
+    }
+    jheaps_capi_handles_destroy(thread, node);
+    return err;
+}
+
+int jheaps_IHeap_L_pop(void *iheap, long long* id, long long* key) {
+    indexed_heap_t *h = iheap;
+    void *node;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeap_delete_min(thread, h->heap, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_get_value(thread, node, id);
+    if (err == STATUS_SUCCESS) {
+        err = jheaps_capi_AHeapHandle_L_get_key(thread, node, key);
+    }
+    if (err == STATUS_SUCCESS) {
+        // the table keeps its own handle on the same node
+        jheaps_capi_handles_destroy(thread, h->nodes[*id]);
+        h->nodes[*id] = NULL;
+    }
+    jheaps_capi_handles_destroy(thread, node);
+    return err;
+}
+
+int jheaps_IHeap_size(void *iheap, long long* res) {
+    indexed_heap_t *h = iheap;
+    LAZY_THREAD_ATTACH
+    return jheaps_capi_AHeap_size(thread, h->heap, res);
+}
+
+int jheaps_IHeap_isempty(void *iheap, int* res) {
+    indexed_heap_t *h = iheap;
+    LAZY_THREAD_ATTACH
+    return jheaps_capi_AHeap_isempty(thread, h->heap, res);
+}
+
+int jheaps_IHeap_clear(void *iheap) {
+    indexed_heap_t *h = iheap;
+    LAZY_THREAD_ATTACH
+    indexed_heap_destroy_nodes(h);
+    return jheaps_capi_AHeap_clear(thread, h->heap);
+}
+
+// composite keys
+
+// keys of two numbers which are compared lexicographically, allocated by
+// this layer and stored in comparator heaps using their addresses as ids
+typedef struct {
+    double first;
+    long long int second;
+} key_DL_t;
+
+typedef struct {
+    long long int first;
+    long long int second;
+} key_LL_t;
+
+static int jheaps_DL_comparator(long long int a_id, long long int b_id) {
+    key_DL_t *a = (key_DL_t *) (intptr_t) a_id;
+    key_DL_t *b = (key_DL_t *) (intptr_t) b_id;
+    if (a->first != b->first) {
+        return a->first < b->first ? -1 : 1;
+    }
+    if (a->second != b->second) {
+        return a->second < b->second ? -1 : 1;
+    }
+    return 0;
+}
+
+static int jheaps_LL_comparator(long long int a_id, long long int b_id) {
+    key_LL_t *a = (key_LL_t *) (intptr_t) a_id;
+    key_LL_t *b = (key_LL_t *) (intptr_t) b_id;
+    if (a->first != b->first) {
+        return a->first < b->first ? -1 : 1;
+    }
+    if (a->second != b->second) {
+        return a->second < b->second ? -1 : 1;
+    }
+    return 0;
+}
+
+int jheaps_get_DL_comparator(long long int* res) {
+    *res = (long long int) (intptr_t) &jheaps_DL_comparator;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_get_LL_comparator(long long int* res) {
+    *res = (long long int) (intptr_t) &jheaps_LL_comparator;
+    return STATUS_SUCCESS;
+}
+
+static int key_DL_create(double first, long long int second, long long int *res) {
+    key_DL_t *key;
+    if (first != first) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Key cannot contain NaN");
+    }
+    key = malloc(sizeof(key_DL_t));
+    if (key == NULL) {
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    key->first = first;
+    key->second = second;
+    *res = (long long int) (intptr_t) key;
+    return STATUS_SUCCESS;
+}
+
+static int key_LL_create(long long int first, long long int second, long long int *res) {
+    key_LL_t *key = malloc(sizeof(key_LL_t));
+    if (key == NULL) {
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    key->first = first;
+    key->second = second;
+    *res = (long long int) (intptr_t) key;
+    return STATUS_SUCCESS;
+}
+
+static void key_destroy(long long int key_id) {
+    free((void *) (intptr_t) key_id);
+}
+
+int jheaps_Heap_DL_insert_key(void *heap, double first, long long int second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = key_DL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_Heap_L_insert_key(thread, heap, key_id);
+    if (err != STATUS_SUCCESS) {
+        key_destroy(key_id);
+    }
+    return err;
+}
+
+int jheaps_Heap_DL_find_min(void *heap, double* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_Heap_L_find_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_DL_t *) (intptr_t) key_id)->first;
+    *second = ((key_DL_t *) (intptr_t) key_id)->second;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_Heap_DL_delete_min(void *heap, double* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_Heap_L_delete_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_DL_t *) (intptr_t) key_id)->first;
+    *second = ((key_DL_t *) (intptr_t) key_id)->second;
+    key_destroy(key_id);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEHeap_DL_find_max(void *heap, double* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_DEHeap_L_find_max(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_DL_t *) (intptr_t) key_id)->first;
+    *second = ((key_DL_t *) (intptr_t) key_id)->second;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEHeap_DL_delete_max(void *heap, double* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_DEHeap_L_delete_max(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_DL_t *) (intptr_t) key_id)->first;
+    *second = ((key_DL_t *) (intptr_t) key_id)->second;
+    key_destroy(key_id);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeap_DL_insert_key_value(void *heap, double first, long long int second, long long int value, void** res) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = key_DL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeap_L_insert_key_value(thread, heap, key_id, value, res);
+    if (err != STATUS_SUCCESS) {
+        key_destroy(key_id);
+    }
+    return err;
+}
+
+int jheaps_AHeapHandle_DL_get_key(void *handle, double* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_DL_t *) (intptr_t) key_id)->first;
+    *second = ((key_DL_t *) (intptr_t) key_id)->second;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_DL_decrease_key(void *handle, double first, long long int second) {
+    long long int old_key_id, key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &old_key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = key_DL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_L_decrease_key(thread, handle, key_id);
+    key_destroy(err == STATUS_SUCCESS ? old_key_id : key_id);
+    return err;
+}
+
+int jheaps_DEAHeapHandle_DL_increase_key(void *handle, double first, long long int second) {
+    long long int old_key_id, key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &old_key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = key_DL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_DEAHeapHandle_L_increase_key(thread, handle, key_id);
+    key_destroy(err == STATUS_SUCCESS ? old_key_id : key_id);
+    return err;
+}
+
+int jheaps_Heap_LL_insert_key(void *heap, long long int first, long long int second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = key_LL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_Heap_L_insert_key(thread, heap, key_id);
+    if (err != STATUS_SUCCESS) {
+        key_destroy(key_id);
+    }
+    return err;
+}
+
+int jheaps_Heap_LL_find_min(void *heap, long long int* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_Heap_L_find_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_LL_t *) (intptr_t) key_id)->first;
+    *second = ((key_LL_t *) (intptr_t) key_id)->second;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_Heap_LL_delete_min(void *heap, long long int* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_Heap_L_delete_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_LL_t *) (intptr_t) key_id)->first;
+    *second = ((key_LL_t *) (intptr_t) key_id)->second;
+    key_destroy(key_id);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEHeap_LL_find_max(void *heap, long long int* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_DEHeap_L_find_max(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_LL_t *) (intptr_t) key_id)->first;
+    *second = ((key_LL_t *) (intptr_t) key_id)->second;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEHeap_LL_delete_max(void *heap, long long int* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_DEHeap_L_delete_max(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_LL_t *) (intptr_t) key_id)->first;
+    *second = ((key_LL_t *) (intptr_t) key_id)->second;
+    key_destroy(key_id);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeap_LL_insert_key_value(void *heap, long long int first, long long int second, long long int value, void** res) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = key_LL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeap_L_insert_key_value(thread, heap, key_id, value, res);
+    if (err != STATUS_SUCCESS) {
+        key_destroy(key_id);
+    }
+    return err;
+}
+
+int jheaps_AHeapHandle_LL_get_key(void *handle, long long int* first, long long* second) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *first = ((key_LL_t *) (intptr_t) key_id)->first;
+    *second = ((key_LL_t *) (intptr_t) key_id)->second;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_LL_decrease_key(void *handle, long long int first, long long int second) {
+    long long int old_key_id, key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &old_key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = key_LL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_L_decrease_key(thread, handle, key_id);
+    key_destroy(err == STATUS_SUCCESS ? old_key_id : key_id);
+    return err;
+}
+
+int jheaps_DEAHeapHandle_LL_increase_key(void *handle, long long int first, long long int second) {
+    long long int old_key_id, key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &old_key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = key_LL_create(first, second, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_DEAHeapHandle_L_increase_key(thread, handle, key_id);
+    key_destroy(err == STATUS_SUCCESS ? old_key_id : key_id);
+    return err;
+}
+
+int jheaps_Heap_composite_clear(void *heap) {
+    long long int key_id;
+    int isempty, err;
+    LAZY_THREAD_ATTACH
+    for (;;) {
+        if ((err = jheaps_capi_Heap_isempty(thread, heap, &isempty)) != STATUS_SUCCESS) {
+            return err;
+        }
+        if (isempty) {
+            return STATUS_SUCCESS;
+        }
+        if ((err = jheaps_capi_Heap_L_delete_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+            return err;
+        }
+        key_destroy(key_id);
+    }
+}
+
+int jheaps_AHeap_composite_clear(void *heap) {
+    void *handle;
+    long long int key_id;
+    int isempty, err;
+    LAZY_THREAD_ATTACH
+    for (;;) {
+        if ((err = jheaps_capi_AHeap_isempty(thread, heap, &isempty)) != STATUS_SUCCESS) {
+            return err;
+        }
+        if (isempty) {
+            return STATUS_SUCCESS;
+        }
+        if ((err = jheaps_capi_AHeap_delete_min(thread, heap, &handle)) != STATUS_SUCCESS) {
+            return err;
+        }
+        err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &key_id);
+        if (err == STATUS_SUCCESS) {
+            key_destroy(key_id);
+        }
+        jheaps_capi_handles_destroy(thread, handle);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+}
+
+// insert many composite keys which share their second number
+int jheaps_Heap_DL_insert_many(void *heap, double *firsts, long long int count, long long int second) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        if ((err = jheaps_Heap_DL_insert_key(heap, firsts[i], second)) != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_Heap_LL_insert_many(void *heap, long long *firsts, long long int count, long long int second) {
+    long long int i;
+    int err;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) {
+        if ((err = jheaps_Heap_LL_insert_key(heap, firsts[i], second)) != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+// delete at most count minimum composite keys which are not larger than
+// a bound, the first key which exceeds the bound is inserted back
+int jheaps_Heap_DL_delete_min_many_until(void *heap, double bound_first, long long int bound_second, double *firsts, long long *seconds, long long int count, long long* res) {
+    key_DL_t bound = { bound_first, bound_second };
+    long long int key_id, size;
+    int err;
+    LAZY_THREAD_ATTACH
+    *res = 0;
+    if ((err = jheaps_capi_Heap_size(thread, heap, &size)) != STATUS_SUCCESS) {
+        return err;
+    }
+    while (*res < count && *res < size) {
+        if ((err = jheaps_capi_Heap_L_delete_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+            return err;
+        }
+        if (jheaps_DL_comparator(key_id, (long long int) (intptr_t) &bound) > 0) {
+            err = jheaps_capi_Heap_L_insert_key(thread, heap, key_id);
+            if (err != STATUS_SUCCESS) {
+                key_destroy(key_id);
+            }
+            return err;
+        }
+        firsts[*res] = ((key_DL_t *) (intptr_t) key_id)->first;
+        seconds[*res] = ((key_DL_t *) (intptr_t) key_id)->second;
+        key_destroy(key_id);
+        (*res)++;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_Heap_LL_delete_min_many_until(void *heap, long long int bound_first, long long int bound_second, long long *firsts, long long *seconds, long long int count, long long* res) {
+    key_LL_t bound = { bound_first, bound_second };
+    long long int key_id, size;
+    int err;
+    LAZY_THREAD_ATTACH
+    *res = 0;
+    if ((err = jheaps_capi_Heap_size(thread, heap, &size)) != STATUS_SUCCESS) {
+        return err;
+    }
+    while (*res < count && *res < size) {
+        if ((err = jheaps_capi_Heap_L_delete_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+            return err;
+        }
+        if (jheaps_LL_comparator(key_id, (long long int) (intptr_t) &bound) > 0) {
+            err = jheaps_capi_Heap_L_insert_key(thread, heap, key_id);
+            if (err != STATUS_SUCCESS) {
+                key_destroy(key_id);
+            }
+            return err;
+        }
+        firsts[*res] = ((key_LL_t *) (intptr_t) key_id)->first;
+        seconds[*res] = ((key_LL_t *) (intptr_t) key_id)->second;
+        key_destroy(key_id);
+        (*res)++;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_composite_key_destroy(void *handle) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    key_destroy(key_id);
+    return STATUS_SUCCESS;
+}
+
+// bounded heaps
+
+// an addressable heap which keeps at most capacity elements. Elements are
+// stored as composite keys of their key and complemented value, so that the
+// minimum is always the worst kept element: the worst key and, among equal
+// keys, the largest value. Keys are negated (or complemented for long keys)
+// when the smallest keys are kept. Once the heap is full the composite key
+// of its minimum is cached as a threshold, so that keys which do not qualify
+// never reach the backend.
+typedef struct {
+    void *heap;
+    long long int capacity;
+    long long int size;
+    int largest;
+    double d_threshold;
+    long long int l_threshold;
+    long long int value_threshold;
+} bounded_heap_t;
+
+static double bounded_heap_D_map(bounded_heap_t *h, double key) {
+    return h->largest ? key : -key;
+}
+
+static long long int bounded_heap_L_map(bounded_heap_t *h, long long int key) {
+    return h->largest ? key : ~key;
+}
+
+static int bounded_heap_evict(bounded_heap_t *h) {
+    long long int key_id;
+    void *node;
+    int err;
+    if ((err = jheaps_capi_AHeap_delete_min(thread, h->heap, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_L_get_key(thread, node, &key_id);
+    jheaps_capi_handles_destroy(thread, node);
+    if (err != STATUS_SUCCESS) {
+        return err;
+    }
+    key_destroy(key_id);
+    h->size--;
+    return STATUS_SUCCESS;
+}
+
+// remove all elements and free their keys
+static int bounded_heap_evict_all(bounded_heap_t *h) {
+    int err;
+    while (h->size > 0) {
+        if ((err = bounded_heap_evict(h)) != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+static int bounded_heap_find_min_key(bounded_heap_t *h, long long int *key_id) {
+    void *node;
+    int err;
+    if ((err = jheaps_capi_AHeap_find_min(thread, h->heap, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    err = jheaps_capi_AHeapHandle_L_get_key(thread, node, key_id);
+    jheaps_capi_handles_destroy(thread, node);
+    return err;
+}
+
+static int bounded_heap_insert_key(bounded_heap_t *h, long long int key_id) {
+    void *node;
+    int err;
+    if ((err = jheaps_capi_AHeap_L_insert_key(thread, h->heap, key_id, &node)) != STATUS_SUCCESS) {
+        return err;
+    }
+    jheaps_capi_handles_destroy(thread, node);
+    h->size++;
+    return STATUS_SUCCESS;
+}
+
+static int bounded_heap_D_push(bounded_heap_t *h, double key, long long int value, int *res) {
+    long long int key_id;
+    int err;
+    if (key != key) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Key cannot be NaN");
+    }
+    key = bounded_heap_D_map(h, key);
+    value = ~value;
+    if (h->size == h->capacity) {
+        if (h->capacity == 0
+                || !(key > h->d_threshold || (key == h->d_threshold && value > h->value_threshold))) {
+            *res = 0;
+            return STATUS_SUCCESS;
+        }
+        if ((err = bounded_heap_evict(h)) != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    if ((err = key_DL_create(key, value, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = bounded_heap_insert_key(h, key_id)) != STATUS_SUCCESS) {
+        key_destroy(key_id);
+        return err;
+    }
+    if (h->size == h->capacity) {
+        if ((err = bounded_heap_find_min_key(h, &key_id)) != STATUS_SUCCESS) {
+            return err;
+        }
+        h->d_threshold = ((key_DL_t *) (intptr_t) key_id)->first;
+        h->value_threshold = ((key_DL_t *) (intptr_t) key_id)->second;
+    }
+    *res = 1;
+    return STATUS_SUCCESS;
+}
+
+static int bounded_heap_L_push(bounded_heap_t *h, long long int key, long long int value, int *res) {
+    long long int key_id;
+    int err;
+    key = bounded_heap_L_map(h, key);
+    value = ~value;
+    if (h->size == h->capacity) {
+        if (h->capacity == 0
+                || key < h->l_threshold || (key == h->l_threshold && value <= h->value_threshold)) {
+            *res = 0;
+            return STATUS_SUCCESS;
+        }
+        if ((err = bounded_heap_evict(h)) != STATUS_SUCCESS) {
+            return err;
+        }
+    }
+    if ((err = key_LL_create(key, value, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = bounded_heap_insert_key(h, key_id)) != STATUS_SUCCESS) {
+        key_destroy(key_id);
+        return err;
+    }
+    if (h->size == h->capacity) {
+        if ((err = bounded_heap_find_min_key(h, &key_id)) != STATUS_SUCCESS) {
+            return err;
+        }
+        h->l_threshold = ((key_LL_t *) (intptr_t) key_id)->first;
+        h->value_threshold = ((key_LL_t *) (intptr_t) key_id)->second;
+    }
+    *res = 1;
+    return STATUS_SUCCESS;
+}
+
+// the heap must be a d-ary heap using the comparator of composite keys
+// matching the key type
+int jheaps_BHeap_create(void *heap, long long int capacity, int largest, void** res) {
+    bounded_heap_t *h;
+    LAZY_THREAD_ATTACH
+    if (capacity < 0) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Capacity must be non-negative");
+    }
+    h = malloc(sizeof(bounded_heap_t));
+    if (h == NULL) {
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    h->heap = heap;
+    h->capacity = capacity;
+    h->size = 0;
+    h->largest = largest;
+    h->d_threshold = 0.0;
+    h->l_threshold = 0;
+    h->value_threshold = 0;
+    *res = h;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_BHeap_destroy(void *bheap) {
+    bounded_heap_t *h = bheap;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = bounded_heap_evict_all(h)) != STATUS_SUCCESS) {
+        return err;
+    }
+    jheaps_capi_handles_destroy(thread, h->heap);
+    free(h);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_BHeap_D_push(void *bheap, double key, long long int value, int* res) {
+    LAZY_THREAD_ATTACH
+    return bounded_heap_D_push(bheap, key, value, res);
+}
+
+int jheaps_BHeap_L_push(void *bheap, long long int key, long long int value, int* res) {
+    LAZY_THREAD_ATTACH
+    return bounded_heap_L_push(bheap, key, value, res);
+}
+
+// push many keys, if values is NULL the values are first_value, first_value + 1, ...
+int jheaps_BHeap_D_push_many(void *bheap, double *keys, long long *values, long long int first_value, long long int count, long long* res) {
+    long long int i;
+    int accepted, err;
+    LAZY_THREAD_ATTACH
+    *res = 0;
+    for (i = 0; i < count; i++) {
+        err = bounded_heap_D_push(bheap, keys[i], values != NULL ? values[i] : first_value + i, &accepted);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        *res += accepted;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_BHeap_L_push_many(void *bheap, long long *keys, long long *values, long long int first_value, long long int count, long long* res) {
+    long long int i;
+    int accepted, err;
+    LAZY_THREAD_ATTACH
+    *res = 0;
+    for (i = 0; i < count; i++) {
+        err = bounded_heap_L_push(bheap, keys[i], values != NULL ? values[i] : first_value + i, &accepted);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        *res += accepted;
+    }
+    return STATUS_SUCCESS;
+}
+
+// delete all elements and write their key ids, best first, into key_ids
+// which must have room for them. The caller inserts the keys back.
+static int bounded_heap_delete_all(bounded_heap_t *h, long long *key_ids) {
+    long long int i;
+    void *node;
+    int err;
+    for (i = h->size - 1; i >= 0; i--) {
+        if ((err = jheaps_capi_AHeap_delete_min(thread, h->heap, &node)) != STATUS_SUCCESS) {
+            return err;
+        }
+        err = jheaps_capi_AHeapHandle_L_get_key(thread, node, &key_ids[i]);
+        jheaps_capi_handles_destroy(thread, node);
+        if (err != STATUS_SUCCESS) {
+            return err;
+        }
+        h->size--;
+    }
+    return STATUS_SUCCESS;
+}
+
+// write all elements, best first, into keys and values which must have
+// room for them. Equal keys are ordered by their values. The elements are
+// deleted and inserted back.
+int jheaps_BHeap_D_result(void *bheap, double *keys, long long *values, long long int count) {
+    bounded_heap_t *h = bheap;
+    long long int i, n = h->size;
+    long long *key_ids = values;
+    key_DL_t *key;
+    int err;
+    LAZY_THREAD_ATTACH
+    if (count < n) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Output buffers too small");
+    }
+    // the key ids are kept in the values until the keys are inserted back
+    if ((err = bounded_heap_delete_all(h, key_ids)) != STATUS_SUCCESS) {
+        return err;
+    }
+    for (i = 0; i < n; i++) {
+        key = (key_DL_t *) (intptr_t) key_ids[i];
+        if ((err = bounded_heap_insert_key(h, key_ids[i])) != STATUS_SUCCESS) {
+            return err;
+        }
+        keys[i] = bounded_heap_D_map(h, key->first);
+        values[i] = ~key->second;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_BHeap_L_result(void *bheap, long long *keys, long long *values, long long int count) {
+    bounded_heap_t *h = bheap;
+    long long int i, n = h->size;
+    long long *key_ids = values;
+    key_LL_t *key;
+    int err;
+    LAZY_THREAD_ATTACH
+    if (count < n) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Output buffers too small");
+    }
+    // the key ids are kept in the values until the keys are inserted back
+    if ((err = bounded_heap_delete_all(h, key_ids)) != STATUS_SUCCESS) {
+        return err;
+    }
+    for (i = 0; i < n; i++) {
+        key = (key_LL_t *) (intptr_t) key_ids[i];
+        if ((err = bounded_heap_insert_key(h, key_ids[i])) != STATUS_SUCCESS) {
+            return err;
+        }
+        keys[i] = bounded_heap_L_map(h, key->first);
+        values[i] = ~key->second;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jheaps_BHeap_size(void *bheap, long long* res) {
+    bounded_heap_t *h = bheap;
+    *res = h->size;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_BHeap_clear(void *bheap) {
+    bounded_heap_t *h = bheap;
+    LAZY_THREAD_ATTACH
+    return bounded_heap_evict_all(h);
+}
+
+// object keys and values, stored by their ids while the heap owns a
+// reference to each of them
+
+#define OBJ_TO_ID(o) ((long long int) (intptr_t) (o))
+#define ID_TO_OBJ(id) ((PyObject *) (intptr_t) (id))
+
+int jheaps_Heap_O_insert_key(void *heap, PyObject *key) {
+    int err;
+    LAZY_THREAD_ATTACH
+    Py_INCREF(key);
+    if ((err = jheaps_capi_Heap_L_insert_key(thread, heap, OBJ_TO_ID(key))) != STATUS_SUCCESS) {
+        Py_DECREF(key);
+    }
+    return err;
+}
+
+int jheaps_Heap_O_find_min(void *heap, PyObject **res) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_Heap_L_find_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *res = ID_TO_OBJ(key_id);
+    Py_INCREF(*res);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_Heap_O_delete_min(void *heap, PyObject **res) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_Heap_L_delete_min(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    // the reference of the heap is passed to the caller
+    *res = ID_TO_OBJ(key_id);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEHeap_O_find_max(void *heap, PyObject **res) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_DEHeap_L_find_max(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *res = ID_TO_OBJ(key_id);
+    Py_INCREF(*res);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_DEHeap_O_delete_max(void *heap, PyObject **res) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_DEHeap_L_delete_max(thread, heap, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    // the reference of the heap is passed to the caller
+    *res = ID_TO_OBJ(key_id);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeap_DO_insert_key_value(void *heap, double key, PyObject *value, void** res) {
+    int err;
+    LAZY_THREAD_ATTACH
+    Py_INCREF(value);
+    if ((err = jheaps_capi_AHeap_D_insert_key_value(thread, heap, key, OBJ_TO_ID(value), res)) != STATUS_SUCCESS) {
+        Py_DECREF(value);
+    }
+    return err;
+}
+
+int jheaps_AHeap_LO_insert_key_value(void *heap, long long int key, PyObject *value, void** res) {
+    int err;
+    LAZY_THREAD_ATTACH
+    Py_INCREF(value);
+    if ((err = jheaps_capi_AHeap_L_insert_key_value(thread, heap, key, OBJ_TO_ID(value), res)) != STATUS_SUCCESS) {
+        Py_DECREF(value);
+    }
+    return err;
+}
+
+int jheaps_AHeap_OL_insert_key_value(void *heap, PyObject *key, long long int value, void** res) {
+    int err;
+    LAZY_THREAD_ATTACH
+    Py_INCREF(key);
+    if ((err = jheaps_capi_AHeap_L_insert_key_value(thread, heap, OBJ_TO_ID(key), value, res)) != STATUS_SUCCESS) {
+        Py_DECREF(key);
+    }
+    return err;
+}
+
+int jheaps_AHeap_OO_insert_key_value(void *heap, PyObject *key, PyObject *value, void** res) {
+    int err;
+    LAZY_THREAD_ATTACH
+    Py_INCREF(key);
+    Py_INCREF(value);
+    if ((err = jheaps_capi_AHeap_L_insert_key_value(thread, heap, OBJ_TO_ID(key), OBJ_TO_ID(value), res)) != STATUS_SUCCESS) {
+        Py_DECREF(key);
+        Py_DECREF(value);
+    }
+    return err;
+}
+
+int jheaps_AHeapHandle_O_get_key(void *handle, PyObject **res) {
+    long long int key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *res = ID_TO_OBJ(key_id);
+    Py_INCREF(*res);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_O_get_value(void *handle, PyObject **res) {
+    long long int value_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_get_value(thread, handle, &value_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    *res = ID_TO_OBJ(value_id);
+    Py_INCREF(*res);
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_O_set_value(void *handle, PyObject *value) {
+    long long int old_value_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_get_value(thread, handle, &old_value_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = jheaps_capi_AHeapHandle_set_value(thread, handle, OBJ_TO_ID(value))) != STATUS_SUCCESS) {
+        return err;
+    }
+    Py_INCREF(value);
+    Py_DECREF(ID_TO_OBJ(old_value_id));
+    return STATUS_SUCCESS;
+}
+
+// change the key of an element, the heap releases the old key and
+// owns the new one only if the change succeeds
+static int update_object_key(void *handle, PyObject *key, int increase) {
+    long long int old_key_id;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &old_key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    Py_INCREF(key);
+    if (increase) {
+        err = jheaps_capi_DEAHeapHandle_L_increase_key(thread, handle, OBJ_TO_ID(key));
+    } else {
+        err = jheaps_capi_AHeapHandle_L_decrease_key(thread, handle, OBJ_TO_ID(key));
+    }
+    if (err != STATUS_SUCCESS) {
+        Py_DECREF(key);
+        return err;
+    }
+    Py_DECREF(ID_TO_OBJ(old_key_id));
+    return STATUS_SUCCESS;
+}
+
+int jheaps_AHeapHandle_O_decrease_key(void *handle, PyObject *key) {
+    return update_object_key(handle, key, 0);
+}
+
+int jheaps_DEAHeapHandle_O_increase_key(void *handle, PyObject *key) {
+    return update_object_key(handle, key, 1);
+}
+
+int jheaps_AHeapHandle_O_destroy(void *handle, int key_owner, int value_owner) {
+    long long int key_id = 0, value_id = 0;
+    int err;
+    LAZY_THREAD_ATTACH
+    if (key_owner && (err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &key_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if (value_owner && (err = jheaps_capi_AHeapHandle_get_value(thread, handle, &value_id)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if ((err = jheaps_capi_handles_destroy(thread, handle)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if (key_owner) {
+        Py_DECREF(ID_TO_OBJ(key_id));
+    }
+    if (value_owner) {
+        Py_DECREF(ID_TO_OBJ(value_id));
+    }
+    return STATUS_SUCCESS;
+}
+
+// release the references of python objects removed from a heap, which
+// is done only after the heap has been emptied since releasing may run
+// arbitrary python code
+static void release_ids(long long int *ids, long long int count) {
+    long long int i;
+    for (i = 0; i < count; i++) {
+        Py_DECREF(ID_TO_OBJ(ids[i]));
+    }
+}
+
+int jheaps_Heap_O_clear(void *heap) {
+    long long int size, count, *ids;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_Heap_size(thread, heap, &size)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if (size == 0) {
+        return STATUS_SUCCESS;
+    }
+    if ((ids = malloc(size * sizeof(long long int))) == NULL) {
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    skip_comparisons = 1;
+    for (count = 0; count < size; count++) {
+        if ((err = jheaps_capi_Heap_L_delete_min(thread, heap, &ids[count])) != STATUS_SUCCESS) {
+            break;
+        }
+    }
+    skip_comparisons = 0;
+    release_ids(ids, count);
+    free(ids);
+    return err;
+}
+
+int jheaps_AHeap_O_clear(void *heap, int key_owner, int value_owner) {
+    long long int size, count, *ids;
+    void *handle;
+    int err;
+    LAZY_THREAD_ATTACH
+    if ((err = jheaps_capi_AHeap_size(thread, heap, &size)) != STATUS_SUCCESS) {
+        return err;
+    }
+    if (size == 0) {
+        return STATUS_SUCCESS;
+    }
+    if ((ids = malloc(2 * size * sizeof(long long int))) == NULL) {
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    skip_comparisons = 1;
+    count = 0;
+    while (size-- > 0) {
+        if ((err = jheaps_capi_AHeap_delete_min(thread, heap, &handle)) != STATUS_SUCCESS) {
+            break;
+        }
+        if (key_owner) {
+            if ((err = jheaps_capi_AHeapHandle_L_get_key(thread, handle, &ids[count])) == STATUS_SUCCESS) {
+                count++;
+            }
+        }
+        if (value_owner && err == STATUS_SUCCESS) {
+            if ((err = jheaps_capi_AHeapHandle_get_value(thread, handle, &ids[count])) == STATUS_SUCCESS) {
+                count++;
+            }
+        }
+        jheaps_capi_handles_destroy(thread, handle);
+        if (err != STATUS_SUCCESS) {
+            break;
+        }
+    }
+    skip_comparisons = 0;
+    release_ids(ids, count);
+    free(ids);
+    return err;
+}
+
+// isolates
+
+int jheaps_isolate_create(int* res) {
+    graal_isolatethread_t *t;
+    LAZY_THREAD_ATTACH
+    if (isolates_count >= MAX_ISOLATES) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Too many isolates");
+    }
+    if (create_isolate(&isolates[isolates_count], &t) != 0) {
+        return set_local_errno(STATUS_ERROR, "Cannot create isolate");
+    }
+    isolate_threads[isolates_count] = t;
+    thread_attached();
+    *res = isolates_count++;
+    return STATUS_SUCCESS;
+}
+
+// whether the isolates accept runtime options, which depends on the
+// GraalVM headers the capi was built with, see JHEAPS_ISOLATE_ARGUMENTS
+int jheaps_isolate_options_supported(int* res) {
+#ifdef JHEAPS_ISOLATE_ARGUMENTS
+    *res = 1;
+#else
+    *res = 0;
+#endif
+    return STATUS_SUCCESS;
+}
+
+int jheaps_isolate_configure_option(char *option) {
+#ifdef JHEAPS_ISOLATE_ARGUMENTS
+    char *copy;
+    size_t len;
+#endif
+    if (isolate != NULL) {
+        return set_local_errno(STATUS_ILLEGAL_STATE, "Backend already initialized");
+    }
+#ifndef JHEAPS_ISOLATE_ARGUMENTS
+    return set_local_errno(STATUS_UNSUPPORTED_OPERATION, "Isolate options are not supported by this build");
+#else
+    // the last slot is kept for the NULL terminating argv
+    if (isolate_options_count >= MAX_ISOLATE_OPTIONS) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Too many isolate options");
+    }
+    len = strlen(option);
+    copy = malloc(len + 1);
+    if (copy == NULL) {
+        return set_local_errno(STATUS_ERROR, "Out of memory");
+    }
+    memcpy(copy, option, len + 1);
+    isolate_options[isolate_options_count++] = copy;
+    return STATUS_SUCCESS;
+#endif
+}
+
+int jheaps_isolate_configure_reserved_address_space_size(long long int size) {
+    if (isolate != NULL) {
+        return set_local_errno(STATUS_ILLEGAL_STATE, "Backend already initialized");
+    }
+    if (size < 0) {
+        return set_local_errno(STATUS_ILLEGAL_ARGUMENT, "Size must be non-negative");
+    }
+    isolate_reserved_address_space_size = size;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_isolate_configure_clear() {
+    if (isolate != NULL) {
+        return set_local_errno(STATUS_ILLEGAL_STATE, "Backend already initialized");
+    }
+    clear_isolate_options();
+    return STATUS_SUCCESS;
+}
+
+int jheaps_isolate_count(int* res) {
+    LAZY_THREAD_ATTACH
+    *res = isolates_count;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_isolate_current(int* res) {
+    *res = current_isolate;
+    return STATUS_SUCCESS;
+}
+
+int jheaps_isolate_enter(int index) {
+    LAZY_THREAD_ATTACH
+    if (index < 0 || index >= isolates_count) {
+        return set_local_errno(STATUS_INDEX_OUT_OF_BOUNDS, "No such isolate");
+    }
+    if (isolate_threads[index] == NULL) {
+        if (attach_thread(index) != 0) {
+            return set_local_errno(STATUS_ERROR, "Cannot attach thread to isolate");
+        }
+    }
+    current_isolate = index;
+    thread = isolate_threads[index];
+    return STATUS_SUCCESS;
+}
@@ -1,6 +1,7 @@
 #ifndef __BACKEND_H
 #define __BACKEND_H
 
+#include <Python.h>
 #include <graal_isolate.h>
 #include <jheaps_capi_types.h>
 
@@ -10,7 +11,7 @@ extern "C" {
 
 // library init
 
-void jheaps_init();
+int jheaps_init();
 
 void jheaps_cleanup();
 
@@ -38,6 +39,18 @@ int jheaps_AHeap_D_insert_key_value(void *, double, long long int, void**);
 
 int jheaps_AHeap_L_insert_key_value(void *, long long int, long long int, void**);
 
+int jheaps_AHeap_D_insert_key_value_many(void *, double *, long long *, long long *, long long int);
+
+int jheaps_AHeap_L_insert_key_value_many(void *, long long *, long long *, long long *, long long int);
+
+int jheaps_AHeap_D_insert_many(void *, double *, long long int);
+
+int jheaps_AHeap_L_insert_many(void *, long long *, long long int);
+
+int jheaps_AHeap_D_delete_min_many_max_key(void *, long long int, double *);
+
+int jheaps_AHeap_L_delete_min_many_max_key(void *, long long int, long long *);
+
 int jheaps_AHeap_find_min(void *, void**);
 
 int jheaps_AHeap_delete_min(void *, void**);
@@ -60,8 +73,20 @@ int jheaps_AHeapHandle_D_decrease_key(void *, double);
 
 int jheaps_AHeapHandle_L_decrease_key(void *, long long int);
 
+int jheaps_AHeapHandle_D_decrease_key_many(long long *, double *, long long int);
+
+int jheaps_AHeapHandle_L_decrease_key_many(long long *, long long *, long long int);
+
 int jheaps_AHeapHandle_delete(void *);
 
+int jheaps_AHeapHandle_D_get_key_many(long long *, double *, long long int);
+
+int jheaps_AHeapHandle_L_get_key_many(long long *, long long *, long long int);
+
+int jheaps_AHeapHandle_get_value_many(long long *, long long *, long long int);
+
+int jheaps_AHeapHandle_delete_many(long long *, long long int);
+
 int jheaps_DEAHeap_find_max(void *, void**);
 
 int jheaps_DEAHeap_delete_max(void *, void**);
@@ -70,6 +95,10 @@ int jheaps_DEAHeapHandle_D_increase_key(void *, double);
 
 int jheaps_DEAHeapHandle_L_increase_key(void *, long long int);
 
+int jheaps_DEAHeapHandle_D_increase_key_many(long long *, double *, long long int);
+
+int jheaps_DEAHeapHandle_L_increase_key_many(long long *, long long *, long long int);
+
 int jheaps_DEHeap_D_find_max(void *, double*);
 
 int jheaps_DEHeap_L_find_max(void *, long long*);
@@ -78,8 +107,14 @@ int jheaps_DEHeap_D_delete_max(void *, double*);
 
 int jheaps_DEHeap_L_delete_max(void *, long long*);
 
+int jheaps_DEHeap_D_delete_max_many(void *, double *, long long int, long long*);
+
+int jheaps_DEHeap_L_delete_max_many(void *, long long *, long long int, long long*);
+
 int jheaps_handles_destroy(void *);
 
+int jheaps_handles_destroy_many(long long *, long long int);
+
 int jheaps_Heap_create(heap_type_t, void**);
 
 int jheaps_dary_Heap_create(heap_type_t, int, void**);
@@ -90,6 +125,10 @@ int jheaps_double_radix_Heap_create(heap_type_t, double, double, void**);
 
 int jheaps_long_radix_Heap_create(heap_type_t, long long int, long long int, void**);
 
+int jheaps_long_radix_keys_shift(long long *, long long *, long long int, long long int, int);
+
+int jheaps_get_id_comparator(long long int*);
+
 int jheaps_Heap_comparator_create(heap_type_t, void *, void**);
 
 int jheaps_dary_Heap_comparator_create(heap_type_t, void *, int, void**);
@@ -100,6 +139,10 @@ int jheaps_Heap_D_insert_key(void *, double);
 
 int jheaps_Heap_L_insert_key(void *, long long int);
 
+int jheaps_Heap_D_insert_many(void *, double *, long long int);
+
+int jheaps_Heap_L_insert_many(void *, long long *, long long int);
+
 int jheaps_Heap_D_find_min(void *, double*);
 
 int jheaps_Heap_L_find_min(void *, long long*);
@@ -108,6 +151,10 @@ int jheaps_Heap_D_delete_min(void *, double*);
 
 int jheaps_Heap_L_delete_min(void *, long long*);
 
+int jheaps_Heap_D_delete_min_many(void *, double *, long long int, long long*);
+
+int jheaps_Heap_L_delete_min_many(void *, long long *, long long int, long long*);
+
 int jheaps_Heap_size(void *, long long*);
 
 int jheaps_Heap_isempty(void *, int*);
@@ -134,6 +181,178 @@ int jheaps_MDEAHeap_D_meld(void *, void *);
 
 int jheaps_MDEAHeap_L_meld(void *, void *);
 
+int jheaps_IHeap_create(void *, long long int, void**);
+
+int jheaps_IHeap_destroy(void *);
+
+int jheaps_IHeap_D_push(void *, long long int, double);
+
+int jheaps_IHeap_L_push(void *, long long int, long long int);
+
+int jheaps_IHeap_D_decrease_key(void *, long long int, double);
+
+int jheaps_IHeap_L_decrease_key(void *, long long int, long long int);
+
+int jheaps_IHeap_D_get_key(void *, long long int, double*);
+
+int jheaps_IHeap_L_get_key(void *, long long int, long long*);
+
+int jheaps_IHeap_delete(void *, long long int);
+
+int jheaps_IHeap_contains(void *, long long int, int*);
+
+int jheaps_IHeap_D_find_min(void *, long long*, double*);
+
+int jheaps_IHeap_L_find_min(void *, long long*, long long*);
+
+int jheaps_IHeap_D_pop(void *, long long*, double*);
+
+int jheaps_IHeap_L_pop(void *, long long*, long long*);
+
+int jheaps_IHeap_size(void *, long long*);
+
+int jheaps_IHeap_isempty(void *, int*);
+
+int jheaps_IHeap_clear(void *);
+
+// bounded heaps
+
+int jheaps_BHeap_create(void *, long long int, int, void**);
+
+int jheaps_BHeap_destroy(void *);
+
+int jheaps_BHeap_D_push(void *, double, long long int, int*);
+
+int jheaps_BHeap_L_push(void *, long long int, long long int, int*);
+
+int jheaps_BHeap_D_push_many(void *, double *, long long *, long long int, long long int, long long*);
+
+int jheaps_BHeap_L_push_many(void *, long long *, long long *, long long int, long long int, long long*);
+
+int jheaps_BHeap_D_result(void *, double *, long long *, long long int);
+
+int jheaps_BHeap_L_result(void *, long long *, long long *, long long int);
+
+int jheaps_BHeap_size(void *, long long*);
+
+int jheaps_BHeap_clear(void *);
+
+// composite keys
+
+int jheaps_get_DL_comparator(long long int*);
+
+int jheaps_get_LL_comparator(long long int*);
+
+int jheaps_Heap_DL_insert_key(void *, double, long long int);
+
+int jheaps_Heap_DL_find_min(void *, double*, long long*);
+
+int jheaps_Heap_DL_delete_min(void *, double*, long long*);
+
+int jheaps_DEHeap_DL_find_max(void *, double*, long long*);
+
+int jheaps_DEHeap_DL_delete_max(void *, double*, long long*);
+
+int jheaps_AHeap_DL_insert_key_value(void *, double, long long int, long long int, void**);
+
+int jheaps_AHeapHandle_DL_get_key(void *, double*, long long*);
+
+int jheaps_AHeapHandle_DL_decrease_key(void *, double, long long int);
+
+int jheaps_DEAHeapHandle_DL_increase_key(void *, double, long long int);
+
+int jheaps_Heap_LL_insert_key(void *, long long int, long long int);
+
+int jheaps_Heap_LL_find_min(void *, long long*, long long*);
+
+int jheaps_Heap_LL_delete_min(void *, long long*, long long*);
+
+int jheaps_DEHeap_LL_find_max(void *, long long*, long long*);
+
+int jheaps_DEHeap_LL_delete_max(void *, long long*, long long*);
+
+int jheaps_AHeap_LL_insert_key_value(void *, long long int, long long int, long long int, void**);
+
+int jheaps_AHeapHandle_LL_get_key(void *, long long*, long long*);
+
+int jheaps_AHeapHandle_LL_decrease_key(void *, long long int, long long int);
+
+int jheaps_DEAHeapHandle_LL_increase_key(void *, long long int, long long int);
+
+int jheaps_Heap_composite_clear(void *);
+
+int jheaps_AHeap_composite_clear(void *);
+
+int jheaps_Heap_DL_insert_many(void *, double *, long long int, long long int);
+
+int jheaps_Heap_LL_insert_many(void *, long long *, long long int, long long int);
+
+int jheaps_Heap_DL_delete_min_many_until(void *, double, long long int, double *, long long *, long long int, long long*);
+
+int jheaps_Heap_LL_delete_min_many_until(void *, long long int, long long int, long long *, long long *, long long int, long long*);
+
+int jheaps_AHeapHandle_composite_key_destroy(void *);
+
+// object keys and values
+
+int jheaps_Heap_O_insert_key(void *, PyObject *);
+
+int jheaps_Heap_O_find_min(void *, PyObject **);
+
+int jheaps_Heap_O_delete_min(void *, PyObject **);
+
+int jheaps_DEHeap_O_find_max(void *, PyObject **);
+
+int jheaps_DEHeap_O_delete_max(void *, PyObject **);
+
+int jheaps_AHeap_DO_insert_key_value(void *, double, PyObject *, void**);
+
+int jheaps_AHeap_LO_insert_key_value(void *, long long int, PyObject *, void**);
+
+int jheaps_AHeap_OL_insert_key_value(void *, PyObject *, long long int, void**);
+
+int jheaps_AHeap_OO_insert_key_value(void *, PyObject *, PyObject *, void**);
+
+int jheaps_AHeapHandle_O_get_key(void *, PyObject **);
+
+int jheaps_AHeapHandle_O_get_value(void *, PyObject **);
+
+int jheaps_AHeapHandle_O_set_value(void *, PyObject *);
+
+int jheaps_AHeapHandle_O_decrease_key(void *, PyObject *);
+
+int jheaps_DEAHeapHandle_O_increase_key(void *, PyObject *);
+
+int jheaps_AHeapHandle_O_destroy(void *, int, int);
+
+int jheaps_Heap_O_clear(void *);
+
+int jheaps_AHeap_O_clear(void *, int, int);
+
+// isolates
+
+int jheaps_isolate_create(int*);
+
+int jheaps_isolate_count(int*);
+
+int jheaps_isolate_current(int*);
+
+int jheaps_isolate_enter(int);
+
+int jheaps_isolate_options_supported(int*);
+
+int jheaps_isolate_configure_option(char *);
+
+int jheaps_isolate_configure_reserved_address_space_size(long long int);
+
+int jheaps_isolate_configure_clear();
+
+// threads
+
+int jheaps_thread_detach();
+
+int jheaps_thread_metrics(long long int*, long long int*);
+
 
 #if defined(__cplusplus)
 }
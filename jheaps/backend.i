@@ -25,6 +25,23 @@
     %append_output(SWIG_FromCharPtr(($*1_ltype)*$1));
 }
 
+// custom typemap to append PyObject** types to the result, the
+// function returns a new reference which is passed to the result
+%typemap(in,numinputs=0,noblock=1) PyObject **OUTPUT (PyObject *temp = NULL) {
+    $1 = &temp;
+}
+
+%typemap(argout,noblock=1) PyObject **OUTPUT {
+    %append_output(*$1);
+    temp$argnum = NULL;
+}
+
+// the reference is released if the call fails after returning the object,
+// e.g. when a comparison of python objects raised an exception
+%typemap(freearg,noblock=1) PyObject **OUTPUT {
+    Py_XDECREF(temp$argnum);
+}
+
 // convert a long to a void function pointer
 %typemap(in) void *LONG_TO_FPTR { 
     $1 = PyLong_AsVoidPtr($input);    
@@ -43,6 +60,166 @@
     }
 }
 
+// convert a contiguous buffer of 64-bit floats or integers (e.g. array.array,
+// numpy arrays or memoryviews) to a pointer and a length
+%{
+static int jheaps_get_buffer(PyObject *obj, Py_buffer *view, char type, int flags) {
+    const char *format;
+
+    if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | flags) != 0) {
+        return -1;
+    }
+    format = view->format;
+    if (format != NULL && (format[0] == '@' || format[0] == '=')) {
+        format++;
+    }
+    if (view->ndim > 1 || view->itemsize != 8 || format == NULL || format[0] == '\0' || format[1] != '\0'
+        || !(format[0] == type || (type == 'q' && format[0] == 'l' && sizeof(long) == 8))) {
+        PyErr_Format(PyExc_TypeError, "expected a contiguous buffer of %s",
+                     type == 'd' ? "64-bit floats" : "64-bit integers");
+        PyBuffer_Release(view);
+        return -1;
+    }
+    return 0;
+}
+%}
+
+%typemap(in) (double *IN_ARRAY, long long int IN_LEN) (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'd', PyBUF_SIMPLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (double *) view.buf;
+    $2 = (long long int) (view.len / view.itemsize);
+}
+
+%typemap(freearg) (double *IN_ARRAY, long long int IN_LEN) {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+%typemap(in) (long long *IN_ARRAY, long long int IN_LEN) (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'q', PyBUF_SIMPLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (long long *) view.buf;
+    $2 = (long long int) (view.len / view.itemsize);
+}
+
+%typemap(freearg) (long long *IN_ARRAY, long long int IN_LEN) {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+%typemap(in) double *IN_ARRAY (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'd', PyBUF_SIMPLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (double *) view.buf;
+}
+
+%typemap(freearg) double *IN_ARRAY {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+%typemap(in) long long *IN_ARRAY (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'q', PyBUF_SIMPLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (long long *) view.buf;
+}
+
+%typemap(freearg) long long *IN_ARRAY {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+// writable buffers which are filled by the backend
+%typemap(in) (double *OUT_ARRAY, long long int OUT_LEN) (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'd', PyBUF_WRITABLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (double *) view.buf;
+    $2 = (long long int) (view.len / view.itemsize);
+}
+
+%typemap(freearg) (double *OUT_ARRAY, long long int OUT_LEN) {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+%typemap(in) (long long *OUT_ARRAY, long long int OUT_LEN) (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'q', PyBUF_WRITABLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (long long *) view.buf;
+    $2 = (long long int) (view.len / view.itemsize);
+}
+
+%typemap(freearg) (long long *OUT_ARRAY, long long int OUT_LEN) {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+%typemap(in) double *OUT_ARRAY (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'd', PyBUF_WRITABLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (double *) view.buf;
+}
+
+%typemap(freearg) double *OUT_ARRAY {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+%typemap(in) long long *OUT_ARRAY (Py_buffer view, int has_view = 0) {
+    if (jheaps_get_buffer($input, &view, 'q', PyBUF_WRITABLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    $1 = (long long *) view.buf;
+}
+
+%typemap(freearg) long long *OUT_ARRAY {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+// same as above but None is translated to a NULL pointer
+%typemap(in) long long *IN_ARRAY_OR_NONE (Py_buffer view, int has_view = 0) {
+    if ($input != Py_None) {
+        if (jheaps_get_buffer($input, &view, 'q', PyBUF_SIMPLE) != 0) {
+            SWIG_fail;
+        }
+        has_view = 1;
+        $1 = (long long *) view.buf;
+    } else {
+        $1 = (long long *) 0;
+    }
+}
+
+%typemap(freearg) long long *IN_ARRAY_OR_NONE {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
 enum status_t { 
     STATUS_SUCCESS = 0,
     STATUS_ERROR,
@@ -90,7 +267,7 @@ enum heap_type_t {
 
 // library init
 
-void jheaps_init();
+int jheaps_init();
 
 void jheaps_cleanup();
 
@@ -158,7 +335,67 @@ int raise_exception_on_error(int result) {
     if (raise_exception_on_error(result)) { 
         SWIG_fail;
     }
+    // raise exceptions from comparisons of python objects
+    if (PyErr_Occurred()) {
+        SWIG_fail;
+    }
+}
+
+// operations which never call into python release the GIL while running
+// in the backend. Each thread is attached to the isolate using its own
+// isolate thread, thus independent heaps can be used in parallel.
+%define JHEAPS_RELEASE_GIL(name)
+%exception name {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+    if (raise_exception_on_error(result)) {
+        SWIG_fail;
+    }
 }
+%enddef
+
+JHEAPS_RELEASE_GIL(jheaps_Heap_D_insert_many);
+JHEAPS_RELEASE_GIL(jheaps_Heap_L_insert_many);
+JHEAPS_RELEASE_GIL(jheaps_Heap_D_delete_min_many);
+JHEAPS_RELEASE_GIL(jheaps_Heap_L_delete_min_many);
+JHEAPS_RELEASE_GIL(jheaps_DEHeap_D_delete_max_many);
+JHEAPS_RELEASE_GIL(jheaps_DEHeap_L_delete_max_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_D_insert_key_value_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_L_insert_key_value_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_D_insert_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_L_insert_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_D_delete_min_many_max_key);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_L_delete_min_many_max_key);
+JHEAPS_RELEASE_GIL(jheaps_AHeapHandle_D_get_key_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeapHandle_L_get_key_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeapHandle_get_value_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeapHandle_delete_many);
+JHEAPS_RELEASE_GIL(jheaps_AHeapHandle_D_decrease_key_many);
+JHEAPS_RELEASE_GIL(jheaps_DEAHeapHandle_D_increase_key_many);
+JHEAPS_RELEASE_GIL(jheaps_handles_destroy_many);
+JHEAPS_RELEASE_GIL(jheaps_Heap_D_heapify);
+JHEAPS_RELEASE_GIL(jheaps_Heap_L_heapify);
+JHEAPS_RELEASE_GIL(jheaps_dary_Heap_D_heapify);
+JHEAPS_RELEASE_GIL(jheaps_dary_Heap_L_heapify);
+JHEAPS_RELEASE_GIL(jheaps_Heap_clear);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_clear);
+JHEAPS_RELEASE_GIL(jheaps_MAHeap_D_meld);
+JHEAPS_RELEASE_GIL(jheaps_MDEAHeap_D_meld);
+JHEAPS_RELEASE_GIL(jheaps_IHeap_clear);
+JHEAPS_RELEASE_GIL(jheaps_IHeap_destroy);
+JHEAPS_RELEASE_GIL(jheaps_BHeap_D_push_many);
+JHEAPS_RELEASE_GIL(jheaps_BHeap_L_push_many);
+JHEAPS_RELEASE_GIL(jheaps_BHeap_D_result);
+JHEAPS_RELEASE_GIL(jheaps_BHeap_L_result);
+JHEAPS_RELEASE_GIL(jheaps_BHeap_clear);
+JHEAPS_RELEASE_GIL(jheaps_BHeap_destroy);
+JHEAPS_RELEASE_GIL(jheaps_Heap_composite_clear);
+JHEAPS_RELEASE_GIL(jheaps_AHeap_composite_clear);
+JHEAPS_RELEASE_GIL(jheaps_Heap_DL_insert_many);
+JHEAPS_RELEASE_GIL(jheaps_Heap_LL_insert_many);
+JHEAPS_RELEASE_GIL(jheaps_Heap_DL_delete_min_many_until);
+JHEAPS_RELEASE_GIL(jheaps_Heap_LL_delete_min_many_until);
 
 // ignore the integer return code
 // we already handled this using the exception 
@@ -213,6 +450,18 @@ int jheaps_AHeap_D_insert_key_value(void *, double, long long int, void** OUTPUT
 
 int jheaps_AHeap_L_insert_key_value(void *, long long int, long long int, void** OUTPUT);
 
+int jheaps_AHeap_D_insert_key_value_many(void *, double *IN_ARRAY, long long *IN_ARRAY_OR_NONE, long long *OUT_ARRAY, long long int);
+
+int jheaps_AHeap_L_insert_key_value_many(void *, long long *IN_ARRAY, long long *IN_ARRAY_OR_NONE, long long *OUT_ARRAY, long long int);
+
+int jheaps_AHeap_D_insert_many(void *, double *IN_ARRAY, long long int IN_LEN);
+
+int jheaps_AHeap_L_insert_many(void *, long long *IN_ARRAY, long long int IN_LEN);
+
+int jheaps_AHeap_D_delete_min_many_max_key(void *, long long int, double* OUTPUT);
+
+int jheaps_AHeap_L_delete_min_many_max_key(void *, long long int, long long* OUTPUT);
+
 int jheaps_AHeap_find_min(void *, void** OUTPUT);
 
 int jheaps_AHeap_delete_min(void *, void** OUTPUT);
@@ -235,8 +484,20 @@ int jheaps_AHeapHandle_D_decrease_key(void *, double);
 
 int jheaps_AHeapHandle_L_decrease_key(void *, long long int);
 
+int jheaps_AHeapHandle_D_decrease_key_many(long long *IN_ARRAY, double *IN_ARRAY, long long int);
+
+int jheaps_AHeapHandle_L_decrease_key_many(long long *IN_ARRAY, long long *IN_ARRAY, long long int);
+
 int jheaps_AHeapHandle_delete(void *);
 
+int jheaps_AHeapHandle_D_get_key_many(long long *IN_ARRAY, double *OUT_ARRAY, long long int);
+
+int jheaps_AHeapHandle_L_get_key_many(long long *IN_ARRAY, long long *OUT_ARRAY, long long int);
+
+int jheaps_AHeapHandle_get_value_many(long long *IN_ARRAY, long long *OUT_ARRAY, long long int);
+
+int jheaps_AHeapHandle_delete_many(long long *IN_ARRAY, long long int IN_LEN);
+
 int jheaps_DEAHeap_find_max(void *, void** OUTPUT);
 
 int jheaps_DEAHeap_delete_max(void *, void** OUTPUT);
@@ -245,6 +506,10 @@ int jheaps_DEAHeapHandle_D_increase_key(void *, double);
 
 int jheaps_DEAHeapHandle_L_increase_key(void *, long long int);
 
+int jheaps_DEAHeapHandle_D_increase_key_many(long long *IN_ARRAY, double *IN_ARRAY, long long int);
+
+int jheaps_DEAHeapHandle_L_increase_key_many(long long *IN_ARRAY, long long *IN_ARRAY, long long int);
+
 int jheaps_DEHeap_D_find_max(void *, double* OUTPUT);
 
 int jheaps_DEHeap_L_find_max(void *, long long* OUTPUT);
@@ -253,8 +518,14 @@ int jheaps_DEHeap_D_delete_max(void *, double* OUTPUT);
 
 int jheaps_DEHeap_L_delete_max(void *, long long* OUTPUT);
 
+int jheaps_DEHeap_D_delete_max_many(void *, double *OUT_ARRAY, long long int OUT_LEN, long long* OUTPUT);
+
+int jheaps_DEHeap_L_delete_max_many(void *, long long *OUT_ARRAY, long long int OUT_LEN, long long* OUTPUT);
+
 int jheaps_handles_destroy(void *);
 
+int jheaps_handles_destroy_many(long long *IN_ARRAY, long long int IN_LEN);
+
 int jheaps_Heap_create(heap_type_t, void** OUTPUT);
 
 int jheaps_dary_Heap_create(heap_type_t, int, void** OUTPUT);
@@ -265,6 +536,10 @@ int jheaps_double_radix_Heap_create(heap_type_t, double, double, void** OUTPUT);
 
 int jheaps_long_radix_Heap_create(heap_type_t, long long int, long long int, void** OUTPUT);
 
+int jheaps_long_radix_keys_shift(long long *IN_ARRAY, long long *OUT_ARRAY, long long int, long long int, int);
+
+int jheaps_get_id_comparator(long long int* OUTPUT);
+
 int jheaps_Heap_comparator_create(heap_type_t, void *LONG_TO_FPTR, void** OUTPUT);
 
 int jheaps_dary_Heap_comparator_create(heap_type_t, void *LONG_TO_FPTR, int, void** OUTPUT);
@@ -275,6 +550,10 @@ int jheaps_Heap_D_insert_key(void *, double);
 
 int jheaps_Heap_L_insert_key(void *, long long int);
 
+int jheaps_Heap_D_insert_many(void *, double *IN_ARRAY, long long int IN_LEN);
+
+int jheaps_Heap_L_insert_many(void *, long long *IN_ARRAY, long long int IN_LEN);
+
 int jheaps_Heap_D_find_min(void *, double* OUTPUT);
 
 int jheaps_Heap_L_find_min(void *, long long* OUTPUT);
@@ -283,23 +562,27 @@ int jheaps_Heap_D_delete_min(void *, double* OUTPUT);
 
 int jheaps_Heap_L_delete_min(void *, long long* OUTPUT);
 
+int jheaps_Heap_D_delete_min_many(void *, double *OUT_ARRAY, long long int OUT_LEN, long long* OUTPUT);
+
+int jheaps_Heap_L_delete_min_many(void *, long long *OUT_ARRAY, long long int OUT_LEN, long long* OUTPUT);
+
 int jheaps_Heap_size(void *, long long* OUTPUT);
 
 int jheaps_Heap_isempty(void *, int* OUTPUT);
 
 int jheaps_Heap_clear(void *);
 
-int jheaps_Heap_D_heapify(heap_type_t, double*, long long*, int, void** OUTPUT);
+int jheaps_Heap_D_heapify(heap_type_t, double *IN_ARRAY, long long *IN_ARRAY_OR_NONE, int, void** OUTPUT);
 
-int jheaps_Heap_L_heapify(heap_type_t, long long*, long long*, int, void** OUTPUT);
+int jheaps_Heap_L_heapify(heap_type_t, long long *IN_ARRAY, long long *IN_ARRAY_OR_NONE, int, void** OUTPUT);
 
-int jheaps_dary_Heap_D_heapify(heap_type_t, int, double*, long long*, int, void** OUTPUT);
+int jheaps_dary_Heap_D_heapify(heap_type_t, int, double *IN_ARRAY, long long *IN_ARRAY_OR_NONE, int, void** OUTPUT);
 
-int jheaps_dary_Heap_L_heapify(heap_type_t, int, long long*, long long*, int, void** OUTPUT);
+int jheaps_dary_Heap_L_heapify(heap_type_t, int, long long *IN_ARRAY, long long *IN_ARRAY_OR_NONE, int, void** OUTPUT);
 
-int jheaps_Heap_L_comparator_heapify(heap_type_t, void *LONG_TO_FPTR, long long*, long long*, int, void** OUTPUT);
+int jheaps_Heap_L_comparator_heapify(heap_type_t, void *LONG_TO_FPTR, long long *IN_ARRAY, long long *IN_ARRAY_OR_NONE, int, void** OUTPUT);
 
-int jheaps_dary_Heap_L_comparator_heapify(heap_type_t, void *LONG_TO_FPTR, int, long long*, long long*, int, void** OUTPUT);
+int jheaps_dary_Heap_L_comparator_heapify(heap_type_t, void *LONG_TO_FPTR, int, long long *IN_ARRAY, long long *IN_ARRAY_OR_NONE, int, void** OUTPUT);
 
 int jheaps_MAHeap_D_meld(void *, void *);
 
@@ -308,3 +591,175 @@ int jheaps_MAHeap_L_meld(void *, void *);
 int jheaps_MDEAHeap_D_meld(void *, void *);
 
 int jheaps_MDEAHeap_L_meld(void *, void *);
+
+int jheaps_IHeap_create(void *, long long int, void** OUTPUT);
+
+int jheaps_IHeap_destroy(void *);
+
+int jheaps_IHeap_D_push(void *, long long int, double);
+
+int jheaps_IHeap_L_push(void *, long long int, long long int);
+
+int jheaps_IHeap_D_decrease_key(void *, long long int, double);
+
+int jheaps_IHeap_L_decrease_key(void *, long long int, long long int);
+
+int jheaps_IHeap_D_get_key(void *, long long int, double* OUTPUT);
+
+int jheaps_IHeap_L_get_key(void *, long long int, long long* OUTPUT);
+
+int jheaps_IHeap_delete(void *, long long int);
+
+int jheaps_IHeap_contains(void *, long long int, int* OUTPUT);
+
+int jheaps_IHeap_D_find_min(void *, long long* OUTPUT, double* OUTPUT);
+
+int jheaps_IHeap_L_find_min(void *, long long* OUTPUT, long long* OUTPUT);
+
+int jheaps_IHeap_D_pop(void *, long long* OUTPUT, double* OUTPUT);
+
+int jheaps_IHeap_L_pop(void *, long long* OUTPUT, long long* OUTPUT);
+
+int jheaps_IHeap_size(void *, long long* OUTPUT);
+
+int jheaps_IHeap_isempty(void *, int* OUTPUT);
+
+int jheaps_IHeap_clear(void *);
+
+// bounded heaps
+
+int jheaps_BHeap_create(void *, long long int, int, void** OUTPUT);
+
+int jheaps_BHeap_destroy(void *);
+
+int jheaps_BHeap_D_push(void *, double, long long int, int* OUTPUT);
+
+int jheaps_BHeap_L_push(void *, long long int, long long int, int* OUTPUT);
+
+int jheaps_BHeap_D_push_many(void *, double *IN_ARRAY, long long *IN_ARRAY_OR_NONE, long long int, long long int, long long* OUTPUT);
+
+int jheaps_BHeap_L_push_many(void *, long long *IN_ARRAY, long long *IN_ARRAY_OR_NONE, long long int, long long int, long long* OUTPUT);
+
+int jheaps_BHeap_D_result(void *, double *OUT_ARRAY, long long *OUT_ARRAY, long long int);
+
+int jheaps_BHeap_L_result(void *, long long *OUT_ARRAY, long long *OUT_ARRAY, long long int);
+
+int jheaps_BHeap_size(void *, long long* OUTPUT);
+
+int jheaps_BHeap_clear(void *);
+
+// composite keys
+
+int jheaps_get_DL_comparator(long long int* OUTPUT);
+
+int jheaps_get_LL_comparator(long long int* OUTPUT);
+
+int jheaps_Heap_DL_insert_key(void *, double, long long int);
+
+int jheaps_Heap_DL_find_min(void *, double* OUTPUT, long long* OUTPUT);
+
+int jheaps_Heap_DL_delete_min(void *, double* OUTPUT, long long* OUTPUT);
+
+int jheaps_DEHeap_DL_find_max(void *, double* OUTPUT, long long* OUTPUT);
+
+int jheaps_DEHeap_DL_delete_max(void *, double* OUTPUT, long long* OUTPUT);
+
+int jheaps_AHeap_DL_insert_key_value(void *, double, long long int, long long int, void** OUTPUT);
+
+int jheaps_AHeapHandle_DL_get_key(void *, double* OUTPUT, long long* OUTPUT);
+
+int jheaps_AHeapHandle_DL_decrease_key(void *, double, long long int);
+
+int jheaps_DEAHeapHandle_DL_increase_key(void *, double, long long int);
+
+int jheaps_Heap_LL_insert_key(void *, long long int, long long int);
+
+int jheaps_Heap_LL_find_min(void *, long long* OUTPUT, long long* OUTPUT);
+
+int jheaps_Heap_LL_delete_min(void *, long long* OUTPUT, long long* OUTPUT);
+
+int jheaps_DEHeap_LL_find_max(void *, long long* OUTPUT, long long* OUTPUT);
+
+int jheaps_DEHeap_LL_delete_max(void *, long long* OUTPUT, long long* OUTPUT);
+
+int jheaps_AHeap_LL_insert_key_value(void *, long long int, long long int, long long int, void** OUTPUT);
+
+int jheaps_AHeapHandle_LL_get_key(void *, long long* OUTPUT, long long* OUTPUT);
+
+int jheaps_AHeapHandle_LL_decrease_key(void *, long long int, long long int);
+
+int jheaps_DEAHeapHandle_LL_increase_key(void *, long long int, long long int);
+
+int jheaps_Heap_composite_clear(void *);
+
+int jheaps_AHeap_composite_clear(void *);
+
+int jheaps_Heap_DL_insert_many(void *, double *IN_ARRAY, long long int IN_LEN, long long int);
+
+int jheaps_Heap_LL_insert_many(void *, long long *IN_ARRAY, long long int IN_LEN, long long int);
+
+int jheaps_Heap_DL_delete_min_many_until(void *, double, long long int, double *OUT_ARRAY, long long *OUT_ARRAY, long long int, long long* OUTPUT);
+
+int jheaps_Heap_LL_delete_min_many_until(void *, long long int, long long int, long long *OUT_ARRAY, long long *OUT_ARRAY, long long int, long long* OUTPUT);
+
+int jheaps_AHeapHandle_composite_key_destroy(void *);
+
+// object keys and values
+
+int jheaps_Heap_O_insert_key(void *, PyObject *);
+
+int jheaps_Heap_O_find_min(void *, PyObject** OUTPUT);
+
+int jheaps_Heap_O_delete_min(void *, PyObject** OUTPUT);
+
+int jheaps_DEHeap_O_find_max(void *, PyObject** OUTPUT);
+
+int jheaps_DEHeap_O_delete_max(void *, PyObject** OUTPUT);
+
+int jheaps_AHeap_DO_insert_key_value(void *, double, PyObject *, void** OUTPUT);
+
+int jheaps_AHeap_LO_insert_key_value(void *, long long int, PyObject *, void** OUTPUT);
+
+int jheaps_AHeap_OL_insert_key_value(void *, PyObject *, long long int, void** OUTPUT);
+
+int jheaps_AHeap_OO_insert_key_value(void *, PyObject *, PyObject *, void** OUTPUT);
+
+int jheaps_AHeapHandle_O_get_key(void *, PyObject** OUTPUT);
+
+int jheaps_AHeapHandle_O_get_value(void *, PyObject** OUTPUT);
+
+int jheaps_AHeapHandle_O_set_value(void *, PyObject *);
+
+int jheaps_AHeapHandle_O_decrease_key(void *, PyObject *);
+
+int jheaps_DEAHeapHandle_O_increase_key(void *, PyObject *);
+
+int jheaps_AHeapHandle_O_destroy(void *, int, int);
+
+int jheaps_Heap_O_clear(void *);
+
+int jheaps_AHeap_O_clear(void *, int, int);
+
+// isolates
+
+int jheaps_isolate_create(int* OUTPUT);
+
+int jheaps_isolate_count(int* OUTPUT);
+
+int jheaps_isolate_current(int* OUTPUT);
+
+int jheaps_isolate_enter(int);
+
+int jheaps_isolate_options_supported(int* OUTPUT);
+
+int jheaps_isolate_configure_option(char *);
+
+int jheaps_isolate_configure_reserved_address_space_size(long long int);
+
+int jheaps_isolate_configure_clear();
+
+// threads
+
+int jheaps_thread_detach();
+
+int jheaps_thread_metrics(long long int* OUTPUT, long long int* OUTPUT);
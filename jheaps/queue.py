@@ -0,0 +1,319 @@
+"""
+Synchronized priority queues backed by heaps.
+
+The queues follow the interface of :py:class:`queue.PriorityQueue` from the
+standard library. They store numeric priorities natively by default, and can
+replace the standard library queues for any entries by passing `key_type=object`
+or a `key` function. Additionally a relaxed
+concurrent priority queue is provided which scales better with many threads.
+"""
+
+import os
+import queue
+import random
+import threading
+from time import monotonic as _time
+
+from . import create_implicit_binary_heap, create_implicit_dary_heap
+from .types import AddressableHeap
+
+
+class PriorityQueue(queue.PriorityQueue):
+    """A thread-safe priority queue which retrieves entries in priority order
+    (lowest first). It supports the same blocking `put`/`get`, timeout and
+    `task_done`/`join` semantics as :py:class:`queue.PriorityQueue` but stores
+    its entries in a heap created by one of the `create_*` factory functions.
+
+    Entries with `float` or `int` keys, or with `(float, int)` and `(int, int)` tuple
+    keys, are stored and compared natively by the backend. The default key type
+    is `float`. Use `key` in order to order arbitrary objects by a numeric
+    priority without calling back into Python for comparisons, or `key_type=object`
+    for entries compared by Python, such as the `(priority, data)` tuples commonly
+    used with :py:class:`queue.PriorityQueue`. Thus with the default key type the
+    queue is not a drop-in replacement for arbitrary entries, unlike
+    :py:class:`jheaps.aio.PriorityQueue` whose default key type is `object`.
+
+    :param maxsize: upper bound on the number of entries, zero or less for an
+      unbounded queue
+    :type maxsize: int
+    :param factory: the heap factory function, by default a binary heap
+    :type factory: callable
+    :param key_type: the key type of the heap, by default float
+    :type key_type: float, int, a tuple key type or object
+    :param kwargs: additional keyword arguments passed to the factory, e.g. `key`
+      or `d`
+    """
+
+    def __init__(self, maxsize=0, factory=None, key_type=float, **kwargs):
+        self._factory = factory if factory is not None else create_implicit_binary_heap
+        self._key_type = key_type
+        self._factory_kwargs = kwargs
+        super().__init__(maxsize)
+
+    def put_many(self, items, block=True, timeout=None):
+        """Put many entries into the queue at once. The entries are inserted
+        together, thus a bounded queue must have room for all of them.
+
+        Heaps with `float` or `int` keys insert all entries using a single
+        backend call, preferably given as a buffer such as an `array.array`.
+
+        :param items: the entries
+        :param block: whether to block until there is room for all entries
+        :param timeout: block at most timeout seconds and then raise
+          :py:class:`queue.Full`
+        :raises ValueError: if the entries are more than the maximum size of
+          the queue
+        """
+        insert_many = None
+        if not self._addressable:
+            insert_many = getattr(self.queue, "insert_many", None)
+        if insert_many is None or not hasattr(items, "__len__"):
+            items = list(items)
+        count = len(items)
+        if 0 < self.maxsize < count:
+            raise ValueError("More entries than the maximum size of the queue")
+        with self.not_full:
+            if self.maxsize > 0:
+                if not block:
+                    if self._qsize() + count > self.maxsize:
+                        raise queue.Full
+                elif timeout is None:
+                    while self._qsize() + count > self.maxsize:
+                        self.not_full.wait()
+                elif timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                else:
+                    endtime = _time() + timeout
+                    while self._qsize() + count > self.maxsize:
+                        remaining = endtime - _time()
+                        if remaining <= 0.0:
+                            raise queue.Full
+                        self.not_full.wait(remaining)
+            if insert_many is not None:
+                insert_many(items)
+            else:
+                for item in items:
+                    self._put(item)
+            self.unfinished_tasks += count
+            self.not_empty.notify(count)
+
+    def get_many(self, n, block=True, timeout=None):
+        """Remove and return up to n entries from the queue in priority order.
+        Blocks, similarly to `get`, only until at least one entry is available.
+        If n is zero or less, an empty list is returned immediately.
+
+        Heaps with `float` or `int` keys delete all entries using a single
+        backend call.
+
+        :param n: the maximum number of entries
+        :type n: int
+        :param block: whether to block until an entry is available
+        :param timeout: block at most timeout seconds and then raise
+          :py:class:`queue.Empty`
+        :returns: the entries
+        :rtype: list
+        """
+        if n < 1:
+            return []
+        with self.not_empty:
+            if not block:
+                if not self._qsize():
+                    raise queue.Empty
+            elif timeout is None:
+                while not self._qsize():
+                    self.not_empty.wait()
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = _time() + timeout
+                while not self._qsize():
+                    remaining = endtime - _time()
+                    if remaining <= 0.0:
+                        raise queue.Empty
+                    self.not_empty.wait(remaining)
+            count = min(n, self._qsize())
+            delete_min_many = getattr(self.queue, "delete_min_many", None)
+            if delete_min_many is not None:
+                items = delete_min_many(count).tolist()
+            else:
+                items = [self._get() for _ in range(count)]
+            self.not_full.notify(len(items))
+            return items
+
+    # The following are called by queue.Queue with the mutex held
+
+    def _init(self, maxsize):
+        self.queue = self._factory(key_type=self._key_type, **self._factory_kwargs)
+        self._addressable = isinstance(self.queue, AddressableHeap)
+
+    def _qsize(self):
+        return len(self.queue)
+
+    def _put(self, item):
+        self.queue.insert(item)
+
+    def _get(self):
+        if self._addressable:
+            return self.queue.delete_min().key
+        return self.queue.delete_min()
+
+
+class MultiQueue:
+    """A relaxed concurrent priority queue following the MultiQueue design.
+    Elements are spread over several heaps, called shards, each protected
+    by its own lock. An insertion goes to a random shard while a deletion
+    samples two random shards and removes the smaller of their minimum
+    elements. Thus threads rarely contend for the same lock, at the cost of
+    deletions returning elements which are only close to the minimum.
+
+    A shard whose lock is held by another thread is skipped and a different
+    one is sampled instead. If this repeatedly fails, the operation waits.
+
+    :param num_shards: the number of shards, by default twice the number of
+      processors
+    :type num_shards: int
+    :param factory: the heap factory function, by default a d-ary heap
+    :type factory: callable
+    :param key_type: the key type of the heaps
+    :type key_type: float, int, a tuple key type or object
+    :param key: a function extracting a float or int priority from each element,
+      which is passed to the factory
+    :type key: callable or None
+    :param kwargs: additional keyword arguments passed to the factory
+    """
+
+    def __init__(self, num_shards=None, factory=None, key_type=float, key=None, **kwargs):
+        if num_shards is None:
+            num_shards = 2 * (os.cpu_count() or 1)
+        if num_shards < 2:
+            raise ValueError("A MultiQueue needs at least two shards")
+        if factory is None:
+            factory = create_implicit_dary_heap
+        if key is not None:
+            kwargs["key"] = key
+        self._shards = [factory(key_type=key_type, **kwargs) for _ in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+        self._addressable = isinstance(self._shards[0], AddressableHeap)
+        self._key = key
+        self._attempts = 2 * num_shards
+
+    @property
+    def num_shards(self):
+        """The number of shards."""
+        return len(self._shards)
+
+    def insert(self, key):
+        """Insert an element into a random shard.
+
+        :param key: the element
+        """
+        i = self._lock_random_shard()
+        try:
+            self._shards[i].insert(key)
+        finally:
+            self._locks[i].release()
+
+    def insert_many(self, keys):
+        """Insert many elements. The elements are split into one batch per
+        shard and each batch is inserted while holding the lock of its shard
+        only once. Heaps with `float` or `int` keys insert each batch using a
+        single backend call.
+
+        :param keys: the elements
+        """
+        keys = list(keys)
+        n = len(self._shards)
+        start = random.randrange(n)
+        for b in range(n):
+            batch = keys[b::n]
+            if not batch:
+                break
+            i = (start + b) % n
+            with self._locks[i]:
+                shard = self._shards[i]
+                if hasattr(shard, "insert_many") and not self._addressable:
+                    shard.insert_many(batch)
+                else:
+                    for k in batch:
+                        shard.insert(k)
+
+    def delete_min(self):
+        """Delete an element close to the minimum. Two random shards are sampled
+        and the smaller of their minimum elements is removed.
+
+        :returns: the element
+        :raises KeyError: if the queue is empty
+        """
+        n = len(self._shards)
+        for _ in range(self._attempts):
+            i, j = random.sample(range(n), 2)
+            if not self._locks[i].acquire(blocking=False):
+                continue
+            try:
+                if not self._locks[j].acquire(blocking=False):
+                    continue
+                try:
+                    a = self._shards[i]
+                    b = self._shards[j]
+                    if a.is_empty():
+                        if b.is_empty():
+                            continue
+                        return self._delete_min(b)
+                    if b.is_empty() or not self._less(b, a):
+                        return self._delete_min(a)
+                    return self._delete_min(b)
+                finally:
+                    self._locks[j].release()
+            finally:
+                self._locks[i].release()
+
+        # contention or mostly empty shards, scan all of them
+        for i in range(n):
+            with self._locks[i]:
+                if not self._shards[i].is_empty():
+                    return self._delete_min(self._shards[i])
+        raise KeyError("MultiQueue is empty")
+
+    def clear(self):
+        """Remove all elements."""
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+    def __len__(self):
+        """The number of elements. The result is exact only when no other
+        thread modifies the queue.
+        """
+        return sum(len(shard) for shard in self._shards)
+
+    def is_empty(self):
+        return len(self) == 0
+
+    def __repr__(self):
+        return "MultiQueue(%r)" % self._shards
+
+    def _lock_random_shard(self):
+        n = len(self._shards)
+        for _ in range(self._attempts):
+            i = random.randrange(n)
+            if self._locks[i].acquire(blocking=False):
+                return i
+        i = random.randrange(n)
+        self._locks[i].acquire()
+        return i
+
+    def _min_key(self, shard):
+        key = shard.find_min()
+        if self._addressable:
+            key = key.key
+        if self._key is not None:
+            key = self._key(key)
+        return key
+
+    def _less(self, a, b):
+        return self._min_key(a) < self._min_key(b)
+
+    def _delete_min(self, shard):
+        if self._addressable:
+            return shard.delete_min().key
+        return shard.delete_min()
@@ -238,3 +238,102 @@ class DoubleEndedHeap(Heap):
     def delete_max(self):
         """Delete the maximum element and return its key."""
         pass
+
+
+class IndexedHeap(ABC):
+    """Interface for an indexed heap. Elements are identified by dense integer
+    ids in the range [0, n) and no handles are used."""
+
+    @abstractmethod
+    def push(self, id, key):
+        """Insert a new element.
+
+        :param id: the id of the element
+        :type id: int
+        :param key: the key
+        """
+        pass
+
+    @abstractmethod
+    def decrease_key(self, id, key):
+        """Decrease the key of an element.
+
+        :param id: the id of the element
+        :type id: int
+        :param key: the new key
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, id):
+        """Delete an element.
+
+        :param id: the id of the element
+        :type id: int
+        """
+        pass
+
+    @abstractmethod
+    def contains(self, id):
+        """Check if an element is in the heap.
+
+        :param id: the id of the element
+        :type id: int
+        :returns: whether the element is in the heap
+        :rtype: boolean
+        """
+        pass
+
+    @abstractmethod
+    def get_key(self, id):
+        """Get the key of an element.
+
+        :param id: the id of the element
+        :type id: int
+        :returns: the key
+        """
+        pass
+
+    @abstractmethod
+    def find_min(self):
+        """Return the minimum element.
+
+        :returns: the id and the key of the minimum element
+        :rtype: tuple
+        """
+        pass
+
+    @abstractmethod
+    def pop(self):
+        """Delete the minimum element.
+
+        :returns: the id and the key of the minimum element
+        :rtype: tuple
+        """
+        pass
+
+    @abstractmethod
+    def is_empty(self):
+        """Check if the heap is empty.
+
+        :returns: whether the heap is empty or not
+        :rtype: boolean
+        """
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Clear the heap"""
+        pass
+
+    @abstractmethod
+    def __len__(self):
+        """Return the number of elements in the heap.
+
+        :returns: the number of elements in the heap
+        :rtype: long integer
+        """
+        pass
+
+    def __contains__(self, id):
+        return self.contains(id)
@@ -94,6 +94,18 @@ class CustomBuild(build):
                     ]
 
 
+def has_isolate_arguments(build_dir):
+    """Check whether the isolate parameters of the GraalVM used to build the
+    jheaps-capi carry runtime arguments. These are the reserved argc/argv fields
+    of version 3 of the parameters, which older GraalVM releases do not declare.
+    """
+    header = os.path.join(build_dir, 'graal_isolate.h')
+    if not os.path.isfile(header):
+        return False
+    with open(header, 'r') as fp:
+        return '_reserved_2' in fp.read()
+
+
 class CustomBuildExt(build_ext):
     # I wish this was used more by distutils, but setting it anyway
     sub_commands = [('build_capi', None),
@@ -101,6 +113,9 @@ class CustomBuildExt(build_ext):
 
     def run(self):
         self.run_command('build_capi')
+        if has_isolate_arguments(self.get_finalized_command('build_capi').build_dir):
+            for ext in self.extensions:
+                ext.define_macros.append(('JHEAPS_ISOLATE_ARGUMENTS', None))
         super().run()
 
 _backend_extension = Extension('jheaps._backend', ['jheaps/backend.i','jheaps/backend.c'],
@@ -0,0 +1,74 @@
+import pytest
+import asyncio
+
+from array import array
+
+from jheaps import create_implicit_binary_heap
+from jheaps.aio import PriorityQueue
+
+
+def test_aio_priority_queue():
+
+    async def run():
+        q = PriorityQueue()
+
+        await q.put((3, "c"))
+        h = await q.put((5, "e"))
+        q.put_nowait((2, "b"))
+        assert q.qsize() == 3
+
+        q.decrease_key(h, (1, "e"))
+        assert await q.get() == (1, "e")
+        assert q.get_nowait() == (2, "b")
+        assert await q.get_many(10) == [(3, "c")]
+        assert q.empty()
+
+        with pytest.raises(asyncio.QueueEmpty):
+            q.get_nowait()
+
+        assert "PriorityQueue" in repr(q)
+
+    asyncio.run(run())
+
+
+def test_aio_priority_queue_remove():
+
+    async def run():
+        q = PriorityQueue(key_type=float)
+
+        handles = [q.put_nowait(k) for k in [4.0, 2.0, 3.0, 1.0]]
+        q.remove(handles[3])
+        assert q.qsize() == 3
+
+        assert await q.get_many(2) == [2.0, 3.0]
+        q.task_done()
+        q.task_done()
+        assert await q.get() == 4.0
+        q.task_done()
+        await asyncio.wait_for(q.join(), timeout=1)
+
+    asyncio.run(run())
+
+
+def test_aio_priority_queue_producer_consumer():
+
+    async def run():
+        q = PriorityQueue(maxsize=4, factory=create_implicit_binary_heap, key_type=int)
+        result = []
+
+        async def producer():
+            for i in range(50):
+                await q.put(i)
+
+        async def consumer():
+            while len(result) < 50:
+                result.extend(await q.get_many(3))
+
+        await asyncio.gather(producer(), consumer())
+        assert sorted(result) == list(range(50))
+
+        with pytest.raises(asyncio.QueueFull):
+            for i in range(5):
+                q.put_nowait(i)
+
+    asyncio.run(run())
@@ -5,6 +5,7 @@ from random import Random
 from jheaps import (
     create_addressable_pairing_heap
 )
+from jheaps._internals._utils import _ref_count
 
 class MyKey():
 
@@ -72,3 +73,50 @@ def test_any_any_addressable_heap():
 
 
 
+
+
+def test_any_any_addressable_heap_ref_counts():
+
+    h = create_addressable_pairing_heap(key_type=object, value_type=object)
+
+    k1, k2, v1, v2 = MyKey(2.0), MyKey(1.0), MyValue(1), MyValue(2)
+    counts = [_ref_count(o) for o in (k1, k2, v1, v2)]
+
+    handle = h.insert(k1, v1)
+    assert [_ref_count(o) for o in (k1, k2, v1, v2)] == [
+        counts[0] + 1, counts[1], counts[2] + 1, counts[3]
+    ]
+
+    handle.decrease_key(k2)
+    handle.value = v2
+    assert [_ref_count(o) for o in (k1, k2, v1, v2)] == [
+        counts[0], counts[1] + 1, counts[2], counts[3] + 1
+    ]
+
+    handle.delete()
+    del handle
+    assert [_ref_count(o) for o in (k1, k2, v1, v2)] == counts
+
+
+def test_any_any_addressable_heap_release_ref_counts():
+
+    keys = [MyKey(i) for i in range(100)]
+    values = [MyValue(i) for i in range(100)]
+    pre_ref_counts = [_ref_count(o) for o in keys + values]
+
+    h = create_addressable_pairing_heap(key_type=object, value_type=object)
+    for k, v in zip(keys, values):
+        h.insert(k, v)
+    h.clear()
+    assert len(h) == 0
+    assert [_ref_count(o) for o in keys + values] == pre_ref_counts
+
+    # garbage collecting the heap releases its references, but only
+    # after all handles of its elements are gone
+    handle = None
+    for k, v in zip(keys, values):
+        handle = h.insert(k, v)
+    del h
+    assert handle.key == MyKey(99)
+    del handle
+    assert [_ref_count(o) for o in keys + values] == pre_ref_counts
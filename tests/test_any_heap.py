@@ -60,3 +60,82 @@ def test_any_heap_ref_counts():
         h.insert(o)
         post_ref_count = _ref_count(o)
         assert pre_ref_count + 1 == post_ref_count
+
+    # the reference of the heap passes to the caller
+    o = h.find_min()
+    pre_ref_count = _ref_count(o)
+    assert h.delete_min() is o
+    assert _ref_count(o) == pre_ref_count
+
+
+def test_any_heap_release_ref_counts():
+
+    allobjects = [MyKey(i) for i in range(100)]
+    pre_ref_counts = [_ref_count(o) for o in allobjects]
+
+    h = create_implicit_binary_heap(key_type=object)
+    for o in allobjects:
+        h.insert(o)
+    h.clear()
+    assert len(h) == 0
+    assert [_ref_count(o) for o in allobjects] == pre_ref_counts
+
+    # garbage collecting the heap releases its references
+    for o in allobjects:
+        h.insert(o)
+    del h
+    assert [_ref_count(o) for o in allobjects] == pre_ref_counts
+
+
+class BadKey:
+    def __lt__(self, o):
+        raise RuntimeError("cannot compare")
+
+
+def test_any_heap_comparison_error():
+
+    h = create_implicit_binary_heap(key_type=object)
+
+    h.insert(BadKey())
+    with pytest.raises(RuntimeError):
+        h.insert(BadKey())
+
+
+class FlakyKey(MyKey):
+    fail = False
+
+    def __lt__(self, o):
+        if FlakyKey.fail:
+            raise RuntimeError("cannot compare")
+        return super().__lt__(o)
+
+
+def test_any_heap_comparison_error_ref_counts():
+
+    keys = [FlakyKey(i) for i in range(3)]
+    h = create_implicit_binary_heap(key_type=object)
+    for k in keys:
+        h.insert(k)
+
+    # the minimum is removed before the failing comparisons and
+    # the reference of the heap is released with the exception
+    pre_ref_count = _ref_count(keys[0])
+    FlakyKey.fail = True
+    try:
+        with pytest.raises(RuntimeError):
+            h.delete_min()
+    finally:
+        FlakyKey.fail = False
+    assert _ref_count(keys[0]) == pre_ref_count - 1
+
+
+def test_any_heap_reflected_comparison():
+
+    # comparisons use the full rich comparison protocol, thus
+    # mixed int and float keys are ordered correctly
+    h = create_implicit_binary_heap(key_type=object)
+
+    for k in [3, 1.5, 2, 0.5]:
+        h.insert(k)
+
+    assert [h.delete_min() for _ in range(4)] == [0.5, 1.5, 2, 3]
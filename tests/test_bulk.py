@@ -0,0 +1,322 @@
+import pytest
+
+from array import array
+from random import Random
+from threading import Thread
+
+from jheaps import (
+    create_implicit_binary_heap,
+    create_implicit_dary_heap,
+    create_doublended_implicit_binary_heap,
+    create_addressable_binary_heap,
+    create_addressable_pairing_heap,
+    create_doubleended_addressable_pairing_heap,
+    heapify,
+)
+from jheaps.types import HeapType
+
+from jheaps._internals._utils import _ref_count
+
+
+def test_double_insert_many():
+
+    rng = Random(17)
+    numbers = [rng.random() for _ in range(1000)]
+
+    h = create_implicit_binary_heap(key_type=float)
+    h.insert_many(array('d', numbers))
+    assert len(h) == 1000
+
+    h.insert_many([0.5, 1.5])
+    assert len(h) == 1002
+
+    h.insert_many(array('d'))
+    assert len(h) == 1002
+
+    expected = sorted(numbers + [0.5, 1.5])
+    result = []
+    while not h.is_empty():
+        result.append(h.delete_min())
+    assert result == expected
+
+
+def test_long_insert_many():
+
+    h = create_implicit_dary_heap(key_type=int, d=4)
+    h.insert_many(array('q', range(100, 0, -1)))
+    h.insert_many(memoryview(array('q', [1000, -5])))
+    assert len(h) == 102
+
+    assert h.find_min() == -5
+    h.delete_min()
+    for i in range(1, 101):
+        assert h.delete_min() == i
+    assert h.delete_min() == 1000
+
+
+def test_insert_many_wrong_buffer():
+
+    h = create_implicit_binary_heap(key_type=int)
+
+    with pytest.raises(TypeError):
+        h.insert_many(array('d', [1.5, 2.5]))
+
+
+def test_heapify_double():
+
+    rng = Random(17)
+    numbers = [rng.random() for _ in range(1000)]
+
+    h = heapify(array('d', numbers))
+    assert len(h) == 1000
+
+    result = []
+    while not h.is_empty():
+        result.append(h.delete_min())
+    assert result == sorted(numbers)
+
+
+def test_heapify_long_dary():
+
+    h = heapify(range(100, 0, -1), heap_type=HeapType.HEAP_TYPE_DARY_IMPLICIT, key_type=int, d=3)
+    assert len(h) == 100
+    for i in range(1, 101):
+        assert h.delete_min() == i
+
+
+def test_heapify_minmax():
+
+    h = heapify([3.0, 1.0, 2.0], heap_type=HeapType.HEAP_TYPE_DOUBLEENDED_BINARY_IMPLICIT_MINMAX)
+    assert h.find_min() == 1.0
+    assert h.find_max() == 3.0
+
+
+def test_heapify_addressable():
+
+    h = heapify([5, 3, 4], values=[50, 30, 40], heap_type=HeapType.HEAP_TYPE_ADDRESSABLE_BINARY_IMPLICIT, key_type=int)
+    assert len(h) == 3
+    handle = h.delete_min()
+    assert handle.key == 3
+    assert handle.value == 30
+
+
+def test_heapify_object():
+
+    h = heapify(["c", "a", "b"], key_type=object)
+    assert h.delete_min() == "a"
+    assert h.delete_min() == "b"
+    assert h.delete_min() == "c"
+
+
+def test_heapify_errors():
+
+    with pytest.raises(ValueError):
+        heapify([1.0], heap_type=HeapType.HEAP_TYPE_MERGEABLE_ADDRESSABLE_PAIRING)
+
+    with pytest.raises(ValueError):
+        heapify([1.0], values=[1])
+
+    with pytest.raises(ValueError):
+        heapify([1.0, 2.0], values=[1], heap_type=HeapType.HEAP_TYPE_ADDRESSABLE_BINARY_IMPLICIT)
+
+
+def test_double_delete_min_many():
+
+    rng = Random(17)
+    numbers = [rng.random() for _ in range(1000)]
+
+    h = create_implicit_binary_heap(key_type=float)
+    h.insert_many(numbers)
+
+    first = h.delete_min_many(10)
+    assert first == array('d', sorted(numbers)[:10])
+    assert len(h) == 990
+
+    rest = h.delete_min_many(2000)
+    assert rest == array('d', sorted(numbers)[10:])
+    assert len(h) == 0
+
+    assert len(h.delete_min_many(5)) == 0
+
+
+def test_long_delete_min_many():
+
+    h = create_implicit_dary_heap(key_type=int)
+    h.insert_many(range(100))
+
+    assert h.delete_min_many(3) == array('q', [0, 1, 2])
+    assert h.find_min() == 3
+
+    # the result is sized by the heap and not by the requested count
+    assert h.delete_min_many(10**12) == array('q', range(3, 100))
+
+
+def test_minmax_delete_max_many():
+
+    h = create_doublended_implicit_binary_heap(key_type=int)
+    h.insert_many(range(10))
+
+    assert h.delete_max_many(3) == array('q', [9, 8, 7])
+    assert h.delete_min_many(3) == array('q', [0, 1, 2])
+    assert len(h) == 4
+
+    h = create_doublended_implicit_binary_heap(key_type=float)
+    h.insert_many([1.5, 2.5, 0.5])
+    assert h.delete_max_many(5) == array('d', [2.5, 1.5, 0.5])
+
+    h.insert(1.0)
+    assert h.delete_max_many(10**12) == array('d', [1.0])
+
+
+def test_addressable_insert_many():
+
+    h = create_addressable_pairing_heap(key_type=float)
+
+    handles = h.insert_many([3.5, 1.5, 2.5], [30, 10, 20])
+    assert len(handles) == 3
+    assert len(h) == 3
+
+    assert h.get_keys(handles) == array('d', [3.5, 1.5, 2.5])
+    assert h.get_values(handles) == array('q', [30, 10, 20])
+    assert h.get_keys(handles[1:]) == array('d', [1.5, 2.5])
+
+    h.delete_many(handles[:1])
+    assert len(h) == 2
+
+    handle = h.delete_min()
+    assert handle.key == 1.5
+    assert handle.value == 10
+
+
+def test_bulk_foreign_handles():
+
+    h1 = create_addressable_pairing_heap(key_type=float)
+    h2 = create_addressable_pairing_heap(key_type=float)
+
+    handles1 = h1.insert_many([1.5, 2.5])
+    h2.insert_many([3.5])
+
+    with pytest.raises(ValueError):
+        h2.get_keys(handles1)
+
+    with pytest.raises(ValueError):
+        h2.delete_many(handles1[:1])
+
+    with pytest.raises(ValueError):
+        h2.get_values([h1.insert(4.5)])
+
+    with pytest.raises(TypeError):
+        h1.get_keys(handles1.ids)
+
+    with pytest.raises(TypeError):
+        h1.delete_many([int(handles1[0])])
+
+    assert len(h1) == 3
+    assert len(h2) == 1
+
+
+def test_addressable_long_insert_many():
+
+    h = create_addressable_binary_heap(key_type=int)
+
+    handles = h.insert_many(range(100))
+    assert len(h) == 100
+    assert h.get_values(handles) == array('q', [0] * 100)
+
+    h.delete_many(handles)
+    assert len(h) == 0
+
+    with pytest.raises(ValueError):
+        h.insert_many([1, 2], [1])
+
+
+def test_decrease_key_many():
+
+    h = create_addressable_pairing_heap(key_type=float)
+
+    handles = h.insert_many([10.0, 20.0, 30.0], [1, 2, 3])
+    h.decrease_key_many(handles[1:], [5.0, 1.0])
+    assert h.get_keys(handles) == array('d', [10.0, 5.0, 1.0])
+    assert h.find_min().value == 3
+
+    h2 = h.insert(100.0, 4)
+    h3 = h.insert(200.0, 5)
+    h.decrease_key_many([h2, h3], array('d', [0.5, 0.25]))
+    assert h2.key == 0.5
+    assert h.find_min().value == 5
+
+    with pytest.raises(ValueError):
+        h.decrease_key_many([h2, h3], [0.1])
+
+
+def test_increase_key_many():
+
+    h = create_doubleended_addressable_pairing_heap(key_type=int)
+
+    handles = [h.insert(i, i) for i in range(5)]
+    h.increase_key_many(handles[:2], [10, 20])
+    assert h.find_max().value == 1
+    assert h.find_min().value == 2
+
+
+def test_decrease_key_many_object_keys():
+
+    h = create_addressable_pairing_heap(key_type=object, value_type=object)
+
+    handles = [h.insert([i], i) for i in range(5, 10)]
+    new_keys = [[0], [1]]
+    pre_ref_counts = [_ref_count(k) for k in new_keys]
+
+    h.decrease_key_many(handles[3:], new_keys)
+    assert h.find_min().value == 8
+    assert handles[4].key == [1]
+    assert [_ref_count(k) for k in new_keys] == [c + 1 for c in pre_ref_counts]
+
+
+def test_update_keys_many_foreign_handles():
+
+    h1 = create_addressable_pairing_heap(key_type=float)
+    h2 = create_addressable_pairing_heap(key_type=float)
+
+    handles1 = h1.insert_many([10.0, 20.0])
+    with pytest.raises(ValueError):
+        h2.decrease_key_many(handles1, [1.0, 2.0])
+    assert h1.get_keys(handles1) == array('d', [10.0, 20.0])
+
+    h3 = create_doubleended_addressable_pairing_heap(key_type=int)
+    h4 = create_doubleended_addressable_pairing_heap(key_type=int)
+    handles3 = h3.insert_many([1, 2])
+    with pytest.raises(ValueError):
+        h4.increase_key_many(handles3[1:], [30])
+
+    h5 = create_addressable_pairing_heap(key_type=object, value_type=object)
+    h6 = create_addressable_pairing_heap(key_type=object, value_type=object)
+    handle5 = h5.insert([5], 5)
+    with pytest.raises(ValueError):
+        h6.decrease_key_many([handle5], [[0]])
+    assert handle5.key == [5]
+
+    # handles of a melded heap belong to the heap it was melded into
+    h2.meld(h1)
+    h2.decrease_key_many(handles1, [1.0, 2.0])
+    assert h2.find_min().key == 1.0
+
+
+def test_parallel_heapify_and_drain():
+
+    rng = Random(31)
+    inputs = [[rng.random() for _ in range(10000)] for _ in range(4)]
+    results = [None] * len(inputs)
+
+    def work(i):
+        h = heapify(array('d', inputs[i]))
+        results[i] = h.delete_min_many(len(inputs[i]))
+
+    threads = [Thread(target=work, args=(i,)) for i in range(len(inputs))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for numbers, result in zip(inputs, results):
+        assert list(result) == sorted(numbers)
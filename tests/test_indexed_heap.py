@@ -0,0 +1,77 @@
+import pytest
+
+from random import Random
+
+from jheaps import create_indexed_heap
+from jheaps.types import HeapType
+
+
+def test_indexed_heap():
+
+    h = create_indexed_heap(10)
+
+    h.push(3, 5.5)
+    h.push(7, 6.5)
+    h.push(0, 7.5)
+
+    assert len(h) == 3
+    assert 3 in h
+    assert not h.contains(4)
+    assert h.get_key(7) == 6.5
+    assert h.find_min() == (3, 5.5)
+
+    h.decrease_key(0, 1.5)
+    assert h.pop() == (0, 1.5)
+    assert 0 not in h
+
+    h.delete(3)
+    assert len(h) == 1
+    assert h.pop() == (7, 6.5)
+    assert h.is_empty()
+
+    # ids can be reused after removal
+    h.push(3, 1.0)
+    assert h.find_min() == (3, 1.0)
+
+    h.clear()
+    assert len(h) == 0
+    assert 3 not in h
+
+
+def test_indexed_heap_errors():
+
+    h = create_indexed_heap(5, key_type=int)
+
+    with pytest.raises(IndexError):
+        h.push(5, 1)
+
+    h.push(1, 10)
+    with pytest.raises(ValueError):
+        h.push(1, 20)
+
+    with pytest.raises(KeyError):
+        h.decrease_key(2, 1)
+
+    with pytest.raises(KeyError):
+        h.delete(2)
+
+    with pytest.raises(ValueError):
+        create_indexed_heap(5, heap_type=HeapType.HEAP_TYPE_BINARY_IMPLICIT)
+
+
+def test_indexed_dary_heap_sort():
+
+    rng = Random(17)
+    n = 1000
+    keys = [rng.randint(0, 1000000) for _ in range(n)]
+
+    h = create_indexed_heap(n, key_type=int, heap_type=HeapType.HEAP_TYPE_ADDRESSABLE_DARY_IMPLICIT, d=3)
+    for i, k in enumerate(keys):
+        h.push(i, k)
+
+    result = []
+    while not h.is_empty():
+        i, k = h.pop()
+        assert keys[i] == k
+        result.append(k)
+    assert result == sorted(keys)
@@ -0,0 +1,141 @@
+import pytest
+import time
+
+from array import array
+from threading import Thread
+
+import jheaps
+from jheaps import (
+    create_implicit_binary_heap,
+    create_addressable_pairing_heap,
+)
+
+
+def test_isolate():
+
+    with jheaps.isolate(1):
+        h = create_addressable_pairing_heap()
+        h1 = h.insert(3.0, 1)
+        h.insert(1.0, 2)
+        h1.decrease_key(0.5)
+        assert h.find_min().value == 1
+        assert len(h) == 2
+
+    # handles are cleaned up in their own isolate
+    with jheaps.isolate(1):
+        del h1
+        del h
+
+    with pytest.raises(IndexError):
+        with jheaps.isolate(-1):
+            pass
+
+
+def test_isolate_meld():
+
+    with jheaps.isolate(1):
+        h1 = create_addressable_pairing_heap()
+        h1.insert(1.0)
+    h2 = create_addressable_pairing_heap()
+    h2.insert(2.0)
+
+    with pytest.raises(ValueError):
+        h2.meld(h1)
+
+    assert len(h2) == 1
+
+
+def test_isolate_foreign_use():
+
+    with jheaps.isolate(1):
+        h = create_addressable_pairing_heap()
+        h1 = h.insert(3.0, 1)
+        handles = h.insert_many([1.0, 2.0])
+
+    with pytest.raises(ValueError):
+        h.insert(4.0)
+    with pytest.raises(ValueError):
+        len(h)
+    with pytest.raises(ValueError):
+        h1.decrease_key(0.5)
+    with pytest.raises(ValueError):
+        h1.value
+    with pytest.raises(ValueError):
+        h.get_keys(handles)
+
+    errors = []
+
+    def work():
+        # threads start in the default isolate
+        for use in (lambda: h.find_min(), lambda: h1.key, lambda: h.delete_many(handles)):
+            try:
+                use()
+            except ValueError as e:
+                errors.append(e)
+
+    t = Thread(target=work)
+    t.start()
+    t.join()
+    assert len(errors) == 3
+
+    with jheaps.isolate(1):
+        assert len(h) == 3
+        assert h1.key == 3.0
+        assert h.get_keys(handles) == array("d", [1.0, 2.0])
+
+
+def test_isolate_threads():
+
+    results = [None] * 3
+
+    def work(i):
+        with jheaps.isolate(i + 1):
+            h = create_implicit_binary_heap(key_type=int)
+            h.insert_many(range(1000, 0, -1))
+            results[i] = list(h.delete_min_many(1000))
+
+    threads = [Thread(target=work, args=(i,)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for r in results:
+        assert r == list(range(1, 1001))
+
+
+def test_thread_detach_on_exit():
+
+    before = jheaps.thread_metrics()
+
+    def work():
+        h = create_implicit_binary_heap()
+        h.insert(1.0)
+        assert jheaps.thread_metrics()["attached"] >= 1
+
+    t = Thread(target=work)
+    t.start()
+    t.join()
+
+    # the thread is detached by its destructor which might run after join
+    deadline = time.monotonic() + 5
+    while jheaps.thread_metrics()["detached"] == before["detached"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert jheaps.thread_metrics()["attached"] >= 1
+
+
+def test_detach_thread():
+
+    h = create_implicit_binary_heap()
+    h.insert(1.0)
+
+    before = jheaps.thread_metrics()
+    jheaps.detach_thread()
+    after = jheaps.thread_metrics()
+    assert after["attached"] < before["attached"]
+    assert after["detached"] > before["detached"]
+
+    # attached again lazily
+    assert h.find_min() == 1.0
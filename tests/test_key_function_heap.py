@@ -0,0 +1,109 @@
+import pytest
+
+from collections import deque
+
+from jheaps import (
+    create_implicit_binary_heap,
+    create_implicit_dary_heap,
+    create_doublended_implicit_binary_heap,
+    create_radix_heap,
+)
+
+
+def test_key_function_heap():
+
+    h = create_implicit_binary_heap(key_type=float, key=lambda t: t[1])
+
+    h.insert(("a", 5.0))
+    h.insert(("b", 1.0))
+    h.insert(("c", 3.0))
+    h.insert(("d", 1.0))
+
+    assert len(h) == 4
+    assert h.find_min() == ("b", 1.0)
+    assert h.delete_min() == ("b", 1.0)
+    assert h.delete_min() == ("d", 1.0)
+    assert h.delete_min() == ("c", 3.0)
+    assert h.delete_min() == ("a", 5.0)
+    assert h.is_empty()
+
+    h.insert(("e", 2.0))
+    h.clear()
+    assert len(h) == 0
+
+
+def test_key_function_heap_int():
+
+    h = create_implicit_dary_heap(key_type=int, d=3, key=len)
+
+    words = ["three", "one", "fourteen", "six", "a"]
+    for w in words:
+        h.insert(w)
+
+    result = []
+    while not h.is_empty():
+        result.append(h.delete_min())
+
+    assert result == ["a", "one", "six", "three", "fourteen"]
+
+
+def test_key_function_radix_heap():
+
+    h = create_radix_heap(key_type=int, min=0, max=100, key=lambda d: d["dist"])
+
+    h.insert({"node": 1, "dist": 10})
+    h.insert({"node": 2, "dist": 4})
+    h.insert({"node": 3, "dist": 7})
+
+    assert h.delete_min()["node"] == 2
+    assert h.delete_min()["node"] == 3
+    assert h.delete_min()["node"] == 1
+
+
+def test_key_function_double_ended_heap():
+
+    h = create_doublended_implicit_binary_heap(key_type=float, key=lambda t: t[0])
+
+    for t in [(2.0, "a"), (1.0, "b"), (3.0, "c"), (3.0, "d"), (1.0, "e")]:
+        h.insert(t)
+
+    assert h.find_max() == (3.0, "d")
+    assert h.delete_max() == (3.0, "d")
+    assert h.delete_max() == (3.0, "c")
+    assert h.delete_min() == (1.0, "b")
+    assert h.delete_min() == (1.0, "e")
+    assert h.delete_max() == (2.0, "a")
+    assert len(h) == 0
+
+
+def test_key_function_heap_same_object():
+
+    h = create_implicit_binary_heap(key_type=int, key=len)
+
+    # objects which are deques, and repeated objects
+    q = deque([1, 2])
+    for o in [q, [7, 8], q, [], [9]]:
+        h.insert(o)
+
+    assert h.delete_min() == []
+    assert h.delete_min() == [9]
+    assert h.delete_min() is q
+    assert h.delete_min() == [7, 8]
+    assert h.delete_min() is q
+    assert h.is_empty()
+
+
+def test_key_function_heap_errors():
+
+    h = create_implicit_binary_heap(key_type=float, key=lambda x: x)
+
+    with pytest.raises(ValueError):
+        h.insert(float("nan"))
+
+    with pytest.raises(TypeError):
+        h.insert("not a number")
+
+    assert h.is_empty()
+
+    with pytest.raises(ValueError):
+        create_implicit_binary_heap(key_type=object, key=lambda x: x)
@@ -0,0 +1,136 @@
+import os
+import pytest
+import subprocess
+import sys
+
+import jheaps
+from jheaps import backend
+
+# builds against GraalVM headers without isolate arguments reject all
+# parameters but the reserved address space size
+_options_supported = backend.jheaps_isolate_options_supported() == 1
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, stdout=subprocess.PIPE
+    )
+    return result.stdout.decode().strip()
+
+
+def test_import_does_not_initialize_backend():
+    code = "import jheaps, jheaps.types; from jheaps import backend; print(backend.jheaps_is_initialized())"
+    assert _run(code) == "0"
+
+
+def test_first_heap_initializes_backend():
+    code = (
+        "import jheaps; from jheaps import backend; "
+        "h = jheaps.create_implicit_binary_heap(); h.insert(1.0); "
+        "print(backend.jheaps_is_initialized(), h.find_min())"
+    )
+    assert _run(code) == "1 1.0"
+
+
+def test_init():
+    code = (
+        "import jheaps; from jheaps import backend; "
+        "jheaps.init(); jheaps.init(); "
+        "print(backend.jheaps_is_initialized())"
+    )
+    assert _run(code) == "1"
+
+    # already initialized by the other tests in this process
+    jheaps.init()
+    h = jheaps.create_implicit_binary_heap()
+    h.insert(1.0)
+    assert h.find_min() == 1.0
+
+
+@pytest.mark.skipif(not _options_supported, reason="isolate options not supported")
+def test_configure():
+    code = (
+        "import jheaps; from jheaps import backend; "
+        "jheaps.configure(max_heap_size='256m', young_gen_size=32 * 1024 * 1024); "
+        "h = jheaps.create_implicit_binary_heap(); h.insert(1.0); "
+        "print(backend.jheaps_is_initialized(), h.find_min())"
+    )
+    assert _run(code) == "1 1.0"
+
+    jheaps.init()
+    with pytest.raises(ValueError):
+        jheaps.configure(max_heap_size="1g")
+
+
+def test_configure_unsupported_options():
+    # an error while applying the parameters keeps the previous ones, e.g.
+    # too many options or no support for options at all
+    code = (
+        "import jheaps\n"
+        "from jheaps import backend\n"
+        "from jheaps._internals._isolates import _config\n"
+        "jheaps.configure(reserved_address_space_size='4g')\n"
+        "for kwargs in ({'options': ['-XX:+PrintGC'] * 100}, {'max_heap_size': '256m'}):\n"
+        "    try:\n"
+        "        jheaps.configure(**kwargs)\n"
+        "    except ValueError:\n"
+        "        print('rejected', sorted(_config))\n"
+        "h = jheaps.create_implicit_binary_heap(); h.insert(1.0)\n"
+        "print(h.find_min())\n"
+    )
+    rejected = "rejected ['reserved_address_space_size']"
+    lines = [rejected] if _options_supported else [rejected, rejected]
+    assert _run(code).splitlines() == lines + ["1.0"]
+
+
+def test_configure_invalid():
+    code = (
+        "import jheaps\n"
+        "for size in ('abc', '0', -1, 1.5):\n"
+        "    try:\n"
+        "        jheaps.configure(max_heap_size=size)\n"
+        "    except ValueError:\n"
+        "        pass\n"
+        "    else:\n"
+        "        print('accepted', size)\n"
+        "try:\n"
+        "    jheaps.configure(min_heap_size='1g', max_heap_size='256m')\n"
+        "except ValueError:\n"
+        "    pass\n"
+        "else:\n"
+        "    print('accepted min > max')\n"
+        "from jheaps import backend\n"
+        "print(backend.jheaps_is_initialized())\n"
+    )
+    assert _run(code) == "0"
+
+
+def test_configure_from_environment():
+    code = (
+        "import jheaps; "
+        "h = jheaps.create_implicit_binary_heap(); h.insert(1.0); "
+        "print(h.find_min())"
+    )
+    env = dict(os.environ, JHEAPS_MAX_HEAP_SIZE="256m")
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, stdout=subprocess.PIPE, env=env
+    )
+    assert result.stdout.decode().strip() == "1.0"
+
+    # invalid values are ignored with a warning
+    env = dict(os.environ, JHEAPS_MAX_HEAP_SIZE="lots", JHEAPS_MIN_HEAP_SIZE="64m")
+    code = (
+        "import logging; logging.basicConfig(); "
+        "import jheaps; from jheaps._internals._isolates import _config; "
+        "print(sorted(_config))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    expected = "['min_heap_size']" if _options_supported else "[]"
+    assert result.stdout.decode().strip() == expected
+    assert "JHEAPS_MAX_HEAP_SIZE" in result.stderr.decode()
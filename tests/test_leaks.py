@@ -0,0 +1,46 @@
+import pytest
+
+import jheaps
+from jheaps import (
+    create_implicit_binary_heap,
+    create_addressable_pairing_heap,
+)
+
+
+def _reported(heap):
+    return [e for e in jheaps.leak_report() if e["heap"] == repr(heap)]
+
+
+def test_leak_report():
+
+    jheaps.debug_leaks()
+    try:
+        h1 = create_implicit_binary_heap(key_type=object)
+        h2 = create_addressable_pairing_heap(key_type=object, value_type=object)
+    finally:
+        jheaps.debug_leaks(False)
+
+    h1.insert("a")
+    h1.insert("b")
+    h2.insert("a", "b")
+
+    report = _reported(h1)
+    assert len(report) == 1
+    assert report[0]["references"] == 2
+    assert "test_leak_report" in report[0]["traceback"]
+    assert _reported(h2)[0]["references"] == 2
+
+    h1.clear()
+    assert _reported(h1) == []
+
+    # garbage collected heaps release their references
+    h2_repr = repr(h2)
+    del h2
+    assert [e for e in jheaps.leak_report() if e["heap"] == h2_repr] == []
+
+
+def test_leak_report_not_tracked():
+
+    h = create_implicit_binary_heap(key_type=object)
+    h.insert("a")
+    assert _reported(h) == []
@@ -0,0 +1,70 @@
+import pytest
+
+import heapq
+from array import array
+from itertools import chain
+from random import Random
+
+from jheaps import merge
+
+
+def test_merge_records():
+
+    rng = Random(17)
+    shards = [
+        sorted((rng.randint(0, 100), "shard{}-{}".format(s, i)) for i in range(50))
+        for s in range(10)
+    ]
+
+    merged = list(chain.from_iterable(merge(*shards, key=lambda r: r[0], chunk=7)))
+    expected = list(heapq.merge(*shards, key=lambda r: r[0]))
+
+    assert merged == expected
+
+
+def test_merge_lazy():
+
+    consumed = []
+
+    def stream(values):
+        for v in values:
+            consumed.append(v)
+            yield v
+
+    batches = merge(stream([1.0, 3.0, 5.0, 7.0]), stream([2.0, 4.0, 6.0, 8.0]), chunk=2)
+    first = next(batches)
+
+    assert first == [1.0, 2.0]
+    assert len(consumed) == 4
+
+    rest = list(batches)
+    assert all(len(batch) <= 2 for batch in rest)
+    assert list(chain(first, *rest)) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+
+
+def test_merge_arrays():
+
+    a = array("d", [1.0, 4.0, 4.0, 9.0])
+    b = array("d", [0.5, 4.0, 10.0])
+    c = array("d")
+
+    batches = list(merge(a, b, c, chunk=2))
+
+    assert all(isinstance(batch, array) for batch in batches)
+    assert list(chain.from_iterable(batches)) == [0.5, 1.0, 4.0, 4.0, 4.0, 9.0, 10.0]
+
+    ints = [array("q", sorted(Random(s).randint(-(2**62), 2**62) for _ in range(100))) for s in range(5)]
+    merged = list(chain.from_iterable(merge(*ints, chunk=16)))
+    assert merged == sorted(chain.from_iterable(ints))
+
+
+def test_merge_int_keys():
+
+    big = 2**62
+    merged = list(chain.from_iterable(merge([big, big + 1], [big + 2])))
+
+    assert merged == [big, big + 1, big + 2]
+    assert list(merge()) == []
+
+    with pytest.raises(ValueError):
+        merge([1], chunk=0)
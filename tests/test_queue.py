@@ -0,0 +1,191 @@
+import pytest
+import queue
+
+from array import array
+from random import Random
+from threading import Thread
+
+from jheaps import (
+    create_implicit_dary_heap,
+    create_addressable_pairing_heap,
+)
+from jheaps.queue import PriorityQueue, MultiQueue
+
+
+def test_priority_queue():
+
+    q = PriorityQueue(key_type=object)
+
+    q.put((3, "c"))
+    q.put((1, "a"))
+    q.put_nowait((2, "b"))
+
+    assert q.qsize() == 3
+    assert not q.empty()
+    assert q.get() == (1, "a")
+    assert q.get_nowait() == (2, "b")
+    assert q.get() == (3, "c")
+    assert q.empty()
+
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.01)
+
+    # does not block on an empty queue
+    assert q.get_many(0) == []
+
+
+def test_priority_queue_float_keys():
+
+    rng = Random(7)
+    numbers = [rng.random() for _ in range(1000)]
+
+    q = PriorityQueue()
+    q.put_many(array('d', numbers))
+    assert q.qsize() == 1000
+
+    result = q.get_many(600)
+    result += q.get_many(10**12)
+    assert result == sorted(numbers)
+
+    for _ in numbers:
+        q.task_done()
+    q.join()
+
+    with pytest.raises(ValueError):
+        q.task_done()
+
+
+def test_priority_queue_factories():
+
+    q = PriorityQueue(factory=create_implicit_dary_heap, key_type=int, d=3)
+    q.put_many(range(10, 0, -1))
+    assert q.get_many(3) == [1, 2, 3]
+
+    q = PriorityQueue(factory=create_addressable_pairing_heap, key_type=int)
+    q.put_many([5, 3, 4])
+    q.put(1)
+    assert q.get() == 1
+    assert q.get_many(10) == [3, 4, 5]
+
+    q = PriorityQueue(key_type=float, key=lambda t: t[0])
+    q.put((2.0, "x"))
+    q.put((1.0, "y"))
+    assert q.get() == (1.0, "y")
+
+
+def test_bounded_priority_queue():
+
+    q = PriorityQueue(maxsize=2, key_type=int)
+    q.put(1)
+    q.put(2)
+    assert q.full()
+
+    with pytest.raises(queue.Full):
+        q.put_nowait(3)
+
+    with pytest.raises(queue.Full):
+        q.put(3, timeout=0.01)
+
+    with pytest.raises(queue.Full):
+        q.put_many([3], block=False)
+
+    with pytest.raises(ValueError):
+        q.put_many([3, 4, 5])
+
+    assert q.get_many(2) == [1, 2]
+    q.put_many([4, 3])
+    assert q.get() == 3
+
+
+def test_priority_queue_threads():
+
+    q = PriorityQueue(maxsize=10, key_type=int)
+    result = []
+
+    def consumer():
+        while True:
+            item = q.get()
+            if item == 1000:
+                q.task_done()
+                break
+            result.append(item)
+            q.task_done()
+
+    t = Thread(target=consumer)
+    t.start()
+    for i in range(100):
+        q.put(i)
+    q.put(1000)
+    q.join()
+    t.join()
+
+    assert sorted(result) == list(range(100))
+
+
+def test_multi_queue():
+
+    rng = Random(11)
+    numbers = [rng.random() for _ in range(1000)]
+
+    q = MultiQueue(num_shards=4)
+    assert q.num_shards == 4
+
+    q.insert_many(numbers[:500])
+    for x in numbers[500:]:
+        q.insert(x)
+    assert len(q) == 1000
+
+    result = [q.delete_min() for _ in range(1000)]
+    assert sorted(result) == sorted(numbers)
+    assert q.is_empty()
+
+    with pytest.raises(KeyError):
+        q.delete_min()
+
+    with pytest.raises(ValueError):
+        MultiQueue(num_shards=1)
+
+
+def test_multi_queue_factories():
+
+    q = MultiQueue(num_shards=3, factory=create_addressable_pairing_heap, key_type=int)
+    q.insert_many([5, 1, 3])
+    assert sorted(q.delete_min() for _ in range(3)) == [1, 3, 5]
+
+    q = MultiQueue(num_shards=2, key=lambda t: t[0])
+    q.insert((2.0, "b"))
+    q.insert((1.0, "a"))
+    assert q.delete_min() == (1.0, "a")
+    q.clear()
+    assert len(q) == 0
+
+
+def test_multi_queue_threads():
+
+    q = MultiQueue(num_shards=8, key_type=int)
+    results = [[] for _ in range(4)]
+
+    def producer(t):
+        for i in range(t * 1000, (t + 1) * 1000):
+            q.insert(i)
+
+    def consumer(t):
+        for _ in range(1000):
+            results[t].append(q.delete_min())
+
+    producers = [Thread(target=producer, args=(t,)) for t in range(4)]
+    for t in producers:
+        t.start()
+    for t in producers:
+        t.join()
+
+    consumers = [Thread(target=consumer, args=(t,)) for t in range(4)]
+    for t in consumers:
+        t.start()
+    for t in consumers:
+        t.join()
+
+    assert sorted(x for r in results for x in r) == list(range(4000))
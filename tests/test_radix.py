@@ -0,0 +1,160 @@
+import pytest
+
+from array import array
+
+from jheaps import (
+    create_radix_heap,
+    create_addressable_radix_heap,
+)
+
+
+def test_radix_heap_full_range():
+
+    h = create_radix_heap(key_type=int)
+
+    h.insert(0)
+    h.insert(2**40)
+    h.insert(2**63 - 1)
+
+    assert h.delete_min() == 0
+    assert h.delete_min() == 2**40
+    assert h.delete_min() == 2**63 - 1
+    assert h.is_empty()
+
+
+def test_radix_heap_negative_keys():
+
+    h = create_radix_heap(key_type=int, min=-(2**63))
+
+    h.insert_many([-(2**63), -50, -10, -20])
+    assert len(h) == 4
+    assert h.find_min() == -(2**63)
+    assert h.delete_min() == -(2**63)
+    assert list(h.delete_min_many(2)) == [-50, -20]
+
+    h.insert(-8)
+    h.insert(-10)
+    assert h.delete_min() == -10
+
+    # the default max value is the largest key within 2^63 - 1 of the min value
+    with pytest.raises(ValueError):
+        h.insert(0)
+
+    h.clear()
+    assert h.is_empty()
+
+
+def test_addressable_radix_heap_negative_keys():
+
+    h = create_addressable_radix_heap(key_type=int, value_type=int, min=-100, max=100)
+
+    h1 = h.insert(50, 1)
+    h2 = h.insert(-20, 2)
+    h.insert(30, 3)
+
+    assert h1.key == 50
+    h1.decrease_key(-50)
+    assert h1.key == -50
+
+    m = h.find_min()
+    assert m.key == -50
+    assert m.value == 1
+
+    h2.delete()
+    assert len(h) == 2
+    assert h.delete_min().key == -50
+    assert h.delete_min().key == 30
+
+
+def test_radix_heap_invalid_range():
+
+    with pytest.raises(ValueError):
+        create_radix_heap(key_type=int, min=-1, max=2**63 - 1)
+
+    with pytest.raises(ValueError):
+        create_radix_heap(key_type=int, min=0, max=2**63)
+
+    with pytest.raises(ValueError):
+        create_radix_heap(key_type=int, min=10, max=5)
+
+    with pytest.raises(TypeError):
+        create_radix_heap(key_type=int, min=0.5)
+
+
+def test_radix_heap_infer_min():
+
+    h = create_radix_heap(key_type=int, infer_min=True)
+
+    assert h.is_empty()
+    assert len(h) == 0
+    with pytest.raises(KeyError):
+        h.find_min()
+
+    h.insert_many(array("q", [2**62, -(2**40), 7]))
+    assert len(h) == 3
+    assert h.delete_min() == -(2**40)
+    assert h.delete_min() == 7
+    assert h.delete_min() == 2**62
+
+    with pytest.raises(ValueError):
+        create_radix_heap(key_type=int, min=0, infer_min=True)
+
+
+def test_radix_heap_infer_min_float():
+
+    h = create_radix_heap(key_type=float, infer_min=True)
+
+    h.insert(1e300)
+    h.insert(1e301)
+
+    assert h.delete_min() == 1e300
+    assert h.delete_min() == 1e301
+
+
+def test_addressable_radix_heap_infer_min():
+
+    h = create_addressable_radix_heap(key_type=int, value_type=int, infer_min=True)
+
+    h.insert(-10, 1)
+    h.insert(5, 2)
+
+    m = h.delete_min()
+    assert m.key == -10
+    assert m.value == 1
+    assert h.find_min().key == 5
+
+
+def test_addressable_radix_heap_bulk_negative_keys():
+
+    h = create_addressable_radix_heap(key_type=int, value_type=int, min=-100, max=100)
+    assert h.handle is not None
+
+    handles = h.insert_many(array("q", [-50, 20, 60]), [1, 2, 3])
+    assert h.get_keys(handles) == array("q", [-50, 20, 60])
+    assert h.get_values(handles) == array("q", [1, 2, 3])
+
+    h.decrease_key_many(handles[1:], [-60, 10])
+    assert h.get_keys(handles) == array("q", [-50, -60, 10])
+    assert h.find_min().key == -60
+
+    h.delete_many(handles[:1])
+    assert len(h) == 2
+
+    with pytest.raises(ValueError):
+        h.insert_many([-(2**63)])
+
+
+def test_radix_heap_infer_min_addressable_bulk():
+
+    h = create_addressable_radix_heap(key_type=int, value_type=int, infer_min=True)
+    assert len(h.insert_many([])) == 0
+    assert h.is_empty()
+
+    handles = h.insert_many([5, -3, 8], [1, 2, 3])
+    assert h.get_keys(handles) == array("q", [5, -3, 8])
+    assert h.delete_min().value == 2
+
+    h = create_radix_heap(key_type=float, infer_min=True)
+    assert len(h.delete_min_many(3)) == 0
+    h.insert_many(array("d", [2.5, 1.5]))
+    assert list(h.delete_min_many(3)) == [1.5, 2.5]
@@ -0,0 +1,108 @@
+import pytest
+
+from array import array
+from random import Random
+
+import jheaps
+from jheaps import create_soft_heap
+
+
+def test_soft_heap():
+
+    h = create_soft_heap(error_rate=0.5)
+    assert h.is_empty()
+
+    handles = [h.insert(float(k), k) for k in range(100)]
+    assert len(h) == 100
+
+    # the original keys are reported, in approximate order
+    deleted = [h.delete_min() for _ in range(50)]
+    assert {d.value for d in deleted} <= set(range(100))
+    assert all(d.key == float(d.value) for d in deleted)
+    assert len(h) == 50
+
+    handles[-1].delete()
+    assert len(h) == 49
+
+    with pytest.raises(ValueError):
+        handles[-2].decrease_key(-1.0)
+
+    h.clear()
+    assert len(h) == 0
+
+
+def test_soft_heap_exact():
+
+    # with tiny error rates no keys are corrupted
+    h = create_soft_heap(key_type=int, error_rate=1e-9)
+    rng = Random(17)
+    keys = [rng.randrange(1000) for _ in range(200)]
+    for k in keys:
+        h.insert(k)
+    assert [h.delete_min().key for _ in range(200)] == sorted(keys)
+
+
+def test_soft_heap_meld():
+
+    h1 = create_soft_heap(error_rate=0.25)
+    h2 = create_soft_heap(error_rate=0.25)
+    h1.insert(1.0)
+    h2.insert(2.0)
+    h2.insert(3.0)
+
+    h1.meld(h2)
+    assert len(h1) == 3
+    assert len(h2) == 0
+
+
+def test_soft_heap_object_keys():
+
+    h = create_soft_heap(key_type=object, value_type=object, error_rate=1e-9)
+    for k in ["c", "a", "b"]:
+        h.insert(k, k.upper())
+    assert h.delete_min().value == "A"
+
+
+def test_approximate_kth_smallest():
+
+    rng = Random(7)
+    n = 10000
+    keys = list(range(n))
+    rng.shuffle(keys)
+
+    error_rate = 0.05
+    for k in [1, 100, 5000, n]:
+        x = jheaps.approximate_kth_smallest(keys, k, error_rate=error_rate, key_type=int)
+        # the rank of x is x + 1
+        assert k <= x + 1 <= k + error_rate * n
+
+    x = jheaps.approximate_kth_smallest(
+        array("d", [float(k) for k in keys]), 5000, error_rate=error_rate
+    )
+    assert 5000 <= x + 1 <= 5000 + error_rate * n
+
+    with pytest.raises(IndexError):
+        jheaps.approximate_kth_smallest(keys, n + 1, key_type=int)
+
+    with pytest.raises(ValueError):
+        jheaps.approximate_kth_smallest([], 1)
+
+    with pytest.raises(ValueError):
+        jheaps.approximate_kth_smallest(keys, 1, key_type=object)
+
+
+def test_approximate_percentile():
+
+    rng = Random(11)
+    n = 10000
+    keys = [float(k) for k in range(n)]
+    rng.shuffle(keys)
+
+    error_rate = 0.01
+    p99 = jheaps.approximate_percentile(iter(keys), 99, error_rate=error_rate)
+    assert 0.99 * n <= p99 + 1 <= 0.99 * n + error_rate * n
+
+    assert jheaps.approximate_percentile(keys, 100, error_rate=error_rate) == n - 1
+
+    with pytest.raises(ValueError):
+        jheaps.approximate_percentile(keys, 101)
@@ -0,0 +1,140 @@
+import pytest
+
+import heapq
+from array import array
+from random import Random
+
+from jheaps import TopK, nsmallest, nlargest, argsmallest
+
+
+def test_topk_largest():
+
+    t = TopK(3)
+
+    assert t.push(5.0)
+    assert t.push(1.0)
+    assert t.push(7.0)
+    assert not t.push(0.5)
+    assert t.push(6.0)
+    assert len(t) == 3
+
+    keys, values = t.result()
+    assert list(keys) == [7.0, 6.0, 5.0]
+    assert list(values) == [2, 4, 0]
+
+    # the result does not remove the keys
+    assert len(t) == 3
+    assert list(t.result()[0]) == [7.0, 6.0, 5.0]
+
+
+def test_topk_smallest():
+
+    t = TopK(2, key_type=int, largest=False)
+
+    t.push(5, 50)
+    t.push(-(2**63), 10)
+    t.push(3, 30)
+    t.push(2**63 - 1, 20)
+
+    keys, values = t.result()
+    assert list(keys) == [-(2**63), 3]
+    assert list(values) == [10, 30]
+
+
+def test_topk_push_many():
+
+    rng = Random(17)
+    keys = [rng.random() for _ in range(10000)]
+
+    t = TopK(10)
+    t.push_many(array("d", keys[:5000]))
+    t.push_many(iter(keys[5000:]))
+
+    result, positions = t.result()
+    assert list(result) == heapq.nlargest(10, keys)
+    assert [keys[i] for i in positions] == list(result)
+
+    t = TopK(10, key_type=int, largest=False)
+    kept = t.push_many([rng.randint(0, 1000) for _ in range(100)], values=range(100))
+    assert kept >= 10
+    assert len(t) == 10
+
+    with pytest.raises(ValueError):
+        t.push_many([1, 2, 3], values=[1, 2])
+
+
+def test_topk_clear():
+
+    t = TopK(0)
+    assert not t.push(1.0)
+    assert len(t) == 0
+
+    t = TopK(2)
+    t.push_many(array("d", [1.0, 2.0, 3.0]))
+    t.clear()
+    assert len(t) == 0
+
+    t.push(4.0)
+    keys, values = t.result()
+    assert list(keys) == [4.0]
+    assert list(values) == [0]
+
+    with pytest.raises(ValueError):
+        TopK(-1)
+
+    with pytest.raises(ValueError):
+        TopK(2, key_type=object)
+
+
+def test_nsmallest_nlargest():
+
+    rng = Random(17)
+    keys = [rng.random() for _ in range(1000)]
+
+    assert list(nsmallest(10, array("d", keys))) == heapq.nsmallest(10, keys)
+    assert list(nlargest(10, keys)) == heapq.nlargest(10, keys)
+    assert list(nsmallest(2000, keys)) == sorted(keys)
+    assert len(nlargest(0, keys)) == 0
+
+    ints = [rng.randint(-100, 100) for _ in range(1000)]
+    result = nsmallest(5, ints)
+    assert result.typecode == "q"
+    assert list(result) == heapq.nsmallest(5, ints)
+    assert list(nlargest(5, array("q", ints))) == heapq.nlargest(5, ints)
+
+
+def test_argsmallest():
+
+    keys = array("d", [3.0, 1.0, 4.0, 1.5, 5.0, 9.0, 2.0])
+
+    assert list(argsmallest(3, keys)) == [1, 3, 6]
+    assert list(argsmallest(10, [7, 3, 5])) == [1, 2, 0]
+
+
+def test_topk_ties():
+
+    # equal keys are ranked by position, as in a stable sort
+    assert list(argsmallest(2, [1, 1, 1, 0])) == [3, 0]
+    assert list(argsmallest(3, array("d", [2.0, 1.0, 2.0, 1.0, 2.0]))) == [1, 3, 0]
+
+    rng = Random(17)
+    keys = [rng.randint(0, 5) for _ in range(1000)]
+    expected = sorted(range(len(keys)), key=lambda i: keys[i])[:50]
+    assert list(argsmallest(50, keys)) == expected
+
+    t = TopK(3, key_type=int)
+    t.push_many([5, 7, 5, 7, 5, 7, 7])
+    keys, values = t.result()
+    assert list(keys) == [7, 7, 7]
+    assert list(values) == [1, 3, 5]
+
+    # explicit values rank equal keys, the smaller value first
+    t = TopK(2)
+    t.push(1.0, 30)
+    t.push(1.0, 10)
+    assert t.push(1.0, 20)
+    assert not t.push(1.0, 40)
+    assert list(t.result()[1]) == [10, 20]
+
+    with pytest.raises(ValueError):
+        t.push(float("nan"))
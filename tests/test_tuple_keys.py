@@ -0,0 +1,166 @@
+import pytest
+
+from random import Random
+
+from jheaps import (
+    create_implicit_binary_heap,
+    create_implicit_dary_heap,
+    create_doublended_implicit_binary_heap,
+    create_addressable_binary_heap,
+    create_addressable_pairing_heap,
+    create_doubleended_addressable_pairing_heap,
+)
+
+
+def test_double_long_tuple_heap():
+
+    rng = Random(17)
+    keys = [(float(rng.randint(0, 10)), i) for i in range(100)]
+    rng.shuffle(keys)
+
+    h = create_implicit_binary_heap(key_type=(float, int))
+    for k in keys:
+        h.insert(k)
+
+    assert len(h) == 100
+    assert h.find_min() == min(keys)
+
+    result = [h.delete_min() for _ in range(50)]
+    assert result == sorted(keys)[:50]
+
+    h.clear()
+    assert h.is_empty()
+
+
+def test_long_long_tuple_heap():
+
+    h = create_implicit_dary_heap(key_type=(int, int), d=3)
+
+    h.insert((5, 2))
+    h.insert((5, 1))
+    h.insert((-3, 7))
+    h.insert((5, -1))
+
+    assert h.delete_min() == (-3, 7)
+    assert h.delete_min() == (5, -1)
+    assert h.delete_min() == (5, 1)
+    assert h.delete_min() == (5, 2)
+    assert h.is_empty()
+
+
+def test_double_ended_tuple_heap():
+
+    h = create_doublended_implicit_binary_heap(key_type=(float, int))
+
+    for k in [(1.5, 2), (1.5, 1), (0.5, 3), (2.5, 0)]:
+        h.insert(k)
+
+    assert h.find_max() == (2.5, 0)
+    assert h.delete_max() == (2.5, 0)
+    assert h.delete_max() == (1.5, 2)
+    assert h.delete_min() == (0.5, 3)
+    assert h.delete_min() == (1.5, 1)
+
+
+def test_tuple_heap_errors():
+
+    h = create_implicit_binary_heap(key_type=(float, int))
+
+    with pytest.raises(ValueError):
+        h.insert((float("nan"), 1))
+
+    with pytest.raises(ValueError):
+        h.insert((1.0, 2, 3))
+
+    with pytest.raises(TypeError):
+        h.insert((1.0, 2.5))
+
+    assert h.is_empty()
+
+    with pytest.raises(ValueError):
+        create_addressable_binary_heap(key_type=(int, int), value_type=object)
+
+
+def test_addressable_tuple_heap():
+
+    h = create_addressable_binary_heap(key_type=(float, int))
+
+    h1 = h.insert((5.0, 1), 10)
+    h2 = h.insert((5.0, 0), 20)
+    h3 = h.insert((7.0, 0))
+
+    assert h.find_min().value == 20
+    assert h1.key == (5.0, 1)
+
+    h3.decrease_key((5.0, -1))
+    assert h3.key == (5.0, -1)
+    assert h.find_min().key == (5.0, -1)
+
+    with pytest.raises(ValueError):
+        h3.decrease_key((6.0, 0))
+
+    h2.delete()
+    assert h2.key == (5.0, 0)
+    assert len(h) == 2
+
+    min1 = h.delete_min()
+    assert min1.key == (5.0, -1)
+    assert min1.value == 0
+    assert h.delete_min().value == 10
+    assert h.is_empty()
+
+
+def test_addressable_tuple_heap_delete_many():
+
+    h = create_addressable_pairing_heap(key_type=(int, int))
+    handles = [h.insert((i, -i), i) for i in range(10)]
+
+    h.delete_many(handles[2:8])
+    assert len(h) == 4
+    # the deleted elements keep their keys
+    assert [x.key for x in handles[2:8]] == [(i, -i) for i in range(2, 8)]
+    assert h.delete_min().value == 0
+
+    with pytest.raises(TypeError):
+        h.delete_many([int(handles[1].handle)])
+
+    other = create_addressable_pairing_heap(key_type=(int, int))
+    with pytest.raises(ValueError):
+        other.delete_many([handles[1]])
+    assert len(h) == 3
+
+    with pytest.raises(ValueError):
+        other.delete_many(
+            create_addressable_pairing_heap(key_type=int).insert_many([1, 2])
+        )
+
+
+def test_double_ended_addressable_tuple_heap():
+
+    h = create_doubleended_addressable_pairing_heap(key_type=(int, int))
+
+    h1 = h.insert((1, 1), 1)
+    h.insert((2, 2), 2)
+    h.insert((3, 3), 3)
+
+    h1.increase_key((4, 0))
+    assert h.find_max().value == 1
+    assert h.delete_max().key == (4, 0)
+    assert h.delete_min().key == (2, 2)
+
+    h.clear()
+    assert h.is_empty()
+
+
+def test_mergeable_tuple_heap():
+
+    h1 = create_addressable_pairing_heap(key_type=(int, int))
+    h2 = create_addressable_pairing_heap(key_type=(int, int))
+
+    h1.insert((1, 2), 1)
+    h2.insert((1, 1), 2)
+    h1.meld(h2)
+
+    assert len(h1) == 2
+    assert h1.delete_min().value == 2
+    assert h1.delete_min().value == 1